@@ -11,15 +11,31 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceEntry
 
-from .core.gateway import Gateway
-from .core.utils import AqaraGatewayDebug
-from .core.const import DOMAINS, DOMAIN, CONF_DEBUG
+from .core.entry_data import DeviceRecord
+from .core.gateway import Gateway, inventory_store
+from .core.utils import AqaraGatewayDebug, Utils
+from .core.const import (
+    DOMAINS,
+    DOMAIN,
+    CONF_COALESCE_WINDOW,
+    CONF_DEBUG,
+    CONF_MQTT_TOPICS,
+    CONF_MQTT_TRANSPORT,
+    CONF_STATS_INTERVAL,
+    MQTT_TRANSPORTS
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = vol.Schema({
     DOMAIN: vol.Schema({
         vol.Optional(CONF_DEBUG): cv.string,
+        vol.Optional(CONF_MQTT_TOPICS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_MQTT_TRANSPORT): vol.In(MQTT_TRANSPORTS),
+        vol.Optional(CONF_COALESCE_WINDOW): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=1000)),
+        vol.Optional(CONF_STATS_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=10)),
     }, extra=vol.ALLOW_EXTRA),
 }, extra=vol.ALLOW_EXTRA)
 
@@ -61,6 +77,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     config = hass.data[DOMAIN]['config']
 
+    await hass.async_add_executor_job(Utils.load_catalog)
+
     hass.data[DOMAIN][entry.entry_id] = \
         gateway = Gateway(hass, entry, config=config)
 
@@ -107,7 +125,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     #         registry.async_remove(entity_id)
 
     gateway = hass.data[DOMAIN][entry.entry_id]
-    gateway.stop()
+    await gateway.async_stop()
     await gateway.async_disconnect()
 
     return all([
@@ -116,6 +134,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     ])
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """ Remove the stored device inventory of the entry """
+    await inventory_store(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
@@ -197,7 +220,16 @@ class GatewayGenericDevice(Entity):
     # pylint: disable=too-many-instance-attributes
     """ Gateway Generic Device """
 
-    def __init__(self, gateway: Gateway, device: dict, attr: str):
+    # attrs read by update() besides its own attr, None for every payload
+    _update_attrs: tuple | None = None
+    # update() treats reports as events (clicks, motion), never coalesced
+    _event_entity = False
+    # state writes requested by update() are held back and done once
+    _in_update = False
+    _write_requested = False
+    _snapshot = None
+
+    def __init__(self, gateway: Gateway, device: DeviceRecord, attr: str):
         self.gateway = gateway
         self.device = device
 
@@ -209,7 +241,7 @@ class GatewayGenericDevice(Entity):
         self._name = (self.device['device_name'] + ' ' +
                         self._attr.replace('_', ' ').title())
 
-        params = device['params'] or device['mi_spec']
+        params = device.params or device.mi_spec
         domain = next((p[3] for p in params if p[2] == attr), DOMAIN)
         self.entity_id = f"{domain}.{self._unique_id}"
         self.entity_id = self.entity_id.replace(' ', '_').replace(':', '').lower()
@@ -221,12 +253,54 @@ class GatewayGenericDevice(Entity):
     async def async_added_to_hass(self):
         """ added to hass """
         if 'init' in self.device:
-            self.update(self.device['init'])
-        self.gateway.add_update(self.device['did'], self.update)
+            self._handle_update(self.device['init'])
+        attrs = (None if self._update_attrs is None
+                 else {self._attr, *self._update_attrs})
+        self.gateway.add_update(self.device.did, self._handle_update, attrs,
+                                self._event_entity)
 
     async def async_will_remove_from_hass(self) -> None:
         """Also run when rename entity_id"""
-        self.gateway.remove_update(self.device['did'], self.update)
+        self.gateway.remove_update(self.device.did, self._handle_update)
+
+    def _handle_update(self, data: dict):
+        """ run update() and write the state once if anything changed """
+        self._in_update = True
+        self._write_requested = False
+        try:
+            self.update(data)
+        finally:
+            self._in_update = False
+        if not self._write_requested:
+            return
+        snapshot = self._state_snapshot()
+        if snapshot == self._snapshot and not self.force_update:
+            self.gateway.counters['suppressed_writes'] += 1
+            return
+        self._snapshot = snapshot
+        super().async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple:
+        """ what a state write would store """
+        attrs = self.extra_state_attributes
+        return (self.available, self.state, self.state_attributes,
+                dict(attrs) if attrs else attrs)
+
+    def async_write_ha_state(self) -> None:
+        """ write the state, deferred to the end of update() """
+        if self._in_update:
+            self._write_requested = True
+            return
+        self._snapshot = None
+        super().async_write_ha_state()
+
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """ schedule a state write, deferred to the end of update() """
+        if self._in_update and not force_refresh:
+            self._write_requested = True
+            return
+        self._snapshot = None
+        super().schedule_update_ha_state(force_refresh)
 
     @property
     def should_poll(self) -> bool:
@@ -246,7 +320,7 @@ class GatewayGenericDevice(Entity):
     @property
     def available(self) -> bool:
         """ return available """
-        return self.device.get('online', True)
+        return self.device.online
 
     @property
     def device_info(self):
@@ -47,6 +47,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('air_quality', setup)
 
 
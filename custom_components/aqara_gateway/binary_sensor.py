@@ -69,6 +69,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             async_add_entities([GatewayCommonBinarySensor(gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('binary_sensor', setup)
 
 
@@ -172,7 +173,7 @@ class GatewayBinarySensor(GatewayGenericDevice, BinarySensorEntity):
                     if isinstance(value, (int, float))
                     else None
                 )
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewayRestoredBinarySensor(GatewayBinarySensor, RestoreEntity):
@@ -203,7 +204,7 @@ class GatewayCommonBinarySensor(GatewayRestoredBinarySensor):
             else:
                 self._attr_is_on = not value
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewayNatgasSensor(GatewayRestoredBinarySensor):
@@ -237,12 +238,14 @@ class GatewayNatgasSensor(GatewayRestoredBinarySensor):
         if GAS_DENSITY in data:
             self._density = int(data[GAS_DENSITY])
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewayMotionSensor(GatewayBinarySensor):
     """Representation of a Xiaomi/Aqara Motion Sensor."""
 
+    _event_entity = True
+
     def __init__(self, gateway: Gateway, device: dict, attr: str):
         """Initialize the Xiaomi/Aqara Motion Sensor."""
         super().__init__(gateway, device, attr)
@@ -287,10 +290,10 @@ class GatewayMotionSensor(GatewayBinarySensor):
         self._timeout_pos = 0
         self._unsub_set_no_motion = None
         self._attr_is_on = False
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
         # repeat event from Aqara integration
-        self.hass.bus.fire('xiaomi_aqara.motion', {
+        self.hass.bus.async_fire('xiaomi_aqara.motion', {
             'entity_id': self.entity_id
         })
 
@@ -312,13 +315,13 @@ class GatewayMotionSensor(GatewayBinarySensor):
         # check only motion=1
         if data.get(self._attr) != 1:
             # handle available change
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
             return
 
         # fix 1.4.7_0115 heartbeat error (has motion in heartbeat)
         if 'battery' in data:
             # handle available change
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
             return
 
         # check only motion=1
@@ -334,7 +337,7 @@ class GatewayMotionSensor(GatewayBinarySensor):
         self._last_on = time_now
 
         # handle available change
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
         if self._unsub_set_no_motion:
             self._unsub_set_no_motion()
@@ -354,10 +357,10 @@ class GatewayMotionSensor(GatewayBinarySensor):
             if delay < 0 and time_now + delay < self._last_off:
                 delay *= 2
 
-            self.hass.add_job(self._start_no_motion_timer, delay)
+            self.hass.async_create_task(self._start_no_motion_timer(delay))
 
         # repeat event from Aqara integration
-        self.hass.bus.fire('xiaomi_aqara.motion', {
+        self.hass.bus.async_fire('xiaomi_aqara.motion', {
             'entity_id': self.entity_id
         })
 
@@ -406,7 +409,7 @@ class GatewayDoorSensor(GatewayRestoredBinarySensor):
         if NO_CLOSE in data:  # handle push from the hub
             self._open_since = data[NO_CLOSE]
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewayWaterLeakSensor(GatewayRestoredBinarySensor):
@@ -435,7 +438,7 @@ class GatewayWaterLeakSensor(GatewayRestoredBinarySensor):
             else:
                 self._attr_is_on = not value
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewaySmokeSensor(GatewayRestoredBinarySensor):
@@ -470,12 +473,14 @@ class GatewaySmokeSensor(GatewayRestoredBinarySensor):
         if SMOKE_DENSITY in data:
             self._density = int(data[SMOKE_DENSITY])
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewayButtonSwitch(GatewayBinarySensor):
     """Xiaomi/Aqara Button Switch"""
 
+    _event_entity = True
+
     def __init__(self, gateway: Gateway, device: dict, attr: str):
         """Initialize the Xiaomi/Aqara Button Switch."""
         super().__init__(gateway, device, attr)
@@ -539,7 +544,7 @@ class GatewayButtonSwitch(GatewayBinarySensor):
             # reset the state to empty after 0.1 second
             self.hass.loop.call_later(.1, self.reset_state)
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     def reset_state(self):
         self._state = ''
@@ -549,6 +554,8 @@ class GatewayButtonSwitch(GatewayBinarySensor):
 class GatewayAction(GatewayBinarySensor):
     """ Xiaomi/Aqara Action Cube """
 
+    _event_entity = True
+
     def __init__(self, gateway: Gateway, device: dict, attr: str):
         """Initialize the Xiaomi/Aqara Action Cube."""
         super().__init__(gateway, device, attr)
@@ -631,7 +638,7 @@ class GatewayAction(GatewayBinarySensor):
             # reset the state to empty after 0.1 second
             self.hass.loop.call_later(.1, self.reset_state)
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     def reset_state(self):
         self._state = ''
@@ -17,13 +17,13 @@ from . import DOMAIN, GatewayGenericDevice
 from .core.gateway import Gateway
 from .core.const import (
     HVAC_MODES,
-    AC_STATE_FAN,
-    AC_STATE_FAN2,
-    AC_STATE_HVAC,
     FAN_MODES,
-    YUBA_STATE_HVAC,
-    YUBA_STATE_FAN
 )
+from .core.utils import Utils
+
+AC_HVAC = Utils.get_option_map(None, 'ac_state.hvac')
+AC_FAN = Utils.get_option_map(None, 'ac_state.fan')
+AC_FAN2 = Utils.get_option_map(None, 'ac_state.fan2')
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +42,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             ])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('climate', setup)
 
 
@@ -152,26 +153,17 @@ class AqaraGenericClimate(GatewayGenericDevice, ClimateEntity):
 
                 # only first time when retain from gateway
                 if isinstance(data[self._attr], str):
-                    self._hvac_mode = next(
-                        k for k, v in AC_STATE_HVAC.items()
-                        if v == self._state[0]
-                    )
+                    self._hvac_mode = AC_HVAC.labels[self._state[0]]
                     if 'aqara.airrtc' in self._model:
-                        self._fan_mode = next(
-                            k for k, v in AC_STATE_FAN2.items()
-                            if v == self._state[1]
-                        )
+                        self._fan_mode = AC_FAN2.labels[self._state[1]]
                     else:
-                        self._fan_mode = next(
-                            k for k, v in AC_STATE_FAN.items()
-                            if v == self._state[1]
-                        )
+                        self._fan_mode = AC_FAN.labels[self._state[1]]
                     self._target_temp = self._state[2]
 
         except Exception:
             _LOGGER.exception("Can't read climate data: %s", data)
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     def set_temperature(self, **kwargs) -> None:
         """ set temperature """
@@ -186,7 +178,7 @@ class AqaraGenericClimate(GatewayGenericDevice, ClimateEntity):
         """ set fan mode """
         if not self._state:
             return
-        self._state[1] = AC_STATE_FAN[fan_mode]
+        self._state[1] = AC_FAN.values[fan_mode]
         state = int.from_bytes(self._state, 'big')
         self.gateway.send(self.device, {self._attr: state})
 
@@ -194,7 +186,7 @@ class AqaraGenericClimate(GatewayGenericDevice, ClimateEntity):
         """ set hvac mode """
         if not self._state:
             return
-        self._state[0] = AC_STATE_HVAC[hvac_mode]
+        self._state[0] = AC_HVAC.values[hvac_mode]
         state = int.from_bytes(self._state, 'big')
         self.gateway.send(self.device, {self._attr: state})
 
@@ -203,15 +195,21 @@ class AqaraClimateYuba(AqaraGenericClimate, ClimateEntity):
     # pylint: disable=too-many-instance-attributes
     """Initialize the AqaraClimateYuba."""
 
+    def __init__(self, gateway, device, attr):
+        """Initialize the AqaraClimateYuba."""
+        super().__init__(gateway, device, attr)
+        self._hvac_map = Utils.get_option_map(self._model, 'yuba.hvac')
+        self._fan_map = Utils.get_option_map(self._model, 'yuba.fan')
+
     @property
     def fan_modes(self):
         """ return fan modes """
-        return list(YUBA_STATE_FAN.keys())
+        return list(self._fan_map.values)
 
     @property
     def hvac_modes(self):
         """ return hvac modes """
-        return list(YUBA_STATE_HVAC.keys()) + [HVACMode.OFF]
+        return list(self._hvac_map.values) + [HVACMode.OFF]
 
     @property
     def supported_features(self):
@@ -254,7 +252,7 @@ class AqaraClimateYuba(AqaraGenericClimate, ClimateEntity):
         """ set fan mode """
         if not self._state:
             return
-        self.gateway.send(self.device, {'fan_mode': YUBA_STATE_FAN[fan_mode]})
+        self.gateway.send(self.device, {'fan_mode': self._fan_map.values[fan_mode]})
         self._fan_mode = fan_mode
 
     def set_hvac_mode(self, hvac_mode: str) -> None:
@@ -266,7 +264,7 @@ class AqaraClimateYuba(AqaraGenericClimate, ClimateEntity):
         if self._is_on == 0:
             self.gateway.send(self.device, {'power': 1})
             self._is_on = 1
-        self.gateway.send(self.device, {'mode': YUBA_STATE_HVAC[hvac_mode]})
+        self.gateway.send(self.device, {'mode': self._hvac_map.values[hvac_mode]})
 
     def set_swing_mode(self, swing_mode: str) -> None:
         """Set new target swing operation."""
@@ -286,11 +284,9 @@ class AqaraClimateYuba(AqaraGenericClimate, ClimateEntity):
                 if self._is_on == 0:
                     self._hvac_mode = HVACMode.OFF
             if 'mode' in data:
-                self._hvac_mode = list(YUBA_STATE_HVAC.keys())[
-                    list(YUBA_STATE_HVAC.values()).index(data['mode'])]
+                self._hvac_mode = self._hvac_map.labels[data['mode']]
             if 'fan_mode' in data:
-                self._fan_mode = list(YUBA_STATE_FAN.keys())[
-                    list(YUBA_STATE_FAN.values()).index(data['fan_mode'])]
+                self._fan_mode = self._fan_map.labels[data['fan_mode']]
             if 'current_temperature' in data:
                 self._current_temp = data['current_temperature'] / 100
             if 'target_temperature' in data:
@@ -302,7 +298,7 @@ class AqaraClimateYuba(AqaraGenericClimate, ClimateEntity):
         except Exception:
             _LOGGER.exception(f"Can't read climate data: {data}")
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class AqaraTowelWarmer(GatewayGenericDevice, ClimateEntity, RestoreEntity):
@@ -356,4 +352,4 @@ class AqaraTowelWarmer(GatewayGenericDevice, ClimateEntity, RestoreEntity):
             else:
                 self._attr_hvac_mode = HVACMode.OFF
                 self._attr_hvac_action = HVACAction.IDLE
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
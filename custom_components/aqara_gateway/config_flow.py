@@ -60,10 +60,12 @@ class AqaraGatewayFlowHandler(ConfigFlow, domain=DOMAIN):
                 Utils.enable_telnet(self._host, self._token)
             if not self._check_port(23):
                 return self.async_abort(reason="connection_error")
-            ret = gateway.is_aqaragateway(self._host,
-                                            self._password,
-                                            self._model,
-                                            self._patched_fw)
+            # is_aqaragateway looks the model up in the device catalog
+            await self.hass.async_add_executor_job(Utils.load_catalog)
+            ret = await gateway.is_aqaragateway(self._host,
+                                                self._password,
+                                                self._model,
+                                                self._patched_fw)
             if "error" in ret['status']:
                 return self.async_abort(reason="connection_error")
             self._name = ret.get('name', '')
@@ -37,6 +37,12 @@ CONF_DEBUG = "debug"
 CONF_MODEL = "model"
 CONF_NOFFLINE = "noffline"
 CONF_PATCHED_FW = "patched_firmware"
+CONF_MQTT_TOPICS = "mqtt_topics"
+CONF_MQTT_TRANSPORT = "mqtt_transport"
+MQTT_TRANSPORTS = ["thread", "asyncio"]
+CONF_COALESCE_WINDOW = "coalesce_window"  # ms, 0 disables coalescing
+CONF_STATS_INTERVAL = "stats_interval"  # seconds between network info reads
+DEFAULT_STATS_INTERVAL = 300
 
 OPT_DEBUG = {
     'true': "Basic logs",
@@ -184,6 +190,22 @@ POWER_CONSUMED = "power_consumed"
 POWER = "power"
 VOLTAGE = "voltage"
 
+# device feature flags, see Utils.get_feature_suppported
+SUPPORT_POWER_CONSUMPTION = 1
+SUPPORT_IN_USE = 2
+SUPPORT_LOAD_VOLTAGE = 4
+SUPPORT_LOAD_POWER = 8
+
+# plugs which report whether a load is plugged in
+IN_USE_MODELS = [
+    'lumi.plug',
+    'lumi.plug.mitw01',
+    'lumi.plug.mmeu01',
+    'lumi.plug.maus01',
+    'lumi.ctrl_86plug',
+    'lumi.ctrl_86plug.aq1'
+]
+
 DOMAINS = [
     'air_quality',
     'alarm_control_panel',
@@ -287,6 +309,37 @@ YUBA_STATE_FAN = {
     FAN_HIGH: 2
 }
 
+# enumerated properties shared by select and climate entities
+# (zigbee model, attr): {option: value}, model None is for any model
+ENUM_OPTIONS = {
+    (None, 'ac_state.hvac'): AC_STATE_HVAC,
+    (None, 'ac_state.fan'): AC_STATE_FAN,
+    (None, 'ac_state.fan2'): AC_STATE_FAN2,
+    ('lumi.bhf_light.acn001', 'yuba.hvac'): YUBA_STATE_HVAC,
+    ('lumi.bhf_light.acn001', 'yuba.fan'): YUBA_STATE_FAN,
+    # the select keeps its own labels for the same property
+    ('lumi.bhf_light.acn001', 'fan_mode'): {"Low": 0, "Middle": 1, "High": 2},
+    ('lumi.bhf_light.acn001', 'swing_mode'): {"Enable": 0, "Disable": 1},
+    ('lumi.bhf_light.acn001', 'operating_mode'): {
+        "Warm": 0, "Dry": 3, "Fan": 4, "Exhaust": 5},
+    ('lumi.motion.ac01', 'monitoring_mode'): {
+        "Undirected": 0, "Left and right": 1},
+    ('lumi.motion.ac01', 'approaching_distance'): {
+        "Near": 0, "Middle": 1, "Far": 2},
+    ('lumi.motion.ac01', 'reverted_mode'): {"Disable": 0, "Enable": 1},
+    ('aqara.toilet.acn002', 'clean direction'): {
+        "Off": 0, "Auto": 1, "Manual": 1},
+    ('aqara.toilet.acn002', 'water temperature'): {
+        "Normal": 0, "31°C": 1, "33°C": 2, "35°C": 3, "37°C": 4, "39°C": 5},
+    ('aqara.toilet.acn002', 'wash level'): {
+        "Weak": 0, "Middle Weak": 1, "Middle": 2, "Middle Strong": 3,
+        "Strong": 4},
+    ('aqara.toilet.acn002', 'warn dry'): {
+        "Off": 0, "Normal": 1, "Low": 2, "Middle Low": 3, "Middle": 4,
+        "Middle High": 5, "High": 6},
+}
+DEFAULT_ENUM_OPTIONS = {"Off": 0, "On": 1}
+
 # Cover
 RUN_STATES = {0: CoverState.CLOSING, 1: CoverState.OPENING, 2: "stop", 3: "hinder_stop"}
 CHARGING_STATUS = {0: "Not Charging", 1: "Charging", 2: "Stop Charging", 3: "Charging Failure"}
@@ -1,4 +1,5 @@
 """Runtime entry data for Aqara stored in hass.data."""
+import sys
 from typing import Optional
 
 import attr
@@ -43,3 +44,76 @@ class RuntimeEntryData:
 def _attr_obj_from_dict(cls, **kwargs):
     return cls(
         **{key: kwargs[key] for key in attr.fields_dict(cls) if key in kwargs})
+
+
+class DeviceRecord:
+    """Device of a gateway, shared by all of its entities.
+
+    Known fields live in slots, catalog tables are shared with the
+    descriptor from Utils.get_device and anything else (telnet extras,
+    config overrides) goes to `extra`. The mapping methods keep the
+    `device['key']` style working for platforms and user config.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        'did', 'mac', 'model', 'type', 'coordinator', 'zb_ver', 'model_ver',
+        'status', 'online', 'init', 'device_manufacturer', 'device_name',
+        'device_model', 'params', 'mi_spec', 'prop_attrs', 'attr_props',
+        'attr_specs', 'hw_version', 'sw_version', 'serial_number', 'last_seen',
+        'extra'
+    )
+    _FIELDS = frozenset(__slots__) - {'extra'}
+
+    def __init__(self, device: dict, desc: Optional[dict] = None):
+        self.online = True
+        self.last_seen = None
+        self.extra = {}
+        self.update(device)
+        if desc:
+            self.update(desc)
+
+    def __getitem__(self, key: str):
+        if key in self._FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value):
+        if key in self._FIELDS:
+            if key == 'model':
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._FIELDS:
+            return hasattr(self, key)
+        return key in self.extra
+
+    def get(self, key: str, default=None):
+        """Return the value of a field or extra, like dict.get."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, data: dict):
+        """Merge a dict into the record, like dict.update."""
+        for key, value in data.items():
+            self[key] = value
+
+    def as_dict(self) -> dict:
+        """Return a plain dict copy of the record."""
+        data = {
+            key: getattr(self, key) for key in self.__slots__
+            if key != 'extra' and hasattr(self, key)
+        }
+        data.update(self.extra)
+        return data
+
+    def __repr__(self):
+        return f"DeviceRecord({self.as_dict()!r})"
@@ -6,6 +6,7 @@ import socket
 import time
 import json
 import re
+from collections import Counter, deque
 from typing import Optional
 from random import randint
 from paho.mqtt.client import Client, MQTTMessage
@@ -15,17 +16,32 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_HOST, MAJOR_VERSION, MINOR_VERSION
 from homeassistant.components.light import ATTR_HS_COLOR, ATTR_RGB_COLOR, ATTR_BRIGHTNESS
+from homeassistant.helpers.storage import Store
 
 from .shell import (
+    WGET,
+    ShellSession,
     TelnetShell,
     TelnetShellG2H,
     TelnetShellE1,
     TelnetShellG3,
     TelnetShellM2POE
 )
-from .utils import DEVICES, Utils, GLOBAL_PROP
+from .entry_data import DeviceRecord
+from .mqtt import AsyncioMqttLoop
+from .utils import Utils
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .const import (
+    CONF_COALESCE_WINDOW,
     CONF_MODEL,
+    CONF_MQTT_TOPICS,
+    CONF_MQTT_TRANSPORT,
+    CONF_STATS_INTERVAL,
+    DEFAULT_STATS_INTERVAL,
     DOMAIN,
     SIGMASTAR_MODELS,
     REALTEK_MODELS,
@@ -38,6 +54,11 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+HEARTBEAT_MARKERS = ('battery', 'voltage')
+PROPS_TTL = 60  # seconds a getprop snapshot stays valid
+STORAGE_VERSION = 1
+PLATFORM_TIMEOUT = 300  # seconds to wait for the platforms of new devices
+
 
 class Gateway:
     # pylint: disable=too-many-instance-attributes, unused-argument
@@ -60,6 +81,12 @@ class Gateway:
         self._mqttc.on_connect = self.on_connect
         self._mqttc.on_disconnect = self.on_disconnect
         self._mqttc.on_message = self.on_message
+        # socket callbacks on the event loop instead of paho's thread
+        self._mqtt_loop = (
+            AsyncioMqttLoop(hass.loop, self._mqttc)
+            if config and config.get(CONF_MQTT_TRANSPORT) == 'asyncio'
+            else None
+        )
 
         self._debug = self.options.get('debug', '')  # for fast access
         self.parent_scan_interval = (-1 if self.options.get('parent') is None
@@ -68,12 +95,58 @@ class Gateway:
 
         self.devices = {}
         self.updates = {}
+        self._routes = {}  # did -> {attr or None: [handler]}
+        self._event_handlers = set()  # handlers that get every report
         self.setups = {}
+        self._platforms_ready = {}  # domain -> asyncio.Event, set by add_setup
+        # (async_add_entities, update_before_add) -> entities of a setup pass
+        self._entity_batch = None
         self._extra_state_attributes = {}
         self._info_ts = None
         self._gateway_did = ''
+        self._global_prop = Utils.get_global_prop()  # for fast access
         self._model = self.options.get(CONF_MODEL, '')  # long model, will replace to short later
         self.cloud = 'aiot'  # for fast access
+        # mqtt topic -> handler of the decoded payload
+        self._topic_handlers = {
+            'zigbee/send': self._process_message,
+            'ioctl/send': self._process_message,
+            'ioctl/recv': self._process_message,
+            'debug/host': self._process_message,
+        }
+        # extra topics for diagnostics, only shown in the mqtt debug log
+        self._extra_topics = config.get(CONF_MQTT_TOPICS, []) if config else []
+        # messages handed over from the paho thread, drained in batches
+        self._queue = deque()
+        self._wakeup_ts = 0.0
+        self.counters = Counter()
+        # merge reports of a device arriving within the window, in seconds
+        self._coalesce_window = (
+            config.get(CONF_COALESCE_WINDOW, 0) / 1000 if config else 0)
+        self._pending = {}  # did -> (payload, timer)
+        self._last_values = {}  # did -> {attr: last reported value}
+        self.shell_session = ShellSession(self._async_new_shell, self.counters)
+        self._props = {}  # getprop snapshot
+        self._props_ts = 0.0
+        # networkBak.info, refreshed in the background while stats are used
+        self._stats_interval = (
+            config.get(CONF_STATS_INTERVAL, DEFAULT_STATS_INTERVAL)
+            if config else DEFAULT_STATS_INTERVAL)
+        self._network_stats = {}
+        self._stats_task: asyncio.Task | None = None
+        self._inventory = {}  # did -> zigbee device from device.info
+        self._inventory_stat = ''  # "size mtime" of the last read
+        # devices of the last discovery, set up on boot before telnet
+        self._store = inventory_store(hass, entry.entry_id)
+        self._restored = False  # the snapshot is only used on the first run
+        self._devices_info = []  # coordinator of the last discovery
+        self._start_ts = time.monotonic()
+        self._first_entity = False
+
+    @property
+    def mqtt_topics(self) -> list:
+        """ topics to subscribe on the gateway broker """
+        return list(dict.fromkeys([*self._topic_handlers, *self._extra_topics]))
 
     @property
     def device(self):
@@ -81,17 +154,52 @@ class Gateway:
         return self.devices[list(self.devices)[0]]
 #        return self.devices['lumi.0']
 
-    def add_update(self, did: str, handler):
-        """Add handler to device update event."""
+    def add_update(self, did: str, handler, attrs=None, event=False):
+        """Add handler to device update event.
+
+        The handler only gets payloads with one of attrs, or all of them
+        when attrs is None. Payloads for an event handler are never
+        coalesced, each report is an event of its own.
+        """
         self.updates.setdefault(did, []).append(handler)
+        if event:
+            self._event_handlers.add(handler)
+        routes = self._routes.setdefault(did, {})
+        for attr in (attrs if attrs is not None else (None,)):
+            routes.setdefault(attr, []).append(handler)
 
     def remove_update(self, did: str, handler):
         """remove update"""
         self.updates.setdefault(did, []).remove(handler)
+        self._event_handlers.discard(handler)
+        for handlers in self._routes.get(did, {}).values():
+            if handler in handlers:
+                handlers.remove(handler)
 
     def add_setup(self, domain: str, handler):
         """Add hass device setup funcion."""
         self.setups[domain] = handler
+        self._platform_ready(domain).set()
+
+    def batch_entities(self, async_add_entities):
+        """Wrap the async_add_entities of a platform.
+
+        Entities added while async_setup_devices creates them are
+        registered with one call per platform at the end of the pass.
+        """
+        def add_entities(entities, update_before_add: bool = False):
+            if self._entity_batch is None:
+                async_add_entities(entities, update_before_add)
+            else:
+                self._entity_batch.setdefault(
+                    (async_add_entities, update_before_add), []
+                ).extend(entities)
+        return add_entities
+
+    def _platform_ready(self, domain: str) -> asyncio.Event:
+        if domain not in self._platforms_ready:
+            self._platforms_ready[domain] = asyncio.Event()
+        return self._platforms_ready[domain]
 
     def debug(self, message: str):
         """ deubug function """
@@ -101,10 +209,20 @@ class Gateway:
     def stop(self):
         """ stop function """
         self.enabled = False
+        self._stop_stats()
+        for _, timer in self._pending.values():
+            timer.cancel()
+        self._pending.clear()
+        self.shell_session.close()
 
         if self.main_task:  # HA < 2023.3
             self.main_task.cancel()
 
+    async def async_stop(self):
+        """ stop and wait for the shell session to close """
+        self.stop()
+        await self.shell_session.async_close()
+
     async def async_connect(self):
         """Connect to the host. Does not process messages yet."""
         result: int | None = None
@@ -122,13 +240,17 @@ class Gateway:
                 f"Failed to connect to MQTT server: {self.host}"
             )
 
-        self._mqttc.loop_start()
+        self._loop_start()
         self.enabled = True
 
     async def async_disconnect(self):
         """Stop the MQTT client."""
         self.available = False
 
+        if self._mqtt_loop:
+            self._mqtt_loop.stop()
+            return
+
         def stop():
             """Stop the MQTT client."""
             # Do not disconnect, we want the broker to always publish will
@@ -152,8 +274,13 @@ class Gateway:
         if "mqtt" not in self.hass.data[DOMAIN]:
             self.hass.data[DOMAIN]["mqtt"] = []
 
+        if not self._restored:
+            # async_run is called again on every mqtt reconnect
+            self._restored = True
+            await self._async_restore_inventory()
+
         while not self.enabled and not self.available:
-            if not self._check_port(23):
+            if not await self._check_port(23):
                 if self.host in self.hass.data[DOMAIN]["telnet"]:
                     self.hass.data[DOMAIN]["telnet"].remove(self.host)
                 _LOGGER.error(f"Can not connecto the telnet of the gateway ({self.host})!")
@@ -161,11 +288,14 @@ class Gateway:
                 continue
 
             telnetshell = True
-            devices = self._prepare_gateway(get_devices=True)
+            devices = await self._prepare_gateway(get_devices=True)
             if isinstance(devices, list):
-                if len(devices) >= 1:
-                    self._gw_topic = "gw/{}/".format(devices[0]['mac'][2:].upper())
-                await self.async_setup_devices(devices)
+                await self._async_setup_inventory(devices)
+                if devices:
+                    self._devices_info = [
+                        device for device in devices
+                        if device['type'] == 'gateway']
+                    await self._async_save_inventory()
                 break
 
         if telnetshell:
@@ -173,16 +303,16 @@ class Gateway:
                 self.hass.data[DOMAIN]["telnet"].append(self.host)
 
         while not self.available:
-            self._mqttc.loop_stop()
+            self._loop_stop()
             if not self._mqtt_connect():
                 if self.host in self.hass.data[DOMAIN]["mqtt"]:
                     self.hass.data[DOMAIN]["mqtt"].remove(self.host)
-                if not self._prepare_gateway():
+                if not await self._prepare_gateway():
                     _LOGGER.error(f"Can not connecto the mqtt of the gateway ({self.host})!")
                     await asyncio.sleep(30)
                     continue
 
-            self._mqttc.loop_start()
+            self._loop_start()
             self.available = True
 #            self._mqttc.loop_forever()
 
@@ -190,6 +320,49 @@ class Gateway:
             if self.host not in self.hass.data[DOMAIN]["mqtt"]:
                 self.hass.data[DOMAIN]["mqtt"].append(self.host)
 
+    async def _async_restore_inventory(self):
+        """ set up the devices of the stored snapshot before telnet """
+        snapshot = await self._store.async_load()
+        if not snapshot or not snapshot.get('devices'):
+            return
+        # entities come up now, the telnet discovery adds the rest
+        self._model = snapshot.get('model') or self._model
+        self.cloud = snapshot.get('cloud') or self.cloud
+        self._inventory = {
+            device['did']: device for device in snapshot['devices']
+            if device['type'] == 'zigbee'}
+        self.debug("{} devices from the stored inventory".format(
+            len(snapshot['devices'])))
+        await self._async_setup_inventory(snapshot['devices'])
+
+    async def _async_setup_inventory(self, devices: list):
+        """ set up the devices that aren't set up yet """
+        if len(devices) >= 1:
+            self._gw_topic = "gw/{}/".format(devices[0]['mac'][2:].upper())
+        await self.async_setup_devices([
+            device for device in devices if device['did'] not in self.devices])
+
+    async def _async_save_inventory(self):
+        """ store the coordinator and zigbee devices for the next boot """
+        if not self._devices_info:
+            # not discovered over telnet yet
+            return
+        await self._store.async_save({
+            'model': self._model,
+            'cloud': self.cloud,
+            'devices': [*self._devices_info, *self._inventory.values()],
+        })
+
+    def _loop_start(self):
+        """ start paho's network thread, the asyncio loop needs none """
+        if self._mqtt_loop is None:
+            self._mqttc.loop_start()
+
+    def _loop_stop(self):
+        """ stop paho's network thread """
+        if self._mqtt_loop is None:
+            self._mqttc.loop_stop()
+
     def _mqtt_connect(self) -> bool:
         try:
             self._mqttc.reconnect()
@@ -197,13 +370,15 @@ class Gateway:
         except Exception:
             return False
 
-    def _check_port(self, port: int):
+    async def _check_port(self, port: int) -> bool:
         """Check if gateway port open."""
-        skt = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            return skt.connect_ex((self.host, port)) == 0
-        finally:
-            skt.close()
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, port), 5)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
 
     def _get_shell(self, device_name: str) -> TelnetShell:
         """ get shell according to the model
@@ -229,48 +404,64 @@ class Gateway:
                                     self.options.get(CONF_PASSWORD, ''))
         return shell
 
-    def _prepare_gateway(self, get_devices: bool = False):
+    async def _async_new_shell(self) -> TelnetShell:
+        """ shell for the gateway model, not connected yet """
+        device_name = Utils.get_device_name(self._model).lower()
+        if len(device_name) <= 1:
+            shell = TelnetShell(self.host,
+                                    self.options.get(CONF_PASSWORD, ''))
+            await shell.connect()
+            device_name = await shell.get_model()
+            shell.close()
+        return self._get_shell(device_name)
+
+    async def _prepare_gateway(self, get_devices: bool = False):
         """Launching the required utilities on the hub, if they are not already
         running.
         """
         try:
-            device_name = Utils.get_device_name(self._model).lower()
-            if len(device_name) <= 1:
-                shell = TelnetShell(self.host,
-                                        self.options.get(CONF_PASSWORD, ''))
-                device_name = shell.get_model()
-                shell.close()
-            shell = self._get_shell(device_name)
-
-            shell.login()
-
-            processes = shell.get_running_ps("mosquitto")
-            public_mosquitto = shell.check_public_mosquitto()
-
-            if not public_mosquitto and "/data/bin/mosquitto" not in processes:
-                self.debug("mosquitto is not running as public!")
-                shell.run_public_mosquitto(self._model)
-                processes = shell.get_running_ps("mosquitto")
-
-            if "mosquitto" not in processes:
-                if not public_mosquitto:
-                    if "/data/bin/mosquitto" not in processes:
-                        shell.run_public_mosquitto(self._model)
-
-            if get_devices:
-                devices = self._get_devices(shell)
-                shell.close()
-                return devices
-            return True
+            async with self.shell_session.acquire() as shell:
+                return await self._prepare_shell(shell, get_devices)
 
-        except (ConnectionRefusedError, socket.timeout):
+        except (OSError, asyncio.TimeoutError):
             return False
 
         except Exception as expt:
             self.debug("Can't read devices: {}".format(expt))
             return False
 
-    def _get_devices(self, shell):
+    async def _prepare_shell(self, shell: TelnetShell, get_devices: bool):
+        """ start public mosquitto and read devices with a logged-in shell """
+        start = time.monotonic()
+        processes, public_mosquitto = await shell.get_mosquitto_state()
+
+        if not public_mosquitto and "/data/bin/mosquitto" not in processes:
+            self.debug("mosquitto is not running as public!")
+            await shell.run_public_mosquitto(self._model)
+            processes = await shell.get_running_ps("mosquitto")
+
+        if "mosquitto" not in processes:
+            if not public_mosquitto:
+                if "/data/bin/mosquitto" not in processes:
+                    await shell.run_public_mosquitto(self._model)
+        self.debug("mosquitto checked in {} ms".format(
+            int((time.monotonic() - start) * 1000)))
+
+        if get_devices:
+            return await self._get_devices(shell)
+        return True
+
+    async def _async_get_props(self, shell) -> dict:
+        """ getprop snapshot, dumped again when older than PROPS_TTL """
+        now = time.monotonic()
+        if not self._props or now - self._props_ts > PROPS_TTL:
+            props = await shell.get_props()
+            if props:
+                self._props, self._props_ts = props, now
+            return props
+        return self._props
+
+    async def _get_devices(self, shell):
         """Load devices info for Coordinator, Zigbee and Mesh."""
         devices = []
 
@@ -279,56 +470,66 @@ class Gateway:
             value = {}
             version_g2h = ""
             build_num_g2h = ""
-            prop_raw = shell.get_prop("")
+            start = time.monotonic()
+            props = await self._async_get_props(shell)
+            props_ts = time.monotonic()
 
-            data = re.search(r"\[sys\.zb_coordinator\\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-            zb_coordinator = data.group(1) if data else shell.get_prop("sys.zb_coordinator")
-            data = re.search(r"\[persist\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-            model = data.group(1) if data else shell.get_prop("persist.sys.model")
+            zb_coordinator = await shell.lookup_prop(props, "sys.zb_coordinator")
+            model = await shell.lookup_prop(props, "persist.sys.model")
             if len(model) < 1:
-                data = re.search(r"\[ro\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                model = data.group(1) if data else shell.get_prop("ro.sys.model")
+                model = await shell.lookup_prop(props, "ro.sys.model")
+            zb_device = await shell.lookup_prop(props, "sys.zb_device")
+            if len(zb_device) >= 1:
+                device_info = "cat {}".format(zb_device)
+            else:
+                # the file_exist check is done by the gateway shell
+                device_info = "cat {}/zigbee/device.info 2>/dev/null || " \
+                    "cat /mnt/config/zigbee/device.info".format(
+                        Utils.get_info_store_path(model))
+            g2h = False
             if len(zb_coordinator) >= 1:
-                raw = shell.read_file(zb_coordinator, with_newline=False)
-                data = re.search(r"\[persist\.sys\.did\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                did = data.group(1) if data else shell.get_prop("persist.sys.did")
-                data = re.search(r"\[persist\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                model = data.group(1) if data else shell.get_prop("ro.sys.model")
+                coordinator = zb_coordinator
+                did = await shell.lookup_prop(props, "persist.sys.did")
+                model = await shell.lookup_prop(
+                    props, "persist.sys.model", "ro.sys.model")
             elif any(name in model for name in [
                     'lumi.gateway', 'lumi.aircondition',
                     'lumi.camera.gwpagl01', 'lumi.camera.agl001',
                     'lumi.camera.acn003', 'lumi.camera.acn008', 'lumi.camera.acn009',
                     'lumi.camera.acn010', 'lumi.camera.acn011', 'lumi.gateway.agl011']):
-                raw = shell.read_file(
-                    '/data/zigbee/coordinator.info', with_newline=False)
-                data = re.search(r"\[persist\.sys\.did\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                did = data.group(1) if data else shell.get_prop("persist.sys.did")
-                data = re.search(r"\[persist\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                model = data.group(1) if data else shell.get_prop("persist.sys.model")
+                coordinator = '/data/zigbee/coordinator.info'
+                did = await shell.lookup_prop(props, "persist.sys.did")
+                model = await shell.lookup_prop(props, "persist.sys.model")
             elif any(name in model for name in ['lumi.camera.gwagl02']):
-                raw = str(shell.read_file('/mnt/config/miio/device.conf'))
-                if len(raw) <= 1:
-                    raw = str(shell.read_file('/mnt/config/miio/device.conf'))
-                data = re.search(r"did=([0-9]+).+", raw)
+                coordinator = '/mnt/config/zigbee/coordinator.info'
+                g2h = True
+            else:
+                coordinator = '/data/zigbee/coordinator.info'
+                did = await shell.lookup_prop(props, "persist.sys.did")
+                model = await shell.lookup_prop(props, "ro.sys.model")
+
+            # 2. Read all info files in one round trip
+            commands = ["cat {}".format(coordinator), device_info]
+            if g2h:
+                commands += ["cat /mnt/config/miio/device.conf", "cat /etc/build.prop"]
+            coordinator_raw, device_raw, *g2h_raw = [
+                out.decode().strip("\r\n")
+                for _, out in await shell.run_commands(commands)]
+            if g2h:
+                conf_raw, build_raw = g2h_raw
+                if len(conf_raw) <= 1:
+                    conf_raw = str(await shell.read_file('/mnt/config/miio/device.conf'))
+                data = re.search(r"did=([0-9]+).+", conf_raw)
                 did = data.group(1) if data else ''
-                data = re.search(r"model=([a-zA-Z0-9.-]+).+", raw)
+                data = re.search(r"model=([a-zA-Z0-9.-]+).+", conf_raw)
                 model = data.group(1) if data else ''
-                raw = str(shell.read_file('/etc/build.prop'))
-                if len(raw) >= 1:
-                    data = re.search(r"ro.sys.fw_ver=([0-9]+).+", raw)
+                if len(build_raw) >= 1:
+                    data = re.search(r"ro.sys.fw_ver=([0-9]+).+", build_raw)
                     version_g2h = data.group(1) if data else ''
-                    data = re.search(r"ro.sys.build_num=([0-9]+).+", raw)
+                    data = re.search(r"ro.sys.build_num=([0-9]+).+", build_raw)
                     build_num_g2h = data.group(1) if data else ''
-                raw = shell.read_file(
-                    '/mnt/config/zigbee/coordinator.info', with_newline=False)
-            else:
-                raw = shell.read_file(
-                    '/data/zigbee/coordinator.info', with_newline=False)
-                data = re.search(r"\[persist\.sys\.did\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                did = data.group(1) if data else shell.get_prop("persist.sys.did")
-                data = re.search(r"\[ro\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                model = data.group(1) if data else shell.get_prop("ro.sys.model")
-            value = json.loads(raw)
+            files_ts = time.monotonic()
+            value = json.loads(coordinator_raw)
             devices = [{
                 'coordinator': 'lumi.0',
                 'did': did,
@@ -341,21 +542,14 @@ class Gateway:
                 'type': 'gateway',
             }]
 
-            if len(prop_raw) >= 1:
-                data = re.search(r"\[ro\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                hw_model = data.group(1) if data else shell.get_prop("ro.sys.model")
-                data = re.search(r"\[ro\.sys\.fw_ver\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                version = data.group(1) if data else shell.get_prop("ro.sys.fw_ver")
-                data = re.search(r"\[ro\.sys\.build_num\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                build_num = data.group(1) if data else shell.get_prop("ro.sys.build_num")
-                data = re.search(r"\[ro\.sys\.vendor\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                device_manufacturer = data.group(1) if data else shell.get_prop("ro.sys.vendor")
-                data = re.search(r"\[persist\.sys\.zb_ver\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                zb_ver = data.group(1) if data else shell.get_prop("persist.sys.zb_ver")
-                data = re.search(r"\[persist\.sys\.sn\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                serial_number = data.group(1) if data else shell.get_prop("persist.sys.sn")
-                data = re.search(r"\[persist\.sys\.miio_mac\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                mac = data.group(1) if data else shell.get_prop("persist.sys.miio_mac")
+            if props:
+                hw_model = await shell.lookup_prop(props, "ro.sys.model")
+                version = await shell.lookup_prop(props, "ro.sys.fw_ver")
+                build_num = await shell.lookup_prop(props, "ro.sys.build_num")
+                device_manufacturer = await shell.lookup_prop(props, "ro.sys.vendor")
+                zb_ver = await shell.lookup_prop(props, "persist.sys.zb_ver")
+                serial_number = await shell.lookup_prop(props, "persist.sys.sn")
+                mac = await shell.lookup_prop(props, "persist.sys.miio_mac")
 
                 if len(device_manufacturer) >= 1:
                     devices[0]['device_manufacturer'] = f"{device_manufacturer}"
@@ -375,41 +569,14 @@ class Gateway:
             self._model = model
 
             # zigbee devices
-            data = re.search(r"\[sys\.zb_device\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-            zb_device = data.group(1) if data else shell.get_prop("sys.zb_device")
-            if len(zb_device) >= 1:
-                raw = shell.read_file(zb_device, with_newline=False)
-            else:
-                device_info_path = '{}/zigbee/device.info'.format(Utils.get_info_store_path(self._model))
-                if not shell.file_exist(device_info_path):
-                    device_info_path = '/mnt/config/zigbee/device.info'
-                raw = shell.read_file(device_info_path)
-
-            value = json.loads(raw)
-            dev_info = value.get("devInfo", 'null') or []
             if not Utils.gateway_is_aiot_only(model):
-                self.cloud = shell.get_prop("persist.sys.cloud")
-
-            for dev in dev_info:
-                model = dev['model']
-                desc = Utils.get_device(model, self.cloud)
-                # skip unknown model
-                if desc is None:
-                    self.debug("{} has an unsupported model: {}".format(
-                        dev['did'], model
-                    ))
-                    continue
-                device = {
-                    'coordinator': 'lumi.0',
-                    'did': dev['did'],
-                    'mac': dev['mac'],
-                    'model': dev['model'],
-                    'type': 'zigbee',
-                    'zb_ver': dev.get('zb_ver', "1.2"),
-                    'model_ver': dev['model_ver'],
-                    'status': dev['status']
-                }
-                devices.append(device)
+                self.cloud = await shell.lookup_prop(props, "persist.sys.cloud")
+            self._apply_inventory(self._parse_device_info(device_raw))
+            devices.extend(self._inventory.values())
+            self.debug("devices read in {} ms, props {} ms, files {} ms".format(
+                int((time.monotonic() - start) * 1000),
+                int((props_ts - start) * 1000),
+                int((files_ts - props_ts) * 1000)))
         except Exception as e:
             self.debug("Can't get devices: {}".format(e))
 
@@ -417,47 +584,90 @@ class Gateway:
 
     async def async_setup_devices(self, devices: list):
         """Add devices to hass."""
+        start = time.monotonic()
+        records = []
         for device in devices:
-            timeout = 300
             if device['type'] in ('gateway', 'zigbee'):
                 desc = Utils.get_device(device['model'], self.cloud)
                 if not desc:
                     self.debug("Unsupported model: {}".format(device))
                     continue
 
-                device.update(desc)
+                device = DeviceRecord(device, desc)
 
                 # update params from config
                 default_config = (
-                        self.default_devices.get(device['mac']) or
-                        self.default_devices.get(device['did'])
+                        self.default_devices.get(device.mac) or
+                        self.default_devices.get(device.did)
                 )
 
                 if default_config:
                     device.update(default_config)
+                    # the catalog tables do not match overridden params
+                    if 'params' in default_config or 'mi_spec' in default_config:
+                        (device.prop_attrs, device.attr_props,
+                         device.attr_specs) = Utils.get_param_tables(
+                            device.params or device.mi_spec)
+
+                self.devices[device.did] = device
+                records.append(device)
 
-                self.devices[device['did']] = device
+            # if self.options.get('stats'):
+            #     while 'sensor' not in self.setups:
+            #         await asyncio.sleep(1)
+            #     self.setups['sensor'](self, device, device['type'])
 
-                for param in (device['params'] or device['mi_spec']):
+        # wait once for every platform the devices need
+        domains = {
+            param[3] for device in records
+            for param in (device.params or device.mi_spec) if param[3]
+        }
+        waiting = [domain for domain in domains if domain not in self.setups]
+        if waiting:
+            try:
+                await asyncio.wait_for(asyncio.gather(*(
+                    self._platform_ready(domain).wait() for domain in waiting
+                )), PLATFORM_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("%s: platforms not set up in time: %s", self.host,
+                                [domain for domain in waiting if domain not in self.setups])
+        ready = time.monotonic()
+
+        self._entity_batch = {}
+        try:
+            for device in records:
+                for param in (device.params or device.mi_spec):
                     domain = param[3]
-                    if not domain:
+                    if not domain or domain not in self.setups:
                         continue
 
-                    # wait domain init
-                    while domain not in self.setups and timeout > 0:
-                        await asyncio.sleep(1)
-                        timeout = timeout - 1
                     attr = param[2]
                     if (attr in ('illuminance', 'light') and
-                            device['type'] == 'gateway'):
-                        self._gateway_did = device['did']
+                            device.type == 'gateway'):
+                        self._gateway_did = device.did
 
                     self.setups[domain](self, device, attr)
-
-            # if self.options.get('stats'):
-            #     while 'sensor' not in self.setups:
-            #         await asyncio.sleep(1)
-            #     self.setups['sensor'](self, device, device['type'])
+        finally:
+            batch, self._entity_batch = self._entity_batch, None
+            entities = 0
+            for (async_add_entities, update_before_add), new in batch.items():
+                async_add_entities(new, update_before_add)
+                entities += len(new)
+        self.counters['entities_added'] += entities
+        if entities and not self._first_entity:
+            self._first_entity = True
+            self.counters['first_entity_ms'] = int(
+                (time.monotonic() - self._start_ts) * 1000)
+            self.debug("first entity after {} ms".format(
+                self.counters['first_entity_ms']))
+
+        if records:
+            elapsed = time.monotonic() - ready
+            self.debug("{} devices set up in {} ms, {} ms waiting for {}, "
+                       "{} entities in {} calls, {:.0f} entities/s".format(
+                len(records), int((time.monotonic() - start) * 1000),
+                int((ready - start) * 1000), sorted(waiting),
+                entities, len(batch), entities / elapsed if elapsed else 0))
 
     def add_stats(self, ieee: str, handler):
         """ add gateway stats """
@@ -466,9 +676,42 @@ class Gateway:
         if self.parent_scan_interval > 0:
             self._info_ts = time.time() + 5
 
+        if ieee == 'lumi.0':
+            self._start_stats()
+
     def remove_stats(self, ieee: str, handler):
         """ remove gateway stats """
         self._extra_state_attributes.pop(ieee)
+        if ieee == 'lumi.0':
+            self._stop_stats()
+
+    def _start_stats(self):
+        if self._stats_task is None:
+            self._stats_task = self.hass.loop.create_task(
+                self._async_collect_stats())
+
+    def _stop_stats(self):
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+
+    async def _async_collect_stats(self):
+        """ refresh the network info snapshot every stats_interval """
+        while True:
+            try:
+                async with self.shell_session.acquire() as shell:
+                    raw = await shell.read_file('{}/zigbee/networkBak.info'.format(
+                        Utils.get_info_store_path(self._model)))
+            except (OSError, asyncio.TimeoutError) as err:
+                self.debug(f"Can't read network info: {err}")
+                raw = ''
+            if len(raw) >= 1:
+                try:
+                    self._network_stats = json.loads(raw)
+                    self.counters['stats_refreshes'] += 1
+                except ValueError as err:
+                    self.debug(f"Can't parse network info: {err}")
+            await asyncio.sleep(self._stats_interval)
 
     def process_gateway_stats(self, payload: dict = None):
         """ process gateway status """
@@ -501,8 +744,8 @@ class Gateway:
 
                 prop = None
                 if 'res_name' in param:
-                    if param['res_name'] in GLOBAL_PROP:
-                        prop = GLOBAL_PROP[param['res_name']]
+                    if param['res_name'] in self._global_prop:
+                        prop = self._global_prop[param['res_name']]
                 if prop == 'report':
                     report_list = param['value'].split(',')
                     stat = {}
@@ -511,22 +754,14 @@ class Gateway:
                             ':', 1) if 'time' in item else item.lstrip(
                                 ).strip().split(' '))
                         data.update(dict(zip(stat, stat)))
-            device_name = Utils.get_device_name(self._model).lower()
-            shell = self._get_shell(device_name)
-            shell.login()
-            raw = shell.read_file('{}/zigbee/networkBak.info'.format(
-                Utils.get_info_store_path(self._model)), with_newline=False)
-            shell.close()
-            if len(raw) >= 1:
-                value = json.loads(raw)
-                data.update(value)
+            data.update(self._network_stats)
 
         self._extra_state_attributes['lumi.0'](data)
 
     def on_connect(self, client, userdata, flags, ret):
         # pylint: disable=unused-argument
         """ on connect to mqtt server """
-        self._mqttc.subscribe("#")
+        self._mqttc.subscribe([(topic, 0) for topic in self.mqtt_topics])
         self.available = True
         if self.host not in self.hass.data[DOMAIN]["mqtt"]:
             self.hass.data[DOMAIN]["mqtt"].append(self.host)
@@ -542,7 +777,36 @@ class Gateway:
         self.hass.create_task(self.async_run())
 
     def on_message(self, client: Client, userdata, msg: MQTTMessage):
-        self.hass.loop.call_soon_threadsafe(self._on_message, msg)
+        # pylint: disable=unused-argument
+        """ queue messages, wake up the loop only when the queue was empty """
+        queue = self._queue
+        queue.append(msg)
+        if len(queue) == 1:
+            self._wakeup_ts = time.monotonic()
+            self.hass.loop.call_soon_threadsafe(self._drain_messages)
+
+    def _drain_messages(self):
+        """ process all queued messages in one loop callback """
+        queue = self._queue
+        counters = self.counters
+        latency = int((time.monotonic() - self._wakeup_ts) * 1000)
+        batch = 0
+        while queue:
+            msg = queue.popleft()
+            batch += 1
+            try:
+                self._on_message(msg)
+            except Exception:
+                _LOGGER.exception(f"{self.host}: failed to process {msg.topic}")
+        if not batch:
+            return
+        counters['mqtt_batches'] += 1
+        counters['mqtt_messages'] += batch
+        counters['mqtt_drain_latency_ms'] += latency
+        if batch > counters['mqtt_batch_max']:
+            counters['mqtt_batch_max'] = batch
+        if latency > counters['mqtt_drain_latency_max_ms']:
+            counters['mqtt_drain_latency_max_ms'] = latency
 
     def _on_message(self, msg: MQTTMessage):
         # pylint: disable=unused-argument
@@ -560,75 +824,119 @@ class Gateway:
                 self.debug("MQTT on_message: {}".format(topic))
                 self.debug(msg.payload)
 
-        if topic == 'log/camera':
+        handler = self._topic_handlers.get(topic)
+        if handler is None:
             return
 
         try:
-            json.loads(msg.payload)
+            payload = json_loads(msg.payload)
         except ValueError:
             self.debug("Decoding JSON failed")
             return
 
-        if topic == 'zigbee/send':
-            payload = json.loads(msg.payload)
-            self._process_message(payload)
-        elif topic == 'ioctl/send':
-            payload = json.loads(msg.payload)
-            self._process_message(payload)
-        elif topic == 'ioctl/recv':
-            payload = json.loads(msg.payload)
-            self._process_message(payload)
-        elif topic == 'debug/host':
-            payload = json.loads(msg.payload)
-            self._process_message(payload)
+        handler(payload)
 
     def _process_devices_info(self, prop, value):
         if prop == 'removed_did' and value:
             Utils.remove_device(self.hass, value)
-            if isinstance(value, dict) and value['did'] in self.devices:
-                self.devices.pop(value['did'], None)
-            if isinstance(value, str) and value in self.devices:
-                self.devices.pop(value, None)
+            did = value['did'] if isinstance(value, dict) else value
+            self._forget_device(did)
+            # or it comes back from the snapshot on the next boot
+            self.hass.async_create_task(self._async_save_inventory())
             return
 
         if prop == 'paring' and value == 0:
-            device_name = Utils.get_device_name(self._model).lower()
-            shell = self._get_shell(device_name)
-            shell.login()
-            zb_device = shell.get_prop("sys.zb_device")
-            if len(zb_device) >= 1:
-                raw = shell.read_file(zb_device, with_newline=False)
-            else:
-                raw = shell.read_file('{}/zigbee/device.info'.format(
-                    Utils.get_info_store_path(self._model)), with_newline=False)
+            self.hass.async_create_task(self._async_setup_paired_device())
 
-            shell.close()
-            value = json.loads(raw)
-            dev_info = value.get("devInfo", 'null') or []
-            for dev in dev_info:
-                model = dev['model']
-                desc = Utils.get_device(model, self.cloud)
-                # skip unknown model
-                if desc is None:
-                    self.debug("{} has an unsupported model: {}".format(
-                        dev['did'], model
-                    ))
-                    continue
+    def _apply_inventory(self, inventory: dict):
+        """ take over the device.info of a discovery, the devices restored
+        from the store that are gone were removed while HA was down
+        """
+        for did in self._inventory.keys() - inventory.keys():
+            self.debug(f"{did} is no longer paired")
+            Utils.remove_device(self.hass, did)
+            self._forget_device(did)
+        self._inventory = inventory
+
+    def _forget_device(self, did: str):
+        self.devices.pop(did, None)
+        self._inventory.pop(did, None)
+        self._last_values.pop(did, None)
+
+    def _parse_device_info(self, raw: str) -> dict:
+        """ did -> zigbee device of the supported models in device.info """
+        inventory = {}
+        value = json.loads(raw)
+        for dev in value.get("devInfo", 'null') or []:
+            model = dev['model']
+            desc = Utils.get_device(model, self.cloud)
+            # skip unknown model
+            if desc is None:
+                self.debug("{} has an unsupported model: {}".format(
+                    dev['did'], model
+                ))
+                continue
+            inventory[dev['did']] = {
+                'coordinator': 'lumi.0',
+                'did': dev['did'],
+                'mac': dev['mac'],
+                'model': dev['model'],
+                'type': 'zigbee',
+                'zb_ver': dev.get('zb_ver', "1.2"),
+                'model_ver': dev['model_ver'],
+                'status': dev['status']
+            }
+        return inventory
+
+    async def _async_setup_paired_device(self):
+        """ set up the devices added and drop the ones removed while
+        pairing was on
+        """
+        try:
+            async with self.shell_session.acquire() as shell:
+                props = await self._async_get_props(shell)
+                path = await shell.lookup_prop(props, "sys.zb_device")
+                if len(path) < 1:
+                    path = '{}/zigbee/device.info'.format(
+                        Utils.get_info_store_path(self._model))
+                # cat only if size or mtime changed since the last read
+                stat = "stat -c '%s %Y' {}".format(path)
+                cat = "cat {}".format(path)
+                if self._inventory_stat:
+                    cat = "[ \"$({})\" = '{}' ] || {}".format(
+                        stat, self._inventory_stat, cat)
+                (status, stat_raw), (_, raw) = await shell.run_commands([
+                    stat, cat])
+        except (OSError, asyncio.TimeoutError) as err:
+            self.debug(f"Can't read devices: {err}")
+            return
 
-                if prop == 'paring':
-                    if dev['did'] not in self.devices:
-                        device = {
-                            'coordinator': 'lumi.0',
-                            'did': dev['did'],
-                            'mac': dev['mac'],
-                            'model': dev['model'],
-                            'type': 'zigbee',
-                            'zb_ver': dev.get('zb_ver', "1.2"),
-                            'model_ver': dev['model_ver'],
-                            'status': dev['status']
-                        }
-                        self.hass.create_task(self.async_setup_devices([device]))
-                        break
+        # without stat every event reads the file
+        stat_raw = stat_raw.decode().strip() if status == 0 else ''
+        if stat_raw and stat_raw == self._inventory_stat:
+            self.counters['inventory_reads_skipped'] += 1
+            return
+        try:
+            inventory = self._parse_device_info(raw.decode())
+        except ValueError as err:
+            self.debug(f"Can't parse devices: {err}")
+            return
+        self._inventory_stat = stat_raw
+
+        added = [device for did, device in inventory.items()
+                 if did not in self.devices]
+        removed = self._inventory.keys() - inventory.keys()
+        self._inventory = inventory
+        # the registry entry goes with the removed_did report
+        for did in removed:
+            self._forget_device(did)
+        if added or removed:
+            self.debug("inventory: {} added, {} removed".format(
+                [device['did'] for device in added], sorted(removed)))
+        if added:
+            await self.async_setup_devices(added)
+        if added or removed:
+            await self._async_save_inventory()
 
     def _process_message(self, data: dict):
         # pylint: disable=too-many-branches, too-many-statements
@@ -667,13 +975,10 @@ class Gateway:
                     if param.get('error_code', 0) != 0:
                         continue
                     prop = param.get('res_name', None)
-                    if prop in GLOBAL_PROP:
-                        prop = GLOBAL_PROP[prop]
+                    if prop in self._global_prop:
+                        prop = self._global_prop[prop]
                     elif device:
-                        prop = next((
-                            p[2] for p in (device['params'])
-                            if p[0] == prop
-                        ), prop)
+                        prop = device.prop_attrs.get(prop, prop)
                     if prop in ('removed_did', 'paring'):
                         self._process_devices_info(
                             prop, param.get('value', None))
@@ -713,6 +1018,10 @@ class Gateway:
         if device is None:
             return
         time_stamp = time.time()
+        global_prop = self._global_prop
+        prop_attrs = device.prop_attrs
+        model = device.model
+        online = device.online
 
         payload = {}
 
@@ -731,23 +1040,20 @@ class Gateway:
                 _LOGGER.warning("Unsupported param: %s", data)
                 return
 
-            if prop in GLOBAL_PROP:
-                prop = GLOBAL_PROP[prop]
+            if prop in global_prop:
+                prop = global_prop[prop]
             else:
-                prop = next((
-                    p[2] for p in (device['params'] or device['mi_spec'])
-                    if p[0] == prop
-                ), prop)
+                prop = prop_attrs.get(prop, prop)
 
             # https://github.com/Koenkk/zigbee2mqtt/issues/798
             # https://www.maero.dk/aqara-temperature-humidity-pressure-sensor-teardown/
             if prop == 'temperature':
-                if device['model'] == 'lumi.airmonitor.acn01' and self.cloud == 'miot' or device['model'] == 'aqara.tow_w.acn001':
+                if model == 'lumi.airmonitor.acn01' and self.cloud == 'miot' or model == 'aqara.tow_w.acn001':
                     payload[prop] = param['value']
                 elif -4000 < param['value'] < 12500:
                         payload[prop] = param['value'] / 100.0
             elif prop == 'humidity':
-                if device['model'] == 'lumi.airmonitor.acn01' and self.cloud == 'miot':
+                if model == 'lumi.airmonitor.acn01' and self.cloud == 'miot':
                     payload[prop] = param['value']
                 elif 0 <= param['value'] <= 10000:
                     payload[prop] = param['value'] / 100.0
@@ -761,7 +1067,7 @@ class Gateway:
                 payload[prop] = Utils.fix_xiaomi_voltage(param['value'])
             elif prop == 'alive' and param['value']['status'] == 'offline':
                 if not self.options.get('noffline', False):
-                    device['online'] = False
+                    device.online = False
             elif prop == 'angle':
                 # xiaomi cube 100 points = 360 degrees
                 payload[prop] = param['value'] * 4
@@ -781,11 +1087,34 @@ class Gateway:
                     payload[prop] = param['arguments']
 
         self.debug("{} {} <= {} [{}]".format(
-            device['did'], device['model'], payload, time_stamp
+            did, model, payload, time_stamp
         ))
 
-        for handler in self.updates[did]:
-            handler(payload)
+        if pkey == 'res_list':
+            device.last_seen = time_stamp
+            # a device coming back gets the full heartbeat for its entities
+            if device.online:
+                payload = self._heartbeat_delta(did, payload)
+                if not payload:
+                    self.counters['heartbeats_skipped'] += 1
+                    return
+            device.online = True
+        self._last_values.setdefault(did, {}).update(payload)
+
+        if device.online != online:
+            # every entity shows the new availability
+            self._flush_pending(did)
+            self._dispatch(did, payload, broadcast=True)
+        elif self._coalesce_window:
+            if not self._event_handlers.isdisjoint(
+                    self._routed_handlers(did, payload)):
+                # keep the order, what is pending happened before the event
+                self._flush_pending(did)
+                self._dispatch(did, payload)
+            else:
+                self._coalesce(did, payload)
+        else:
+            self._dispatch(did, payload)
 
         if 'added_device' in payload:
             # {'did': 'lumi.fff', 'mac': 'fff', 'model': 'lumi.sen_ill.mgl01',
@@ -796,6 +1125,74 @@ class Gateway:
             device['init'] = payload
             self.hass.create_task(self.async_setup_devices([device]))
 
+    def _heartbeat_delta(self, did: str, payload: dict) -> dict:
+        """ keep only the values changed since the last message """
+        last = self._last_values.get(did)
+        if not last:
+            return payload
+        changed = {
+            key: value for key, value in payload.items()
+            if key not in last or last[key] != value
+        }
+        self.counters['heartbeat_values_skipped'] += len(payload) - len(changed)
+        # entities tell heartbeats from reports by these keys
+        if changed:
+            for key in HEARTBEAT_MARKERS:
+                if key in payload:
+                    changed[key] = payload[key]
+        return changed
+
+    def _dispatch(self, did: str, payload: dict, broadcast: bool = False):
+        """ call the update handlers of a device which use the payload """
+        if broadcast:
+            handlers = self.updates.get(did, ())
+        else:
+            handlers = self._routed_handlers(did, payload)
+            self.counters['routed_updates_skipped'] += (
+                len(self.updates.get(did, ())) - len(handlers))
+        for handler in list(handlers):
+            handler(payload)
+
+    def _routed_handlers(self, did: str, payload: dict) -> dict:
+        """ update handlers of a device which use the payload, in order """
+        routes = self._routes.get(did)
+        if not routes:
+            return {}
+        handlers = dict.fromkeys(routes.get(None, ()))
+        for key in payload:
+            if key in routes:
+                handlers.update(dict.fromkeys(routes[key]))
+        return handlers
+
+    def _coalesce(self, did: str, payload: dict):
+        """ merge payloads of a device until the window ends """
+        pending = self._pending.get(did)
+        if pending is not None:
+            merged = pending[0]
+            if any(key in merged and merged[key] != value
+                   for key, value in payload.items()):
+                # same attr with a new value, don't lose the first event
+                self._flush_pending(did)
+            else:
+                merged.update(payload)
+                routed = len(self._routed_handlers(did, payload))
+                if routed:
+                    self.counters['coalesced_payloads'] += 1
+                    self.counters['coalesced_writes_saved'] += routed
+                return
+        timer = self.hass.loop.call_later(
+            self._coalesce_window, self._flush_pending, did)
+        self._pending[did] = (dict(payload), timer)
+
+    def _flush_pending(self, did: str):
+        """ send the merged payload of a device """
+        pending = self._pending.pop(did, None)
+        if pending is None:
+            return
+        payload, timer = pending
+        timer.cancel()
+        self._dispatch(did, payload)
+
     async def _handle_device_remove(self, payload: dict):
         """Remove device from Hass. """
 
@@ -817,32 +1214,32 @@ class Gateway:
         self.hass.bus.async_listen(
             'device_registry_updated', device_registry_updated)
 
-    def send(self, device: dict, data: dict):
+    def send(self, device: DeviceRecord, data: dict):
         """ send command """
         try:
             payload = {}
-            if device['type'] == 'zigbee' or 'paring' in data:
-                did = data.get('did', device['did'])
+            if device.type == 'zigbee' or 'paring' in data:
+                did = data.get('did', device.did)
                 data.pop('did', '')
                 params = []
 
                 # convert hass prop to lumi prop
-                if device['mi_spec']:
+                if device.mi_spec:
                     payload = {'cmd': 'write', 'did': did, 'id': 5}
+                    attr_specs = device.attr_specs
                     for key, val in data.items():
                         if key == 'switch':
                             val = bool(val)
-                        key = next(
-                            p[0] for p in device['mi_spec'] if p[2] == key)
+                        siid, piid = attr_specs[key]
                         params.append({
-                            'siid': int(key[0]), 'piid': int(key[2]), 'value': val
+                            'siid': siid, 'piid': piid, 'value': val
                         })
 
                     payload['mi_spec'] = params
                 else:
+                    attr_props = device.attr_props
                     params = [{
-                        'res_name': next(
-                            p[0] for p in device['params'] if p[2] == key),
+                        'res_name': attr_props[key],
                         'value': val
                     } for key, val in data.items()]
 
@@ -855,7 +1252,7 @@ class Gateway:
 
                 payload = json.dumps(payload, separators=(',', ':')).encode()
                 self._mqttc.publish('zigbee/recv', payload)
-            elif device['type'] == 'gateway':
+            elif device.type == 'gateway':
                 if ATTR_HS_COLOR in data:
                     hs_color = data.get(ATTR_HS_COLOR, 0)
                     brightness = (hs_color >> 24) & 0xFF
@@ -888,46 +1285,57 @@ class Gateway:
             return False
 
 
-def prepare_aqaragateway(shell, model):
+def inventory_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """ storage of the devices discovered for a config entry """
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def prepare_aqaragateway(shell, model):
     """ Prepare supported Aqara Gateway """
+    start = time.monotonic()
+    commands = []
     if model in SIGMASTAR_MODELS:
-        command = "chattr -i /data/scripts"
-        shell.run_command(command)
-    if model in SIGMASTAR_MODELS:
-        command = "asetprop persist.app.tty_enable true"
-    else:
-        command = "setprop persist.app.tty_enable true"
-    shell.write(command.encode() + b"\n")
+        commands.append("chattr -i /data/scripts")
     if model in SIGMASTAR_MODELS:
-        command = "asetprop persist.app.debug_log true"
+        commands.append("asetprop persist.app.tty_enable true")
+        commands.append("asetprop persist.app.debug_log true")
     else:
-        command = "setprop persist.app.debug_log true"
-    shell.write(command.encode() + b"\n")
-    command = "mkdir -p /data/scripts"
-    shell.write(command.encode() + b"\n")
-    command = "echo -e '#!/bin/sh\r\n\r\nfw_manager.sh -r\r\n" \
-        "fw_manager.sh -t -k' > /data/scripts/post_init.sh"
-    shell.run_command(command)
-    command = "chmod a+x /data/scripts/post_init.sh"
-    shell.run_command(command)
-    command = "mkdir -p /data/bin"
-    shell.write(command.encode() + b"\n")
+        commands.append("setprop persist.app.tty_enable true")
+        commands.append("setprop persist.app.debug_log true")
+    commands.append("mkdir -p /data/scripts")
+    commands.append(
+        "echo -e '#!/bin/sh\r\n\r\nfw_manager.sh -r\r\n"
+        "fw_manager.sh -t -k' > /data/scripts/post_init.sh")
+    commands.append("chmod a+x /data/scripts/post_init.sh")
+    commands.append("mkdir -p /data/bin")
+    md5 = None
     if model in ('lumi.camera.agl001'):
-        shell.check_bin('mosquitto', MD5_MOSQUITTO_G2HPRO_ARMV7L , 'bin/armv7l/mosquitto_g2hpro')
-        command = "chattr +i /data/scripts"
-        shell.run_command(command)
+        md5 = MD5_MOSQUITTO_G2HPRO_ARMV7L
+        commands.append(WGET.format('bin/armv7l/mosquitto_g2hpro', 'mosquitto'))
+        commands.append("md5sum /data/bin/mosquitto")
+        commands.append("chattr +i /data/scripts")
     elif model in SIGMASTAR_MODELS:
-        shell.check_bin('mosquitto', MD5_MOSQUITTO_NEW_ARMV7L , 'bin/armv7l/mosquitto_new')
-        command = "chattr +i /data/scripts"
-        shell.run_command(command)
+        md5 = MD5_MOSQUITTO_NEW_ARMV7L
+        commands.append(WGET.format('bin/armv7l/mosquitto_new', 'mosquitto'))
+        commands.append("md5sum /data/bin/mosquitto")
+        commands.append("chattr +i /data/scripts")
     elif model in REALTEK_MODELS:
-        shell.check_bin('mosquitto', MD5_MOSQUITTO_MIPSEL, 'bin/mipsel/mosquitto')
-
-
-def is_aqaragateway(host: str,
-                    password: str,
-                    device_name: str,
-                    patched_fw: bool) -> Optional[dict]:
+        md5 = MD5_MOSQUITTO_MIPSEL
+        commands.append(WGET.format('bin/mipsel/mosquitto', 'mosquitto'))
+        commands.append("md5sum /data/bin/mosquitto")
+
+    results = await shell.run_commands(commands)
+    if md5 and md5 not in results[commands.index(
+            "md5sum /data/bin/mosquitto")][1].decode():
+        _LOGGER.debug("%s: downloaded mosquitto doesn't match %s", model, md5)
+    _LOGGER.debug("%s: %d provisioning commands took %d ms", model,
+                  len(commands), (time.monotonic() - start) * 1000)
+
+
+async def is_aqaragateway(host: str,
+                          password: str,
+                          device_name: str,
+                          patched_fw: bool) -> Optional[dict]:
     """return name if is supported gateway"""
     result = {}
     result['status'] = 'error'
@@ -939,13 +1347,14 @@ def is_aqaragateway(host: str,
             socket.inet_aton(host)
             if device_name and 'g2h' in device_name:
                 shell = TelnetShellG2H(host, password)
-                shell.login()
-                raw = str(shell.read_file('/etc/build.prop'))
+                await shell.connect()
+                await shell.login()
+                raw = str(await shell.read_file('/etc/build.prop'))
                 data = re.search(r"ro\.sys\.name=([a-zA-Z0-9.-]+).+", raw)
                 name = data.group(1) if data else ''
                 data = re.search(r"ro\.sys\.model=([a-zA-Z0-9.-]+).+", raw)
                 model = data.group(1) if data else ''
-                raw = str(shell.read_file('/mnt/config/miio/device.conf'))
+                raw = str(await shell.read_file('/mnt/config/miio/device.conf'))
                 data = re.search(r"mac=([a-zA-Z0-9:]+).+", raw)
                 mac = data.group(1) if data else ''
             elif device_name:
@@ -961,34 +1370,31 @@ def is_aqaragateway(host: str,
                     shell = TelnetShellM2POE(host, password)
                 else:
                     shell = TelnetShell(host, password)
-                shell.login()
-                prop_raw = shell.get_prop("")
+                await shell.connect()
+                await shell.login()
+                props = await shell.get_props()
                 if 'g2h pro' in device_name:
-                    data = re.search(r"\[ro\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                    model = data.group(1) if data else shell.get_prop("ro.sys.model")
+                    model = await shell.lookup_prop(props, "ro.sys.model")
                 else:
-                    data = re.search(r"\[persist\.sys\.model\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                    model = data.group(1) if data else shell.get_prop("persist.sys.model")
-                data = re.search(r"\[ro\.sys\.name\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                name = data.group(1) if data else shell.get_prop("ro.sys.name")
-                data = re.search(r"\[persist\.sys\.miio_mac\]: \[([a-zA-Z0-9.-]+)\]", prop_raw)
-                mac = data.group(1) if data else shell.get_prop("persist.sys.miio_mac")
-                token = shell.get_token()
+                    model = await shell.lookup_prop(props, "persist.sys.model")
+                name = await shell.lookup_prop(props, "ro.sys.name")
+                mac = await shell.lookup_prop(props, "persist.sys.miio_mac")
+                token = await shell.get_token()
             else:
                 return result
 
-        except (ConnectionError, EOFError, socket.error):
+        except (OSError, EOFError, asyncio.TimeoutError):
             result['status'] = "connection_error"
             return result
 
-        if model in DEVICES[0]:
+        if Utils.get_device_name(model):
             result[CONF_NAME] = "{}-{}".format(
                 name, mac[-5:].upper().replace(":", ""))
             result['model'] = model
             result['status'] = 'ok'
             result['token'] = token
             if model in SUPPORTED_MODELS and not patched_fw:
-                prepare_aqaragateway(shell, model)
+                await prepare_aqaragateway(shell, model)
         if shell:
             shell.close()
 
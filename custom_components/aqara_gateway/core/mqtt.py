@@ -0,0 +1,85 @@
+""" Drive a paho MQTT client from the asyncio event loop """
+import asyncio
+import logging
+
+from paho.mqtt.client import Client, MQTT_ERR_SUCCESS
+
+_LOGGER = logging.getLogger(__name__)
+
+MISC_INTERVAL = 1  # seconds between paho keepalive/timeout checks
+
+
+class AsyncioMqttLoop:
+    """ Socket reader/writer callbacks instead of paho's network thread.
+
+    paho calls the socket callbacks from whatever thread connects, so they
+    are forwarded to the loop with call_soon_threadsafe. Once the socket
+    is registered, on_connect/on_message/on_disconnect run in the loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, client: Client):
+        self.loop = loop
+        self.client = client
+        self._sock = None
+        self._misc = None
+
+        client.on_socket_open = self._on_socket_open
+        client.on_socket_close = self._on_socket_close
+        client.on_socket_register_write = self._on_socket_register_write
+        client.on_socket_unregister_write = self._on_socket_unregister_write
+
+    def _on_socket_open(self, client, userdata, sock):
+        # pylint: disable=unused-argument
+        self.loop.call_soon_threadsafe(self._async_socket_open, sock)
+
+    def _on_socket_close(self, client, userdata, sock):
+        # pylint: disable=unused-argument
+        self.loop.call_soon_threadsafe(self._async_socket_close, sock)
+
+    def _on_socket_register_write(self, client, userdata, sock):
+        # pylint: disable=unused-argument
+        self.loop.call_soon_threadsafe(
+            self.loop.add_writer, sock, self._on_writable)
+
+    def _on_socket_unregister_write(self, client, userdata, sock):
+        # pylint: disable=unused-argument
+        self.loop.call_soon_threadsafe(self.loop.remove_writer, sock)
+
+    def _async_socket_open(self, sock):
+        self._sock = sock
+        self.loop.add_reader(sock, self._on_readable)
+        if self._misc is None:
+            self._misc = self.loop.call_later(MISC_INTERVAL, self._misc_loop)
+
+    def _async_socket_close(self, sock):
+        self.loop.remove_reader(sock)
+        self.loop.remove_writer(sock)
+        if sock is self._sock:
+            self._sock = None
+            self._cancel_misc()
+
+    def _on_readable(self):
+        self.client.loop_read()
+
+    def _on_writable(self):
+        self.client.loop_write()
+
+    def _misc_loop(self):
+        """ keepalive pings and timeouts, the part of loop() without I/O """
+        if self.client.loop_misc() == MQTT_ERR_SUCCESS:
+            self._misc = self.loop.call_later(MISC_INTERVAL, self._misc_loop)
+        else:
+            self._misc = None
+
+    def _cancel_misc(self):
+        if self._misc is not None:
+            self._misc.cancel()
+            self._misc = None
+
+    def stop(self):
+        """ stop watching the socket, keep the connection like loop_stop """
+        if self._sock is not None:
+            self.loop.remove_reader(self._sock)
+            self.loop.remove_writer(self._sock)
+            self._sock = None
+        self._cancel_misc()
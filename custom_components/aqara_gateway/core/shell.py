@@ -1,17 +1,14 @@
 """ Telnet Shell """
 # pylint: disable=line-too-long
-import time
+import asyncio
 import base64
+import re
 
-from typing import Union
-from telnetlib import Telnet
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Union
 
-from .const import (
-    SIGMASTAR_MODELS,
-    MD5_MOSQUITTO_NEW_ARMV7L,
-    MD5_MOSQUITTO_G2HPRO_ARMV7L,
-    MD5_MOSQUITTO_MIPSEL
-)
+from .const import SIGMASTAR_MODELS
 
 WGET = "(wget http://master.dl.sourceforge.net/project/aqarahub/{0}?viasf=1 " \
             "-O /data/bin/{1} && chmod +x /data/bin/{1})"
@@ -21,8 +18,44 @@ DOWNLOAD_SOCAT = "(wget -O /data/socat http://pkg.simple-ha.ru/mipsel/socat && c
 RUN_SOCAT_BT_IRDA = "/data/socat tcp-l:8888,reuseaddr,fork /dev/ttyS2"
 RUN_SOCAT_ZIGBEE = "/data/socat tcp-l:8888,reuseaddr,fork /dev/ttyS1"
 
+TELNET_PORT = 23
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 15  # deadline of a read without an explicit timeout
+KEEPALIVE_INTERVAL = 60  # seconds of idle time before probing the session
 
-class TelnetShell(Telnet):
+# printed after every command with its sequence number and exit status,
+# the quotes keep an echoed command line from matching
+END_MARKER = "__aqara_end{}__"
+END_COMMAND = 'echo "__aqara_""end{}__$?"'
+
+# one "[name]: [value]" entry of the getprop dump
+PROP_LINE = re.compile(r"\[([^\]]+)\]: \[([^\]]*)\]")
+
+# telnet protocol, RFC 854
+IAC = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+SB = 250
+SE = 240
+
+
+def is_public_mosquitto(raw: str) -> bool:
+    """ check the output of starting a second mosquitto """
+    if 'Binding listener to interface ""' in raw:
+        return True
+    if 'Binding listener to interface ' not in raw:
+        return True
+    return False
+
+
+def parse_props(raw: str) -> dict:
+    """ parse the getprop dump, line breaks may be stripped already """
+    return dict(PROP_LINE.findall(raw))
+
+
+class TelnetShell:
     """ Telnet Shell """
     _aqara_property = False
     _suffix = "# "
@@ -30,114 +63,284 @@ class TelnetShell(Telnet):
 
     def __init__(self, host: str, password=""):
         """ init function """
-        super().__init__(host, timeout=5)
         self._host = host
         self._password = password
-
-    def login(self):
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._cooked = b""  # received data without telnet commands
+        self._raw = b""  # incomplete telnet command from the last chunk
+        self._framed = False  # commands end with END_MARKER, no prompt
+        self._seq = 0  # number of the last framed command
+        self._unfinished = 0  # last command of a batch that timed out
+
+    @property
+    def connected(self) -> bool:
+        """ return True if the connection is open """
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self, timeout: float = CONNECT_TIMEOUT):
+        """ open the telnet connection """
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, TELNET_PORT), timeout)
+        self._cooked = self._raw = b""
+        self._framed = False
+        self._unfinished = 0
+
+    def close(self):
+        """ close the telnet connection """
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    def write(self, buffer: bytes):
+        """ write to the connection, flushed on the next read """
+        if self._writer is None:
+            raise ConnectionResetError(f"telnet connection to {self._host} is closed")
+        self._writer.write(buffer.replace(b"\xff", b"\xff\xff"))
+
+    async def read_until(self, match: bytes, timeout: float | None = None) -> bytes:
+        """Read until match or the deadline.
+
+        Like telnetlib, returns whatever was received when the deadline
+        passes or the connection is closed instead of raising. Reading
+        from a closed connection raises ConnectionResetError.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout if timeout is not None else READ_TIMEOUT)
+        while True:
+            pos = self._cooked.find(match)
+            if pos >= 0:
+                pos += len(match)
+                data, self._cooked = self._cooked[:pos], self._cooked[pos:]
+                return data
+            if self._reader is None:
+                if self._cooked:
+                    break
+                raise ConnectionResetError(f"telnet connection to {self._host} is closed")
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(self._reader.read(4096), remaining)
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                # closed by the gateway, reconnect next time
+                self.close()
+                break
+            self._cooked += self._process_telnet(chunk)
+        data, self._cooked = self._cooked, b""
+        return data
+
+    def _process_telnet(self, chunk: bytes) -> bytes:
+        """ strip telnet commands and refuse every option """
+        data = self._raw + chunk
+        self._raw = b""
+        out = bytearray()
+        pos = 0
+        size = len(data)
+        while pos < size:
+            iac = data.find(b"\xff", pos)
+            if iac < 0:
+                out += data[pos:]
+                break
+            out += data[pos:iac]
+            if iac + 1 >= size:
+                self._raw = data[iac:]
+                break
+            cmd = data[iac + 1]
+            if cmd == IAC:
+                out.append(IAC)
+                pos = iac + 2
+            elif cmd in (DO, DONT, WILL, WONT):
+                if iac + 2 >= size:
+                    self._raw = data[iac:]
+                    break
+                if cmd == DO:
+                    self._writer.write(bytes((IAC, WONT, data[iac + 2])))
+                elif cmd == WILL:
+                    self._writer.write(bytes((IAC, DONT, data[iac + 2])))
+                pos = iac + 3
+            elif cmd == SB:
+                end = data.find(bytes((IAC, SE)), iac + 2)
+                if end < 0:
+                    self._raw = data[iac:]
+                    break
+                pos = end + 2
+            else:
+                pos = iac + 2
+        # telnetlib drops NUL and XON from the data too
+        return bytes(out).replace(b"\x00", b"").replace(b"\x11", b"")
+
+    async def login(self):
+        """ login and switch to marker framed commands """
+        await self._login()
+        self._framed = True
+        # the prompt differs per model, without it a command is done
+        # as soon as its marker arrives
+        await self.exec_command("export PS1=''", timeout=5)
+
+    async def _login(self):
         """ login function """
         self.write(b"\n")
-        self.read_until(b"login: ", timeout=10)
+        await self.read_until(b"login: ", timeout=10)
 
-        self.run_command("admin")
+        await self.run_command("admin")
         if self._password:
-            self.read_until(b"Password: ", timeout=1)
+            await self.read_until(b"Password: ", timeout=1)
             self.write(self._password.encode() + b"\n")
-        self.run_command("stty -echo")
+        await self.run_command("stty -echo")
         self.write(b"\n")
-        self.read_until(b" # ", timeout=2)
+        await self.read_until(b" # ", timeout=2)
 
 #        self.run_command("export PS1='# '")
 
-    def run_command(self, command: str, as_bytes=False) -> Union[str, bytes]:
+    async def exec_command(self, command: str,
+                           timeout: float = READ_TIMEOUT) -> tuple[int | None, bytes]:
+        """Run command, return its exit status and output.
+
+        The status is None if the end marker didn't arrive in time.
+        """
+        return (await self.run_commands([command], timeout))[0]
+
+    async def run_commands(self, commands: list[str], timeout: float | None = None
+                           ) -> list[tuple[int | None, bytes]]:
+        """Run commands with a single write, return status and output of each.
+
+        The batch gets the time the commands had one by one, READ_TIMEOUT
+        each, unless timeout is given.
+        """
+        loop = asyncio.get_running_loop()
+        if timeout is None:
+            timeout = READ_TIMEOUT * len(commands)
+        deadline = loop.time() + timeout
+        if not self._unfinished:
+            # leftovers of an earlier command would end up in this output
+            self._cooked = b""
+        first = self._seq + 1
+        self._seq += len(commands)
+        self.write("".join(
+            "{}\n{}\n".format(command, END_COMMAND.format(seq))
+            for seq, command in enumerate(commands, first)).encode())
+        # output of commands that timed out comes first, skip it
+        if self._unfinished:
+            await self._read_marker(self._unfinished, deadline)
+            if self._unfinished == self._seq:
+                return [(None, b"")] * len(commands)
+        self._unfinished = 0
+        results = []
+        for seq in range(first, self._seq + 1):
+            status, raw = await self._read_marker(seq, deadline)
+            results.append((status, raw))
+            if status is None and self._unfinished:
+                # the later commands are still waiting behind this one
+                results += [(None, b"")] * (self._seq - seq)
+                break
+        return results
+
+    async def _read_marker(self, seq: int, deadline: float) -> tuple[int | None, bytes]:
+        """Read the output of a framed command up to its end marker.
+
+        If the marker doesn't arrive in time, the received data stays
+        buffered and the batch is remembered as unfinished, the next
+        batch reads through it first.
+        """
+        loop = asyncio.get_running_loop()
+        marker = END_MARKER.format(seq).encode()
+        raw = await self.read_until(
+            marker, timeout=max(deadline - loop.time(), 0))
+        if not raw.endswith(marker):
+            # a part of the marker may be in it already
+            self._cooked = raw + self._cooked
+            self._unfinished = self._seq
+            return None, raw
+        status = await self.read_until(
+            b"\n", timeout=max(deadline - loop.time(), 0))
+        try:
+            return int(status), raw[:-len(marker)]
+        except ValueError:
+            return None, raw[:-len(marker)]
+
+    async def run_command(self, command: str, as_bytes=False,
+                          timeout: float = READ_TIMEOUT) -> Union[str, bytes]:
         """Run command and return it result."""
         # pylint: disable=broad-except
         try:
-            self.write(command.encode() + b"\n")
-            suffix = "\r\n{}".format(self._suffix)
-            raw = self.read_until(suffix.encode(), timeout=15)
+            if self._framed:
+                _, raw = await self.exec_command(
+                    command.rstrip("\r\n"), timeout=timeout)
+            else:
+                # still logging in, wait for the prompt
+                self.write(command.encode() + b"\n")
+                suffix = "\r\n{}".format(self._suffix)
+                raw = await self.read_until(suffix.encode(), timeout=timeout)
         except Exception:
             raw = b''
         return raw if as_bytes else raw.decode()
 
-    def check_bin(self, filename: str, md5: str, url=None) -> bool:
+    async def check_bin(self, filename: str, md5: str, url=None) -> bool:
         """Check binary md5 and download it if needed."""
         # used * for development purposes
         if url:
-            self.run_command(WGET.format(url, filename))
-            return self.check_bin(filename, md5)
-        elif md5 in self.run_command("md5sum /data/bin/{}".format(filename)):
+            await self.run_command(WGET.format(url, filename))
+            return await self.check_bin(filename, md5)
+        elif md5 in await self.run_command("md5sum /data/bin/{}".format(filename)):
             return True
         else:
             return False
 
-    def run_basis_cli(self, command: str, as_bytes=False) -> Union[str, bytes]:
+    async def run_basis_cli(self, command: str, as_bytes=False) -> Union[str, bytes]:
         """Run command and return it result."""
-        command = "basis_cli " + command
-        self.write(command.encode() + b"\n")
-        self.read_until(self._suffix.encode())
-        self.read_until(self._suffix.encode())
+        return await self.run_command("basis_cli " + command, as_bytes)
 
-    def file_exist(self, filename: str) -> bool:
+    async def file_exist(self, filename: str) -> bool:
         """ check file exit """
-        raw = self.run_command("ls -al {}".format(filename))
-        if "No such" not in str(raw):
-            return True
-        return False
+        status, _ = await self.exec_command("ls -al {}".format(filename))
+        return status == 0
 
-    def run_public_mosquitto(self, model):
+    async def run_public_mosquitto(self, model):
         """ run mosquitto as public """
-        if not self.file_exist("/data/bin/mosquitto"):
-            command = "mkdir -p /data/bin"
-            self.write(command.encode() + b"\n")
+        commands = []
+        if not await self.file_exist("/data/bin/mosquitto"):
+            commands.append("mkdir -p /data/bin")
             if model in ('lumi.camera.agl001'):
-                self.check_bin('mosquitto', MD5_MOSQUITTO_G2HPRO_ARMV7L , 'bin/armv7l/mosquitto_g2hpro')
+                commands.append(WGET.format('bin/armv7l/mosquitto_g2hpro', 'mosquitto'))
             elif model in SIGMASTAR_MODELS:
-                self.check_bin('mosquitto', MD5_MOSQUITTO_NEW_ARMV7L , 'bin/armv7l/mosquitto_new')
+                commands.append(WGET.format('bin/armv7l/mosquitto_new', 'mosquitto'))
             else:
-                self.check_bin('mosquitto', MD5_MOSQUITTO_MIPSEL, 'bin/mipsel/mosquitto')
-        self.run_command("killall mosquitto")
-        self.run_command("sleep .1")
-        self.run_command("/data/bin/mosquitto -d")
+                commands.append(WGET.format('bin/mipsel/mosquitto', 'mosquitto'))
+        commands += ["killall mosquitto", "sleep .1", "/data/bin/mosquitto -d"]
+        await self.run_commands(commands)
 
-    def check_public_mosquitto(self) -> bool:
+    async def check_public_mosquitto(self) -> bool:
         """ get processes list """
-        raw = self.run_command("mosquitto")
-        if 'Binding listener to interface ""' in raw:
-            return True
-        if 'Binding listener to interface ' not in raw:
-            return True
-        return False
+        return is_public_mosquitto(await self.run_command("mosquitto"))
+
+    async def get_mosquitto_state(self) -> tuple[str, bool]:
+        """ mosquitto processes and check_public_mosquitto in one go """
+        (_, processes), (_, raw) = await self.run_commands(
+            ["ps | grep mosquitto", "mosquitto"])
+        return processes.decode(), is_public_mosquitto(raw.decode())
 
-    def get_running_ps(self, ps=None) -> str:
+    async def get_running_ps(self, ps=None) -> str:
         """ get processes list """
         if isinstance(ps, str):
-            return self.run_command(f"ps | grep {ps}")
-        return self.run_command("ps")
+            return await self.run_command(f"ps | grep {ps}")
+        return await self.run_command("ps")
 
-    def read_file(self, filename: str, as_base64=False, with_newline=True):
+    async def read_file(self, filename: str, as_base64=False):
         """ read file content """
         # pylint: disable=broad-except
         try:
             if as_base64:
-                command = "cat {} | base64\n".format(filename)
-                self.write(command.encode())
-                raw = self.read_until(self._suffix.encode()).decode()
-                if not with_newline:
-                    raw = self.read_until(self._suffix.encode()).decode()
+                _, raw = await self.exec_command("cat {} | base64".format(filename))
                 return base64.b64decode(raw)
-            command = "cat {}\n".format(filename)
-            self.write(command.encode())
-            ret = self.read_until(self._suffix.encode()).decode()
-            if not with_newline:
-                ret = self.read_until(self._suffix.encode()).decode()
-            if ret.endswith(self._suffix):
-                ret = "".join(ret.rsplit(self._suffix, 1))
-            return ret.strip("\n")
+            _, raw = await self.exec_command("cat {}".format(filename))
+            return raw.decode().strip("\r\n")
         except Exception:
             return ''
 
-    def get_prop(self, property_value: str):
+    async def get_prop(self, property_value: str):
         """ get property """
         # pylint: disable=broad-except
         try:
@@ -145,7 +348,7 @@ class TelnetShell(Telnet):
                 command = "agetprop {}\n\r".format(property_value)
             else:
                 command = "getprop {}\n\r".format(property_value)
-            ret = self.run_command(command)
+            ret = await self.run_command(command)
             if ret.endswith(self._suffix):
                 ret = "".join(ret.rsplit(self._suffix, 1))
             if ret.startswith(self._suffix):
@@ -154,40 +357,51 @@ class TelnetShell(Telnet):
         except Exception:
             return ''
 
-    def set_prop(self, property_value: str, value: str):
+    async def get_props(self) -> dict:
+        """ get all properties with a single getprop """
+        return parse_props(await self.get_prop(""))
+
+    async def lookup_prop(self, props: dict, property_value: str,
+                          fallback: str | None = None) -> str:
+        """ get property from the snapshot, ask the gateway if missing """
+        value = props.get(property_value)
+        if value:
+            return value
+        return await self.get_prop(fallback or property_value)
+
+    async def set_prop(self, property_value: str, value: str) -> bool:
         """ set property """
         if self._aqara_property:
-            command = "asetprop {} {}\n".format(property_value, value)
+            command = "asetprop {} {}".format(property_value, value)
         else:
-            command = "setprop {} {}\n".format(property_value, value)
-        self.write(command.encode() + b"\n")
-        self.read_until(self._suffix.encode())
-        self.read_until(self._suffix.encode())
+            command = "setprop {} {}".format(property_value, value)
+        status, _ = await self.exec_command(command)
+        return status == 0
 
-    def get_version(self):
+    async def get_version(self):
         """ get gateway version """
-        return self.get_prop("ro.sys.fw_ver")
+        return await self.get_prop("ro.sys.fw_ver")
 
-    def set_audio_volume(self, value):
+    async def set_audio_volume(self, value):
         """ set gateway audio volume """
         if value > 100:
             value = 100
         command = "-sys -v {}".format(value)
-        raw = self.run_basis_cli(command)
+        raw = await self.run_basis_cli(command)
         return raw[raw.find(">>>") + 4:]
 
-    def get_token(self):
+    async def get_token(self):
         """ get gateway token """
         filename = "/data/miio/device.token"
-        if self.file_exist(filename):
-            return self.read_file(filename).rstrip().encode().hex()
+        if await self.file_exist(filename):
+            return (await self.read_file(filename)).rstrip().encode().hex()
         return None
 
-    def get_model(self):
+    async def get_model(self):
         try:
             self.write(b"\n")
             suffix = ":"
-            raw = self.read_until(suffix.encode(), timeout=15)
+            raw = await self.read_until(suffix.encode(), timeout=15)
         except Exception:
             raw = b''
         model = raw.decode()
@@ -210,12 +424,12 @@ class TelnetShell(Telnet):
 
 class TelnetShellG2H(TelnetShell):
 
-    def login(self):
+    async def _login(self):
         """ login function """
         self._aqara_property = True
 
         self.write(b"\n")
-        self.read_until(b"login: ", timeout=10)
+        await self.read_until(b"login: ", timeout=10)
 
         password = self._password
         if ((self._password is None) or
@@ -225,73 +439,167 @@ class TelnetShellG2H(TelnetShell):
 
         self.write(b"root\n\r")
         if password:
-            self.read_until(b"Password: ", timeout=3)
+            await self.read_until(b"Password: ", timeout=3)
             #self.write(password.encode() + b"\n")
-            self.run_command(password)
+            await self.run_command(password)
 
-        self.run_command("stty -echo")
-        self.read_until(self._suffix.encode(), timeout=10)
+        await self.run_command("stty -echo")
+        await self.read_until(self._suffix.encode(), timeout=10)
         self._suffix = "# "
 
 
 class TelnetShellE1(TelnetShell):
 
-    def login(self):
+    async def _login(self):
         """ login function """
         self._aqara_property = True
 
         self.write(b"\n")
-        self.read_until(b"login: ", timeout=10)
+        await self.read_until(b"login: ", timeout=10)
         self.write(b"root\n\r")
 
-        self.read_until(b"Password: ", timeout=10)
+        await self.read_until(b"Password: ", timeout=10)
         self.write(b"\n\r")
 
-        self.read_until(b"/ # ", timeout=10)
+        await self.read_until(b"/ # ", timeout=10)
         self._suffix = "/ # "
 
-        self.run_command("stty -echo")
-        self.read_until(self._suffix.encode(), timeout=10)
+        await self.run_command("stty -echo")
+        await self.read_until(self._suffix.encode(), timeout=10)
 
 
 class TelnetShellG3(TelnetShell):
     _suffix = "~ # "
 
-    def login(self):
+    async def _login(self):
         """ login function """
         self._aqara_property = True
 
         self.write(b"\n")
-        self.read_until(b"login: ", timeout=3)
+        await self.read_until(b"login: ", timeout=3)
 
         self.write(b"root\n\r")
         if self._password:
-            self.read_until(b"Password: ", timeout=3)
+            await self.read_until(b"Password: ", timeout=3)
             self.write(self._password.encode() + b"\n")
 
-        self.run_command("cd /")
+        await self.run_command("cd /")
         self._suffix = "/ # "
 
-        self.run_command("stty -echo")
-        self.read_until(self._suffix.encode(), timeout=10)
+        await self.run_command("stty -echo")
+        await self.read_until(self._suffix.encode(), timeout=10)
 
 
 class TelnetShellM2POE(TelnetShell):
     _suffix = "/ # "
 
-    def login(self):
+    async def _login(self):
         """ login function """
         self._aqara_property = True
 
         self.write(b"\n")
-        self.read_until(b"login: ", timeout=10)
+        await self.read_until(b"login: ", timeout=10)
 
         self.write(b"root\n\r")
         if self._password:
-            self.read_until(b"Password: ", timeout=3)
+            await self.read_until(b"Password: ", timeout=3)
             self.write(self._password.encode() + b"\n")
 
-        self.read_until(b"/ # ", timeout=10)
-        self.run_command("stty -echo")
-        self.read_until(self._suffix.encode(), timeout=10)
-
+        await self.read_until(b"/ # ", timeout=10)
+        await self.run_command("stty -echo")
+        await self.read_until(self._suffix.encode(), timeout=10)
+
+
+
+class ShellSession:
+    """Logged-in shell of a gateway, shared by all of its users.
+
+    Commands are serialized with a lock, the shell is logged in again
+    when the connection is gone and an idle session is probed now and
+    then so a dead one is noticed before the next caller needs it.
+    """
+
+    def __init__(self, factory: Callable[[], Awaitable[TelnetShell]],
+                 counters: Counter):
+        self._factory = factory
+        self._counters = counters
+        self._lock = asyncio.Lock()
+        self._shell: TelnetShell | None = None
+        self._keepalive: asyncio.TimerHandle | None = None
+        self._keepalive_task: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[TelnetShell]:
+        """ exclusive use of the logged-in shell """
+        async with self._lock:
+            shell = await self._async_login()
+            try:
+                yield shell
+            except (OSError, asyncio.TimeoutError):
+                self.close()
+                raise
+            self._schedule_keepalive()
+
+    async def _async_login(self) -> TelnetShell:
+        if self._shell is not None and self._shell.connected:
+            self._counters['shell_reuses'] += 1
+            return self._shell
+        self.close()
+        shell = await self._factory()
+        await shell.connect()
+        try:
+            await shell.login()
+        except BaseException:
+            shell.close()
+            raise
+        self._counters['shell_logins'] += 1
+        self._shell = shell
+        return shell
+
+    def _schedule_keepalive(self):
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+        self._keepalive = asyncio.get_running_loop().call_later(
+            KEEPALIVE_INTERVAL, self._start_keepalive)
+
+    def _start_keepalive(self):
+        self._keepalive = None
+        if self._shell is not None and not self._lock.locked():
+            self._keepalive_task = asyncio.get_running_loop().create_task(
+                self._async_keepalive())
+
+    async def _async_keepalive(self):
+        async with self._lock:
+            shell = self._shell
+            if shell is None or not shell.connected:
+                return
+            # an empty command, answered with the end marker
+            try:
+                status, _ = await shell.exec_command("", timeout=5)
+            except OSError:
+                status = None
+            if status is None:
+                self._counters['shell_keepalive_failures'] += 1
+                self.close()
+                return
+        self._schedule_keepalive()
+
+    def close(self):
+        """ log out and stop the keepalive """
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+            self._keepalive = None
+        task = self._keepalive_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            self._keepalive_task = None
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
+
+    async def async_close(self):
+        """ log out and wait for a running keepalive to finish """
+        task = self._keepalive_task
+        self.close()
+        if task is not None:
+            await asyncio.wait([task])
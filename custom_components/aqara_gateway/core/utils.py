@@ -1,10 +1,11 @@
 """ device info and utils """
-# pylint: disable=broad-except, too-many-lines
+# pylint: disable=broad-except
 import logging
 import re
 import uuid
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
 from aiohttp import web
 from homeassistant.components import persistent_notification
@@ -14,1974 +15,25 @@ from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.device_registry import DeviceRegistry
 from miio import Device, DeviceException
 
-from .const import AIOT_MODELS, SIGMASTAR_MODELS, NO_ALARM_MODE_MODELS, INFRARED_SUPPORTED_MODELS
+from .const import (
+    AIOT_MODELS,
+    DEFAULT_ENUM_OPTIONS,
+    ENUM_OPTIONS,
+    SIGMASTAR_MODELS,
+    NO_ALARM_MODE_MODELS,
+    INFRARED_SUPPORTED_MODELS,
+    IN_USE_MODELS,
+    SUPPORT_IN_USE,
+    SUPPORT_LOAD_POWER,
+    SUPPORT_LOAD_VOLTAGE,
+    SUPPORT_POWER_CONSUMPTION
+)
 
 SOFT_HACK_REALTEK = {"ssid": "\"\"", "pswd": "123123 ; passwd -d admin ; echo enable > /sys/class/tty/tty/enable; telnetd"}
 SOFT_HACK_SIGMASTAR = {"ssid": "\"\"", "pswd": "123123 ; passwd -d root ; /bin/riu_w 101e 53 3012 ; telnetd"}
 
 _LOGGER = logging.getLogger(__name__)
 
-# https://github.com/Koenkk/zigbee-herdsman-converters/blob/master/devices.js#L390
-# https://slsys.io/action/devicelists.html
-# All lumi models:
-#   https://github.com/rytilahti/python-miio/issues/699#issuecomment-643208618
-# Zigbee Model: [Manufacturer, Device Name, Device Model]
-# params: [lumi res name, xiaomi prop name, hass attr name, hass domain]
-# old devices uses params, new devices uses mi_spec
-DEVICES = [{
-    'lumi.gateway.acn01': ["Aqara", "Gateway M1S", "ZHWG15LM"],  # tested
-    'lumi.aircondition.acn05': ["Aqara", "AirCondition P3", "KTBL12LM"],  # xStars tested
-    # 'lumi.aircondition.acn04': ["Aqara", "AirCondition P3", "KTBL12LM"],
-    # 'lumi.acpartner.acn04': ["Aqara", "AirCondition P3", "KTBL12LM"],
-    'lumi.gateway.aeu01': ["Aqara", "Gateway M1S", "HM1S-G01"],
-    # 'lumi.gateway.iragl01': ["Aqara", "Gateway M2", "ZHWG12LM"],
-    'lumi.gateway.iragl7': ["Aqara", "Gateway M2", "HM2-G01"],  # old Global/EU version
-    'lumi.gateway.iragl5': ["Aqara", "Gateway M2", "ZHWG12LM"],  # tested
-    'lumi.gateway.agl001': ["Aqara", "Gateway M2", "HM2-G01"],   # new Global version
-    'lumi.gateway.sacn01': ["Aqara", "Smart Hub H1", "QBCZWG11LM"],
-    'lumi.gateway.aqcn02': ["Aqara", "Hub E1", "ZHWG16LM"],  # tested
-    'lumi.gateway.aqcn03': ["Aqara", "Hub E1", "HE1-G01"],  # E1 Global version
-    'lumi.camera.gwagl02': ["Aqara", "Camera Hub G2H", "ZNSXJ12LM"],  # tested
-    'lumi.camera.gwag03': ["Aqara", "Camera Hub G2H", "CH-H01"],  # tested
-    'lumi.camera.gwpagl01': ["Aqara", "Camera Hub G3", "ZNSXJ13LM"],  # tested
-    'lumi.camera.gwpgl1': ["Aqara", "Camera Hub G3", "CH-H03"],
-    'lumi.camera.agl001': ["Aqara", "Camera Hub G2H Pro", "ZNSXJ15LM"],
-    'lumi.camera.acn003': ["Aqara", "Camera Hub G2H Pro", "ZNSXJ15LM"],
-    'lumi.gateway.iragl8': ["Aqara", "Gateway M2 2022", "ZHWG19LM"],  # tested
-    'lumi.gateway.acn004': ["Aqara", "Gateway M1S 2022", "ZHWG20LM"],  # tested
-    'lumi.gateway.acn012': ["Aqara", "Gateway M3", "ZHWG24LM"],
-    'lumi.gateway.agl004': ["Aqara", "Gateway M3", "HM-G01D"],
-    'lumi.gateway.acn008': ["Aqara", "Gateway M1S Gen2", "ZHWG22LM"],
-    'lumi.gateway.agl002': ["Aqara", "Gateway M1S Gen2", "HM1S-G02"],
-    'lumi.gateway.acn011': ["Aqara", "Outlet Hub V1", "AHWG11LM"],
-    'lumi.camera.acn008': ["Aqara", "Camera Hub G5 Pro (WiFi)", "ZNSXJ21LM"],
-    'lumi.camera.acn009': ["Aqara", "Camera Hub G5 Pro (PoE)", "ZNSXJ18LM"],
-    'lumi.camera.acn010': ["Aqara", "Camera Hub G5 Pro (PoE)", "CH-C03D/E"],
-    'lumi.camera.acn011': ["Aqara", "Camera Hub G5 Pro (WiFi)", "CH-C07D/E"],
-    'lumi.gateway.agl008': ["Aqara", "Hub M100", "ZHWG24LM"],
-    'lumi.gateway.agl010': ["Aqara", "Hub M100", "ZHWG25LM"],
-    'lumi.camera.acn017': ["Aqara", "Doorbell G410", "ZNKSML05"],
-    'lumi.camera.agl006': ["Aqara", "Doorbell G410", "CH-C09D"],   # Global version
-    'lumi.gateway.agl011': ["Aqara", "Gateway M200", "AG047GLB02"],   # Global version
-    'lumi.gateway.agl013': ["Aqara", "Gateway M300", "HM-G04E"],
-    'params': [
-        ['8.0.2012', None, 'power_tx', None],
-        ['8.0.2024', None, 'channel', None],
-        ['8.0.2081', None, 'pairing_stop', None],
-        ['8.0.2082', None, 'removed_did', None],
-        ['8.0.2084', None, 'added_device', None],  # new devices added (info)
-        ['8.0.2092', None, 'ir_shoot', None],
-        ['8.0.2103', None, 'device_model', None],  # new device model
-        ['8.0.2109', None, 'paring', None],
-        ['8.0.2110', None, 'discovered_mac', None],  # new device discovered
-        ['8.0.2111', None, 'pair_command', None],  # add new device
-        ['8.0.2157', None, 'panId', None],
-        ['8.0.2155', None, 'cloud', None],  # {"cloud_link":0}
-        ['0.3.85', 'illumination', 'illuminance', 'sensor'],
-        [None, 'light_level', 'brightness', None],
-        [None, 'hs_color', 'hs_color', None],
-        [None, 'rgb_color', 'rgb_color', 'light'],
-#        [None, None, 'alarm', 'alarm_control_panel'],
-        [None, None, 'pair', 'remote'],
-    ]
-}, {
-    # on/off, power measurement
-    'lumi.plug': ["Xiaomi", "Plug", "ZNCZ02LM"],  # tested
-    'lumi.plug.mitw01': ["Xiaomi", "Plug TW", "ZNCZ03LM"],
-    'lumi.plug.mmeu01': ["Xiaomi", "Plug EU", "ZNCZ04LM"],
-    'lumi.plug.maus01': ["Xiaomi", "Plug US", "ZNCZ12LM"],
-    'lumi.ctrl_86plug': ["Aqara", "Socket", "QBCZ11LM"],
-    'lumi.plug.macn01': ["Aqara", "Plug T1", "ZNCZ15LM"],
-    # 'lumi.plug.maeu01': ["Aqara", "Plug EU", "SP-EUC01"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'neutral_0', 'switch', 'switch'],  # or channel_0?
-    ]
-}, {
-    'lumi.ctrl_86plug.aq1': ["Aqara", "Socket", "QBCZ11LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'switch', 'switch'],  # @to4ko
-    ]
-}, {
-    # on/off, power measurement
-    'lumi.plug.sacn03': ["Aqara", "Socket H1 USB", "QBCZ15LM"],  # @miniknife88
-    'lumi.plug.acn003': ["Aqara", "Socket X1 USB", "QBCZ16LM"],
-    'lumi.plug.acn005': ["Aqara", "Socket H2", "ZNQBCZ11LM"],  # @kiminih
-    'params': [
-        ['0.11.85', 'load_voltage', 'power', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'neutral_0', 'switch', 'switch'],
-        ['4.2.85', 'neutral_1', 'switch_usb', 'switch'],
-    ]
-}, {
-    'lumi.ctrl_ln1': ["Aqara", "Single Wall Switch", "QBKG11LM"],
-    'lumi.ctrl_ln1.aq1': ["Aqara", "Single Wall Switch", "QBKG11LM"],
-    'lumi.switch.b1nacn02': ["Aqara", "Single Wall Switch D1", "QBKG23LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'neutral_0', 'switch', 'switch'],  # or channel_0?
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # dual channel on/off, power measurement
-    'lumi.relay.c2acn01': ["Aqara", "Relay", "LLKZMK11LM"],  # tested
-    'lumi.ctrl_ln2': ["Aqara", "Double Wall Switch", "QBKG12LM"],
-    'lumi.ctrl_ln2.aq1': ["Aqara", "Double Wall Switch", "QBKG12LM"],
-    'lumi.switch.b2nacn02': ["Aqara", "Double Wall Switch D1", "QBKG24LM"],
-    'params': [
-        ['0.11.85', 'load_voltage', 'power', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        # ['0.14.85', None, '?', 'sensor'],  # 3.54, 5.01, 6.13
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        # [?, 'enable_motor_mode', 'interlock', None]
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # four channel on/off, power measurement
-    'lumi.relay.c4acn01': ["Aqara", "Relay", "LLKZMK11LM"],
-    'params': [
-        ['0.11.85', 'load_voltage', 'power', None],
-        ['0.12.85', 'channel_0_load_power', 'power', 'sensor'],
-        ['0.13.85', 'channel_0', 'consumption', 'sensor'],
-        ['0.22.85', 'channel_1_load_power', 'power', 'sensor'],
-        ['0.23.85', 'channel_1', 'consumption', 'sensor'],
-        ['0.32.85', 'channel_2_load_power', 'power', 'sensor'],
-        ['0.33.85', 'channel_2', 'consumption', 'sensor'],
-        ['0.42.85', 'channel_3_load_power', 'power', 'sensor'],
-        ['0.43.85', 'channel_3', 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['4.4.85', 'channel_3', 'channel 4', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.ctrl_neutral1': ["Aqara", "Single Wall Switch", "QBKG04LM"],
-    'params': [
-        ['4.1.85', 'neutral_0', 'switch', 'switch'],  # @vturekhanov
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # on/off
-    'lumi.switch.b1lacn02': ["Aqara", "Single Wall Switch D1", "QBKG21LM"],
-    'lumi.switch.l1acn1': ["Aqara", "Single Wall Switch H1", "QBKG27LM"],  # @firesunCN
-    'lumi.switch.b1lacn01': ["Aqara", "Single Wall Switch T1", "QBKG17LM"],
-    'params': [
-        ['4.1.85', 'channel_0', 'switch', 'switch'],  # or neutral_0?
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # dual channel on/off
-    'lumi.ctrl_neutral2': ["Aqara", "Double Wall Switch", "QBKG03LM"],
-    'params': [
-        ['4.1.85', 'neutral_0', 'channel 1', 'switch'],  # @to4ko
-        ['4.2.85', 'neutral_1', 'channel 2', 'switch'],  # @to4ko
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b2lacn02': ["Aqara", "Double Wall Switch D1", "QBKG22LM"],
-    'lumi.switch.l2acn1': ["Aqara", "Double Wall Switch H1", "QBKG28LM"],  # @firesunCN
-    'lumi.switch.b2lacn01': ["Aqara", "Double Wall Switch T1", "QBKG18LM"],
-    'params': [
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # triple channel on/off, no neutral wire
-    'lumi.switch.l3acn3': ["Aqara", "Triple Wall Switch D1", "QBKG25LM"],
-    'lumi.switch.l3acn1': ["Aqara", "Triple Wall Switch H1", "QBKG29LM"],  # @firesunCN
-    'lumi.switch.b3l01': ["Aqara", "Triple Wall Switch T1", "QBKG33LM"],
-    'params': [
-        ['4.1.85', 'neutral_0', 'channel 1', 'switch'],  # @to4ko
-        ['4.2.85', 'neutral_1', 'channel 2', 'switch'],  # @to4ko
-        ['4.3.85', 'neutral_2', 'channel 3', 'switch'],  # @to4ko
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire, thanks @Mantoui
-    'lumi.switch.n3acn3': ["Aqara", "Triple Wall Switch D1", "QBKG26LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.controller.a4acn1': ["Aqara", "Smart Scene Panel Switch S1", "ZNCJMB14LM"],
-    'params': [
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['4.14.85', None, 'auto_brightness', 'switch'],
-        ['4.23.85', None, 'mute', 'switch'],
-        ['4.46.85', None, 'screensaver', 'switch'],
-        ['8.0.2207', None, 'turn_off_light_as_time', 'sensor'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['14.1.111', None, 'alarm_status', 'sensor']
-    ]
-}, {
-    # cube action, no retain
-    'lumi.sensor_cube': ["Aqara", "Cube", "MFKZQ01LM"],
-    'lumi.sensor_cube.aqgl01': ["Aqara", "Cube", "MFKZQ01LM"],  # tested
-    'lumi.remote.cagl01': ["Aqara", "Cube T1", "MFKZQ11LM"],  # @Kris
-    'params': [
-        ['0.2.85', None, 'duration', None],
-        ['0.3.85', None, 'angle', None],
-        ['0.21.85', None, 'duration', None],
-        ['0.30.85', None, 'angle', None],
-        ['13.1.85', None, 'action', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # cube action, no retain
-    'lumi.remote.cagl02': ["Aqara", "Cube T1 Pro", "MFKZQ12LM"],  # @Kris
-    'params': [
-        ['0.2.85', None, 'angle', None],
-        ['0.3.85', None, 'duration', None],
-        ['0.21.85', None, 'angle', None],
-        ['0.30.85', None, 'duration', None],
-        ['13.1.85', None, 'action', 'binary_sensor'],
-        ['13.101.85', None, 'scense_up', None],
-        ['13.103.85', None, 'scenes_to', None],
-        ['14.35.85', None, 'mode', None],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # light with brightness and color temp
-    'lumi.light.aqcn02': ["Aqara", "Bulb", "ZNLDP12LM"],
-    'lumi.light.cwopcn02': ["Aqara", "Opple MX650", "XDD12LM"],
-    'lumi.light.cwopcn03': ["Aqara", "Opple MX480", "XDD13LM"],
-    'ikea.light.led1545g12': ["IKEA", "Bulb E27 980 lm", "LED1545G12"],
-    'ikea.light.led1546g12': ["IKEA", "Bulb E27 950 lm", "LED1546G12"],
-    'ikea.light.led1536g5': ["IKEA", "Bulb E14 400 lm", "LED1536G5"],
-    'ikea.light.led1537r6': ["IKEA", "Bulb GU10 400 lm", "LED1537R6"],
-    'params': [
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['14.1.85', 'light_level', 'brightness', None],
-        ['14.2.85', 'colour_temperature', 'color_temp', None],
-    ]
-}, {
-    # light with brightness and color temp
-    'lumi.light.cwac02': ["Aqara", "Bulb T1", "ZNLDP13LM"],  # @Kris
-    'lumi.light.acn014': ["Aqara", "Bulb T1", "ZNLDP14LM"],
-    'lumi.light.acn015': ["Aqara", "Sun Light H1", "QKD01LM"],
-    'lumi.light.acn003': ["Aqara", "L1-350 Ceiling Light", "ZNXDD01LM"],
-    'lumi.light.acn036': ["Aqara", "Spotlight V1", "ZNSD01LM"],
-    'params': [
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['1.6.85', None, 'ms_to_turn_on', None],
-        ['1.7.85', 'light_level', 'brightness', None],
-        ['1.9.85', 'colour_temperature', 'color_temp', None],
-        ['1.14.85', None, 'ms_to_turn_off', None],
-    ]
-}, {
-    # light with brightness and color temp, rgb color
-    'lumi.light.rgbac1': ["Aqara", "RGBW LED Controller T1", "ZNTGMK11LM"],  # @miniknife88
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['14.1.85', 'light_level', 'brightness', None],
-        ['14.2.85', 'colour_temperature', 'color_temp', None],
-        ['14.8.85', 'rgb_color', 'hs_color', None],
-        [None, 'hs_color', 'hs_color', None],
-    ]
-}, {
-    # light with brightness
-    'ikea.light.led1623g12': ["IKEA", "Bulb E27 1000 lm", "LED1623G12"],
-    'ikea.light.led1650r5': ["IKEA", "Bulb GU10 400 lm", "LED1650R5"],
-    'ikea.light.led1649c5': ["IKEA", "Bulb E14", "LED1649C5"],  # tested
-    'lumi.light.cbacn1': ["Aqara", "LED Controller T1", "HLQDQ01LM"],
-    'params': [
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['14.1.85', 'light_level', 'brightness', None],
-        ['14.11.85', None, 'dual_color_temperature_mode', None],
-        ['14.7.85', None, 'dynamic', None],
-    ]
-}, {
-    # light with brightness and color temp
-    'lumi.light.cwacn1': ["Aqara", "0-10V Dimmer", "ZNTGMK12LM"],  # @miniknife88
-    'lumi.light.cwjwcn01': ["Aqara", "Jiawen 0-12V Dimmer", "Z204"],  # @Kris
-    'lumi.light.acn004': ["Aqara", "Smart Dimmer Controller T1 Pro", "SSWQD02LM"],
-    'lumi.light.wjwcn01': ["Aqara", "Spot Light (Adjustable Brightness)", ""],
-    'lumi.light.acn026': ["Aqara", "Downlight T2", "LTSZNSD04LM"],
-    'lumi.light.acn025': ["Aqara", "Spotlight T2 (36 degree)", "LTSZNSD03LM"],
-    'lumi.light.acn024': ["Aqara", "Spotlight T2 (24 degree)", "LTSZNSD02LM"],
-    'lumi.light.acn023': ["Aqara", "Spotlight T2 (15 degree)", "LTSZNSD01LM"],
-    'lumi.light.acn131': ["Aqara", "Downlight T3", "LGYCDD02LM"],
-    'lumi.light.acn132': ["Aqara", "Colorful Light Strip T3", "LGYCDD01LM"],
-    'lumi.light.acn130': ["Aqara", "Spotlight T3 (36 degree)", "LGYCDD03LM"],
-    'lumi.light.acn129': ["Aqara", "Spotlight T3 (24 degree)", "LGYCDD04LM"],
-    'lumi.light.acn128': ["Aqara", "Spotlight T3", "LGYCDD05LM"],
-    'aqara.light.acn004': ["Aqara", "Downlight T3", ""],
-    'aqara.light.acn003': ["Aqara", "Spotlight T3 (36 degree)", ""],
-    'aqara.light.acn002': ["Aqara", "Spotlight T3 (24 degree)", ""],
-    'aqara.light.acn001': ["Aqara", "Spotlight T3 (15 degree)", ""],
-    'lumi.light.acn006': ["Aqara", "Smart Spot Light (24 Degree)", "ZNCXGDD01LM"],
-    'lumi.light.acn007': ["Aqara", "Smart Grille Light (6-Lamp)", "ZNCXGDD02LM"],
-    'lumi.light.acn008': ["Aqara", "Smart Grille Light (12-Lamp)", "ZNCXGDD03LM"],
-    'lumi.light.acn009': ["Aqara", "Smart Light (30cm)", "ZNCXGDD04LM"],
-    'lumi.light.acn010': ["Aqara", "Smart Light (60cm)", "ZNCXGDD05LM"],
-    'lumi.light.acn011': ["Aqara", "Smart Pendant Light", "ZNCXGDD06LM"],
-    'lumi.light.acn012': ["Aqara", "Smart Foldable Grille Light (6-Lamp)", "ZNCXGDD07LM"],
-    'params': [
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['14.1.85', 'light_level', 'brightness', None],
-        ['14.2.85', 'colour_temperature', 'color_temp', None]
-    ]
-}, {
-    # light with brightness and color temp
-    'lumi.dimmer.rcbac1': ["Aqara", "RGBW LED Dimmer", "ZNDDMK11LM"],  # @Kris
-    'lumi.dimmer.acn005': ["Aqara", "RGBW LED Dimmer T1 (240W)", "AL010CNW03"],
-    'lumi.dimmer.acn004': ["Aqara", "RGBW LED Dimmer T1 (120W)", "AL010CNW02"],
-    'lumi.dimmer.acn003': ["Aqara", "RGBW LED Dimmer T1 (60W)", "AL010CNW01"],
-    'lumi.dimmer.acn002': ["Aqara", "RGBW LED Dimmer T2 (24W)", ""],
-    'lumi.dimmer.acn001': ["Aqara", "RGBW LED Dimmer T2", ""],
-    'lumi.light.acn132': ["Aqara", "LED Strip T1", "LGYCDD01LM"],
-    'params': [
-        ['1.10.85', None, 'present_mode', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['14.1.85', 'light_level', 'brightness', None],
-        ['14.2.85', 'colour_temperature', 'color_temp', None],
-        ['14.5.85', 'rgb_color', 'rgb_color', None],
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['14.12.85', 'light_level', 'brightness', None],
-        ['14.16.85', 'colour_temperature', 'color_temp', None],
-        ['4.2.85', 'power_status', 'sub light', 'light'],
-        ['14.46.85', None, 'dual_color_temperature_mode', None],
-        ['8.0.2022', None, 'ambilight', None],
-        ['8.0.2150', None, 'dynamic', None],
-    ]
-}, {
-    # light with brightness and color temp
-    'lumi.light.acn031': ["Aqara", "Ceiling Lamp T1 ", "HCXDD11LM"],
-    'lumi.light.acn032': ["Aqara", "Ceiling Lamp T1 (40W)", "HCXDD12LM"],
-    'lumi.light.acn033': ["Aqara", "Ceiling Lamp H1", "HCXDD13LM"],
-    'params': [
-        ['1.10.85', None, 'present_mode', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['1.7.85', 'light_level', 'brightness', None],
-        ['1.9.85', 'colour_temperature', 'color_temp', None],
-        ['4.2.85', 'power_status', 'sub light', 'light'],
-    ]
-}, {
-    # button switch, no retain
-    'lumi.sensor_switch': ["Xiaomi", "Button", "WXKG01LM"],
-    'lumi.sensor_switch.aq2': ["Aqara", "Button", "WXKG11LM"],
-    'lumi.remote.b1acn01': ["Aqara", "Button", "WXKG11LM"],
-    'lumi.remote.b1acn02': ["Aqara", "Button", "WXKG12LM"],  # @darkbao
-    'lumi.sensor_switch.aq3': ["Aqara", "Shake Button", "WXKG12LM"],
-    'lumi.sensor_86sw1': ["Aqara", "Single Wall Button", "WXKG03LM"],
-    'lumi.remote.b186acn01': ["Aqara", "Single Wall Button", "WXKG03LM"],
-    'lumi.remote.b186acn02': ["Aqara", "Single Wall Button D1", "WXKG06LM"],
-    'lumi.remote.b186acn03': ["Aqara", "Single Wall Button T1", "WXKG05LM"],
-    'params': [
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # multi button switch, no retain
-    'lumi.sensor_86sw2': ["Aqara", "Double Wall Button", "WXKG02LM"],
-    'lumi.remote.b286acn01': ["Aqara", "Double Wall Button", "WXKG02LM"],
-    'lumi.sensor_86sw2.es1': ["Aqara", "Double Wall Button", "WXKG02LM"],
-    'lumi.remote.b286acn02': ["Aqara", "Double Wall Button D1", "WXKG07LM"],
-    'lumi.remote.b286opcn01': ["Aqara", "Opple Two Button", "WXCJKG11LM"],
-    'lumi.remote.b486opcn01': ["Aqara", "Opple Four Button", "WXCJKG12LM"],
-    'lumi.remote.b686opcn01': ["Aqara", "Opple Six Button", "WXCJKG13LM"],
-    'params': [
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.4.85', None, 'button_4', None],
-        ['13.6.85', None, 'button_5', None],
-        ['13.7.85', None, 'button_6', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # temperature and humidity sensor
-    'lumi.sensor_ht': ["Xiaomi", "TH Sensor", "WSDCGQ01LM"],
-    'params': [
-        ['0.1.85', 'temperature', 'temperature', 'sensor'],
-        ['0.2.85', 'humidity', 'humidity', 'sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # temperature, humidity and pressure sensor
-    'lumi.weather': ["Aqara", "TH Sensor", "WSDCGQ11LM"],
-    'lumi.sensor_ht.agl02': ["Aqara", "TH Sensor", "WSDCGQ12LM"],
-    'params': [
-        ['0.1.85', 'temperature', 'temperature', 'sensor'],
-        ['0.2.85', 'humidity', 'humidity', 'sensor'],
-        ['0.3.85', 'pressure', 'pressure', 'sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # temperature, humidity, PM2.5 and CO2 sensor
-    'lumi.airm.fhac01': ["Aqara", "Air Quality Monitor S1", "KQJCMB11LM"], # @justbin95
-    'params': [
-        ['0.1.85', 'temperature', 'temperature', 'sensor'],
-        ['0.2.85', 'humidity', 'humidity', 'sensor'],
-        ['0.6.85', None, 'carbon_dioxide', 'sensor'],
-        ['0.19.85', None, 'pm25', 'sensor'],
-        ['0.41.85', None, 'pm1', 'sensor'],
-        ['0.42.85', None, 'pm10', 'sensor'],
-    ]
-}, {
-    # door window sensor
-    'lumi.sensor_magnet': ["Xiaomi", "Door Sensor", "MCCGQ01LM"],
-    'lumi.sensor_magnet.aq2': ["Aqara", "Door Sensor", "MCCGQ11LM"],
-    'lumi.magnet.akr01': ["Aqara", "Door Sensor P1", "MCCGQ13LM"],
-    'lumi.magnet.ac01': ["Aqara", "Door Sensor P1", "MCCGQ13LM"],
-    'params': [
-        ['3.1.85', 'status', 'contact', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['14.35.85', None, 'mode', None]
-    ]
-}, {
-    # motion sensor
-    'lumi.sensor_motion': ["Xiaomi", "Motion Sensor", "RTCGQ01LM"],
-    'params': [
-        ['3.1.85', None, 'motion', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # motion sensor with illuminance
-    'lumi.sensor_motion.aq2': ["Aqara", "Motion Sensor", "RTCGQ11LM"],
-    'lumi.motion.ac02': ["Aqara", "Motion Sensor P1", "RTCGQ14LM"],
-    'params': [
-        ['0.3.85', 'lux', 'illuminance_lux', None],
-        ['0.4.85', 'illumination', 'illuminance', 'sensor'],
-        ['3.1.85', None, 'motion', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.motion.ac01': ["Aqara", "Presence Detector FP1", "RTCGQ12LM"],
-    'lumi.sensor_occupy.agl1': ["Aqara", "AI Presence Detector FP1E", "RTCZCGQ13LM"],
-    'params': [
-        ['3.51.85', None, 'occupancy', 'binary_sensor'],
-        ['8.0.2115', None, 'detect_interval', None],
-        ['4.22.85', None, '4.22.85', None],
-        ['14.48.85', None, '14.48.85', None],
-        ['14.49.85', None, '14.49.85', None],
-        ['14.92.85', None, 'edge_region', None],
-        ['14.93.85', None, 'exits_entrances_region', None],
-        ['14.94.85', None, 'interference_region', None],
-        ['14.56.85', None, 'detecting_region', None],
-        ['13.21.85', None, 'occupancy_region', 'sensor'],
-        ['13.27.85', None, 'movements', 'sensor'],
-        ['4.1.85', None, 'monitoring_mode', 'select'],
-        ['4.2.85', None, 'reverted_mode', 'select'],
-        ['14.47.85', None, 'approaching_distance', 'select'],
-    ]
-}, {
-    'lumi.sensor_occupy.agl8': ["Aqara", "AI Presence Detector FP300", "PS-S04E"],
-    'params': [
-        ['0.1.85', 'temperature', 'temperature', 'sensor'],
-        ['0.2.85', 'humidity', 'humidity', 'sensor'],
-        ['0.3.85', None, 'illuminance', 'sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['3.2.85', None, 'motion', 'binary_sensor'],
-        ['3.51.85', None, 'occupancy', 'binary_sensor'],
-    ]
-}, {
-    # water leak sensor
-    'lumi.sensor_wleak.aq1': ["Aqara", "Water Leak Sensor", "SJCGQ11LM"],
-    'lumi.flood.agl02': ["Aqara", "Water Leak Sensor T1", "SJCGQ12LM"],  # @Kris
-    'params': [
-        ['3.1.85', 'alarm', 'moisture', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # vibration sensor
-    'lumi.vibration.aq1': ["Aqara", "Vibration Sensor", "DJT11LM"],
-    'params': [
-        ['0.1.85', None, 'bed_activity', None],
-        ['0.2.85', None, 'tilt_angle', None],
-        ['0.3.85', None, 'vibrate_intensity', None],
-        ['13.1.85', None, 'vibration', None],
-        ['14.1.85', None, 'vibration_level', None],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        [None, None, 'action', 'binary_sensor']
-    ]
-}, {
-    'lumi.sen_ill.mgl01': ["Xiaomi", "Light Sensor", "GZCGQ01LM"],
-    'params': [
-        ['0.3.85', None, 'illuminance', 'sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.sen_ill.agl01': ["Aqara", "Light Sensor T1", "GZCGQ11LM"],
-    'params': [
-        ['0.3.85', None, 'illuminance', 'sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['8.0.2097', None, 'detect_interval', None],
-    ]
-}, {
-    'lumi.sensor_smoke.acn03': ["Aqara", "Smoke Sensor", "JTYJ-GD-02LM/BW"],
-    'params': [
-        ['4.12.85', None, 'mute', 'binary_sensor'],
-        ['4.15.85', None, 'self test', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['8.0.2232', 'alarm', 'smoke', 'binary_sensor'],
-        ['8.0.2234', 'alarm', 'error', 'binary_sensor'],
-        ['13.28.85', None, 'smoke level', 'sensor'],
-    ]
-}, {
-    'lumi.sensor_smoke': ["Honeywell", "Smoke Sensor", "JTYJ-GD-01LM/BW"],
-    'params': [
-        ['0.1.85', 'density', 'smoke density', 'sensor'],
-        ['13.1.85', 'alarm', 'smoke', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.sensor_natgas': ["Aqara", "Gas Sensor", "JTQJ-BF-01LM/BW"],
-    'params': [
-        ['0.1.85', 'density', 'gas density', 'sensor'],
-        ['13.1.85', 'alarm', 'gas', 'binary_sensor'],
-    ]
-}, {
-    'lumi.sensor_gas.acn02': ["Honeywell", "Gas Sensor", "JT-BZ-01AQ/A"],
-    'params': [
-        ['0.5.85', 'density', 'gas density', 'sensor'],
-        ['13.1.85', 'alarm', 'gas', 'binary_sensor'],
-    ]
-}, {
-    'lumi.curtain': ["Aqara", "Curtain", "ZNCLDJ11LM"],
-    'lumi.curtain.aq2': ["Aqara", "Roller Shade", "ZNGZDJ11LM"],
-    'lumi.curtain.hagl07': ["Aqara", "Curtain C2", "ZNCLDJ14LM"],   # @darkbao
-    'lumi.curtain.vagl02': ["Aqara", "Curtain T1", "ZNGZDJ15LM"],
-    'lumi.curtain.acn04': ["Aqara", "Curtain C3", "ZNCLDJ01LM"],
-    'lumi.curtain.acn015': ["Aqara", "Curtain T2", "ZNGZDJ16LM"],
-    'params': [
-        ['1.1.85', 'curtain_level', 'position', None],
-        ['14.2.85', None, 'motor', 'cover'],
-        ['14.3.85', 'cfg_param', 'cfg_param', None],
-        ['14.4.85', 'run_state', 'run_state', None],
-    ]
-}, {
-    'lumi.curtain.hagl04': ["Aqara", "Curtain B1", "ZNCLDJ12LM"],
-    'params': [
-        ['1.1.85', 'curtain_level', 'position', None],
-        ['14.2.85', None, 'motor', 'cover'],
-        ['14.3.85', 'cfg_param', 'cfg_param', None],
-        ['14.4.85', 'run_state', 'run_state', None],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.lock.aq1': ["Aqara", "Door Lock S1", "ZNMS11LM"],
-    'lumi.lock.acn02': ["Aqara", "Door Lock S2", "ZNMS12LM"],
-    'params': [
-        ['13.1.85', None, 'key_id', 'sensor'],
-        ['13.20.85', 'lock_state', 'lock', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.lock.acn03': ["Aqara", "Door Lock S2 Pro", "ZNMS13LM"],
-    'lumi.lock.acn04': ["Aqara", "Door Lock HL", "ZNMS15LM"],
-    'lumi.lock.acn05': ["Aqara", "Door Lock S2 Pro-B", "ZNMS16LM"],
-    'params': [
-        ['3.1.85', 'reverse_lock_state', 'lock', 'binary_sensor'],
-        ['13.26.85', 'door_state', 'door', 'binary_sensor'],
-        ['8.0.2001', 'bat_percent', 'battery', 'sensor'],
-        ['13.1.85', None, 'key_id', None],
-        ['13.25.85', None, 'lock_control', None],
-        ['13.28.85', None, 'lock_state', None],
-        [None, None, 'action', 'sensor'],
-    ]
-}, {
-    'aqara.lock.wbzac1': ["Aqara", "Door Lock P100", "ZNMS19LM"],
-    'params': [
-        ['8.0.2148', None, 'timestamp', None],
-        ['13.1.85', None, 'unlock from inside', None],
-        ['13.2.85', None, 'unlock by fingerprint', None],
-        ['13.3.85', None, 'unlock by password', None],
-        ['13.4.85', None, 'unlock by nfc', None],
-        ['13.5.85', None, 'unlock by homekit', None],
-        ['13.6.85', None, 'unlock by bluetooth', None],
-        ['13.7.85', None, 'unlock by key', None],
-        [None, None, 'key_id', 'sensor'],
-        ['13.8.85', None, 'open in away mode', None],
-        ['13.10.85', None, 'lock by handle', 'binary_sensor'],  # Lock State
-        ['13.11.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.12.85', None, 'away mode', 'binary_sensor'],
-        ['13.13.85', None, 'someone detected', None],
-        ['13.14.85', None, 'too much failure', None],
-        ['13.15.85', None, 'key_type', None],
-        ['13.20.85', 'lock_state', 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.30.85', None, 'li battery notify', None],
-        ['13.31.85', 'voltage', 'voltage', None],
-        ['13.32.85', 'li battery', 'li battery', 'sensor'],
-        ['13.33.85', 'temperature', 'li battery temperature', None],
-        ['13.37.85', 'battery', 'battery', 'sensor'],
-        ['13.40.85', None, 'password number', None],
-        ['13.43.85', None, 'nfc added', None],
-        ['13.50.85', None, 'wifi_info', None],
-        ['13.51.85', None, 'wifi_connect', None],
-        ['13.60.85', None, 'verification failed', None],
-        ['14.1.85', None, 'camera connected', None],
-        ['14.83.85', None, 'bluetooth', None],
-        [None, None, 'lock_event', 'sensor'],
-    ]
-}, {
-    'aqara.lock.bzacn3': ["Aqara", "Door Lock N100", "ZNMS16LM"],
-    'aqara.lock.bzacn4': ["Aqara", "Door Lock N100", "ZNMS16LM"],
-    'params': [
-        ['8.0.2148', None, 'timestamp', None],
-        ['13.17.85', 'lock_state', 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.18.85', None, 'key_type', None],
-        ['13.31.85', None, 'lock by handle', 'binary_sensor'],  # Lock State
-        ['13.32.85', None, 'verification failed', None],
-        ['13.33.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.41.85', None, 'unlock from inside', None],
-        ['13.42.85', None, 'unlock by fingerprint', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],
-        ['13.45.85', None, 'unlock by homekit', None],
-        ['13.49.85', None, 'open in away mode', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', 'voltage', 'voltage', None],
-        ['13.56.85', 'battery', 'battery', 'sensor'],
-#        ['13.57.85', None, 'battery notify', None],
-        ['13.60.85', None, 'verification failed', None],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.63.85', None, 'user added', None],
-        ['13.64.85', None, 'user removed', None],
-        ['13.65.85', None, 'all user removed', None],
-        ['13.66.85', None, 'nfc added', None],
-        ['13.67.85', None, 'nfc removed', None],
-        ['13.68.85', None, 'homekit reset', None],
-        ['13.88.85', None, 'door', None],
-        ['14.83.85', None, 'bluetooth', None],
-        [None, None, 'lock_event', 'sensor'],
-    ]
-}, {
-    'aqara.lock.dacn03': ["Aqara", "Door Lock H100", "ZNMS21LM"],
-    'params': [
-        ['4.20.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.31.85', 'lock_state', 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.51.85', None, 'unlock from inside', None],
-        ['13.42.85', None, 'unlock by fingerprint', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],
-        ['13.45.85', None, 'unlock by homekit', None], # not tested
-        ['13.46.85', None, 'unlock by temporary password', None],
-        ['13.49.85', None, 'open in away mode', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', 'voltage', 'voltage', None],
-        ['13.56.85', 'li battery', 'li battery', 'sensor'],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.69.85', 'temperature', 'li battery temperature', None],
-        ['13.88.85', None, 'door', None],
-        ['4.8.85', None, 'camera connected', None],
-        [None, None, 'lock_event', 'sensor'],
-    ]
-}, {
-    'aqara.lock.eicn01': ["Aqara", "Door Lock A100", "ZNMS02ES"],
-    'aqara.lock.acn001': ["Aqara", "Door Lock A100", "ZNMS02ES"],
-    'aqara.lock.agl002': ["Aqara", "Door Lock A100", "ZNMS02ES"],
-    'params': [
-        ['8.0.2148', None, 'timestamp', None],
-        ['13.17.85', 'lock_state', 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.18.85', None, 'key_type', None],
-        ['13.31.85', None, 'lock by handle', 'binary_sensor'],  # Lock State
-        ['13.33.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.37.85', None, 'verification failed', None],
-        ['13.41.85', None, 'unlock from inside', None],
-        ['13.42.85', None, 'unlock by fingerprint', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],
-        ['13.45.85', None, 'unlock by homekit', None],
-        ['13.46.85', None, 'unlock by temporary password', None],
-        ['13.49.85', None, 'open in away mode', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', 'voltage', 'voltage', None],
-        ['13.56.85', 'battery', 'battery', 'sensor'],
-        ['13.57.85', None, 'battery notify', None],
-        ['13.60.85', None, 'verification failed', None],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.63.85', None, 'user added', None],
-        ['13.64.85', None, 'user removed', None],
-        ['13.65.85', None, 'all user removed', None],
-        ['13.66.85', None, 'nfc added', None],
-        ['13.67.85', None, 'nfc removed', None],
-        ['13.68.85', None, 'homekit reset', None],
-        ['13.88.85', None, 'door', None],
-        ['14.83.85', None, 'bluetooth', None],
-        [None, None, 'lock_event', 'sensor'],
-    ]
-}, {
-    'aqara.lock.aqgl01': ["Aqara", "Smart Door Lock D100", "ZNMS20LM"],
-    'params': [
-        ['13.17.85', None, 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.18.85', None, 'key_type', None],
-        ['13.31.85', None, 'auto locking', 'binary_sensor'],  # Lock State
-        ['13.33.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.37.85', None, 'verification failed', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],  # not tested
-        ['13.45.85', None, 'unlock by homekit', None],
-        ['13.46.85', None, 'unlock by temporary password', None],
-        ['13.47.85', None, 'unlock by key', None],
-        ['13.48.85', None, 'unlock by emergency knob', None],
-        ['13.51.85', None, 'unlock from inside', None],
-        ['13.53.85', None, 'unlock by face', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', None, 'voltage', None],
-        ['13.56.85', None, 'battery', 'sensor'],
-        ['13.57.85', None, 'battery notify', None],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.63.85', None, 'user added', None],
-        ['13.64.85', None, 'user removed', None],
-        ['13.65.85', None, 'all user removed', None],  # not tested
-        ['13.66.85', None, 'nfc added', None],  # not tested
-        ['13.67.85', None, 'nfc removed', None],  # not tested
-        ['13.68.85', None, 'homekit reset', None],  # not tested
-        ['13.88.85', None, 'door', None],
-        [None, None, 'lock_event', 'sensor'],
-    ]
-}, {
-    'aqara.lock.acn004': ["Aqara", "Smart Door Lock D200", "ZNMS23LM"],
-    'aqara.lock.acn005': ["Aqara", "Smart Door Lock D200i", "ML-D01D"],
-    'params': [
-        ['13.17.85', None, 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.18.85', None, 'key_type', None],
-        ['13.31.85', None, 'auto locking', 'binary_sensor'],  # Lock State
-        ['13.33.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.37.85', None, 'verification failed', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],  # not tested
-        ['13.45.85', None, 'unlock by homekit', None],
-        ['13.46.85', None, 'unlock by temporary password', None],
-        ['13.51.85', None, 'unlock from inside', None],
-        ['13.53.85', None, 'unlock by face', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', None, 'voltage', None],
-        ['13.56.85', None, 'battery', 'sensor'],
-        ['13.57.85', None, 'battery notify', None],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.63.85', None, 'user added', None],
-        ['13.64.85', None, 'user removed', None],
-        ['13.65.85', None, 'all user removed', None],  # not tested
-        ['13.66.85', None, 'nfc added', None],  # not tested
-        ['13.67.85', None, 'nfc removed', None],  # not tested
-        ['13.68.85', None, 'homekit reset', None],  # not tested
-        ['13.88.85', None, 'door', None],
-        [None, None, 'lock_event', 'sensor'],
-    ]
-}, {
-    'aqara.lock.acn002': ["Aqara", "Door Lock S100", "ZNMS22LM"],
-    'params': [
-        ['13.17.85', 'lock_state', 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.18.85', None, 'key_type', None],
-        ['13.31.85', None, 'lock by handle', 'binary_sensor'],  # Lock State
-        ['13.33.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.37.85', None, 'verification failed', None],
-        ['13.41.85', None, 'unlock from inside', None],
-        ['13.42.85', None, 'unlock by fingerprint', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],
-        ['13.45.85', None, 'unlock by homekit', None],
-        ['13.46.85', None, 'unlock by temporary password', None],
-        ['13.49.85', None, 'open in away mode', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', 'voltage', 'voltage', None],
-        ['13.56.85', 'battery', 'battery', 'sensor'],
-        ['13.57.85', None, 'battery notify', None],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.63.85', None, 'user added', None],
-        ['13.64.85', None, 'user removed', None],
-        ['13.65.85', None, 'all user removed', None],
-        ['13.66.85', None, 'nfc added', None],
-        ['13.67.85', None, 'nfc removed', None],
-        ['13.68.85', None, 'homekit reset', None],
-        ['13.88.85', None, 'door', None],
-        ['14.83.85', None, 'bluetooth', None],
-        [None, None, 'lock_event', 'sensor'],
-	]
-}, {
-    'aqara.lock.acn10': ["Aqara", "Door Lock U100", "DL-D01/DL-D01D"],
-    'params': [
-        ['13.17.85', 'lock_state', 'lock', 'sensor'],
-        [None, None, 'door_state', 'binary_sensor'],  # Door State
-        ['13.18.85', None, 'key_type', None],
-        ['13.31.85', None, 'lock by handle', 'binary_sensor'],  # Lock State
-        ['13.33.85', None, 'latch_state', 'binary_sensor'],  # Latch State
-        ['13.37.85', None, 'verification failed', None],
-        ['13.41.85', None, 'unlock from inside', None],
-        ['13.43.85', None, 'unlock by password', None],
-        ['13.44.85', None, 'unlock by nfc', None],
-        ['13.45.85', None, 'unlock by homekit', None],
-        ['13.46.85', None, 'unlock by temporary password', None],
-        ['13.49.85', None, 'open in away mode', None],
-        ['13.54.85', None, 'away mode', 'binary_sensor'],
-        [None, None, 'key_id', 'sensor'],
-        ['13.55.85', 'voltage', 'voltage', None],
-        ['13.56.85', 'battery', 'battery', 'sensor'],
-        ['13.57.85', None, 'battery notify', None],
-        ['13.62.85', None, 'timestamp', None],
-        ['13.63.85', None, 'user added', None],
-        ['13.64.85', None, 'user removed', None],
-        ['13.65.85', None, 'all user removed', None],
-        ['13.66.85', None, 'nfc added', None],
-        ['13.67.85', None, 'nfc removed', None],
-        ['13.68.85', None, 'homekit reset', None],
-        ['13.88.85', None, 'door', None],
-        ['14.83.85', None, 'bluetooth', None],
-        [None, None, 'lock_event', 'sensor'],
-	]
-}, {
-    'lumi.airrtc.tcpecn01': ["Aqara", "Thermostat S1", "KTWKQ02ES"],
-    'lumi.ctrl_hvac.es1': ["Aqara", "Thermostat", "KTWKQ01ES"],
-    # https://github.com/AlexxIT/XiaomiGateway3/issues/101
-    'lumi.airrtc.tcpecn02': ["Aqara", "Thermostat S2", "KTWKQ03ES"],
-    'params': [
-        ['3.1.85', 'power_status', 'power', None],
-        ['3.2.85', None, 'current_temperature', None],
-        ['14.2.85', 'ac_state', 'climate', 'climate'],
-        ['14.8.85', None, 'mode', None],
-        ['14.9.85', None, 'target_temperature', None],
-        ['14.10.85', None, 'fan_mode', None],
-        ['14.16.85', None, 'reboot', None],
-    ]
-}, {
-    'lumi.airrtc.tcpco2ecn01': ["Aqara", "Thermostat (CO2)", "KTWKQ04ES"],
-    'params': [
-        ['0.1.85', None, 'carbon_dioxide', 'sesor'],
-        ['3.1.85', 'power_status', 'power', None],
-        ['3.2.85', None, 'current_temperature', None],
-        ['14.2.85', 'ac_state', 'climate', 'climate'],
-        ['14.8.85', None, 'mode', None],
-        ['14.9.85', None, 'target_temperature', None],
-        ['14.10.85', None, 'fan_mode', None],
-    ]
-}, {
-    'lumi.airrtc.vrfegl01': ["Xiaomi", "VRF Air Conditioning"],
-    'aqara.airrtc.ecn001': ["Aqara", "VRF Air Conditioning T1"],
-    'params': [
-        ['13.1.85', None, 'channels', 'sensor'],
-        ['4.1.85', 'ac_state', 'climate 1', 'climate'],
-        ['4.2.85', 'ac_state', 'climate 2', 'climate'],
-    ]
-}, {
-    # button rotation
-    'lumi.remote.rkba01': ["Aqara", "Smart Knob H1", "ZNXNKG02LM"],  # @miniknife88
-    'lumi.switch.agl001': ["Aqara", "Dimming knob H1 EU (No Neutral version)", ""],
-    'lumi.switch.agl002': ["Aqara", "Dimming knob H1 EU (With Neutral version)", ""],
-    'lumi.switch.acn052': ["Aqara", "Smart switch (Wheel Version)", "ZNXNKG34LM"],
-    'params': [
-        ['1.16.85', 'slee_time', 'slee_time', None],
-        ['13.1.85', None, 'button', None],
-        ['0.24.85', 'rotate_angle', 'rotate_angle', None],
-        ['0.25.85', 'action_duration', 'action_time', None],
-        ['0.29.85', 'rotate_angle', 'rotate_angle', None],  # while hold
-        ['0.30.85', 'action_duration', 'rotate_angle', None],  # while hold
-        [None, None, 'switch', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor']
-    ]
-}, {
-    # button switch with rotation
-    'lumi.switch.rkna01': ["Aqara", "Smart Knob Switch H1", "ZNXNKG01LM"],  # @miniknife88
-    'lumi.switch.acn053': ["Aqara", "Smart Knob Panel", "ZNXNKG35LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['13.1.85', None, 'button', None],
-        ['0.24.85', 'rotate_angle', 'rotate_angle', None],
-        ['0.25.85', 'action_duration', 'action_time', None],
-        ['0.29.85', 'rotate_angle', 'rotate_angle', None],  # while hold
-        ['0.30.85', 'action_duration', 'rotate_angle', None],  # while hold
-        ['1.16.85', 'slee_time', 'slee_time', None],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        [None, None, 'switch', 'binary_sensor'],
-        ['13.8.85', None, 'mode', None],
-        ['14.6.85', None, 'sensitivity', None],
-        ['14.7.85', 'single_click_control_mode', 'mode', None],
-        ['14.8.85', 'double_click_control_mode', 'mode', None],
-        ['14.9.85', 'long_press_control_mode', 'mode', None],
-    ]
-}, {
-    'lumi.curtain.acn004': ["Aqara", "Curtain Controller X1", "ZNJLBL02LM"],
-    'lumi.curtain.acn007': ["Aqara", "Curtain Controller", "ZNJLBL03LM"],
-    'params': [
-        ['1.1.85', 'curtain_level', 'position', None],
-        ['4.1.85', None, 'motor_stroke', None],
-        ['4.2.85', None, 'polarity', None],
-        ['14.2.85', None, 'mode', None],
-        ['14.3.85', None, 'speed', None],
-        ['14.4.85', 'run_state', 'run_state', None],
-        ['14.8.85', None, 'motor', 'cover'],
-    ]
-}, {
-    'lumi.curtain.acn010': ["Aqara", "Organ™ Smart Curtain Motor C4", "DSKDJ11LM"],
-    'params': [
-        ['0.57.85', 'curtain_ch0_level', 'position', None],
-        ['0.58.85', 'curtain_ch1_level', 'position', None],
-        ['13.4.85', 'run_status', 'run_state', None],
-        ['13.11.85', 'ch0_run_state', 'run_state', None],
-        ['0.21.85', '0.21.85', '0.21.85', None],
-        ['13.14.85', '13.14.85', '13.14.85', None],
-        ['13.15.85', '13.15.85', '13.15.85', None],
-        ['13.21.85', 'ch1_run_state', 'run_state', None],
-        ['13.13.85', None, 'mode', None],
-        ['14.11.85', None, 'ch0_polarity', None],
-        ['14.21.85', None, 'ch1_polarity', None],
-        ['14.35.85', None, 'speed', None],
-        ['1.11.85', None, 'ch0_motor', 'cover'],
-        ['1.21.85', None, 'ch1_motor', 'cover'],
-    ]
-}, {
-    'lumi.curtain.acn011': ["Aqara", "Smart Vertical Blinds Controller H1", "ZNMHLDJ01LM"],
-    'params': [
-        ['0.1.85', None, 'working_time', None],
-        ['1.1.85', None, 'position', None],
-        ['0.55.85', None, 'position', None],
-        ['1.11.85', None, 'tilt_position', None],
-        ['0.56.85', None, 'tilt_position', None],
-        ['4.1.85', None, 'motor_stroke', None],
-        ['4.69.85', None, 'tilt_polarity', None],
-        ['4.70.85', None, 'manual_enable', None],  # 0:enable 1:disable
-        ['4.71.85', None, 'polarity', None],
-        ['14.4.85', None, 'run_state', None],
-        ['14.8.85', None, 'motor', 'cover'],
-        ['14.35.85', None, 'speed', None],
-        ['14.49.85', None, 'tilt_motor', None],  # 0:left 1:right 2:stop
-    ]
-}, {
-    'aqara.tow_w.acn001': ["Aqara", "Towel Warmer H1", "ZNMJJ02LM"],
-    'params': [
-        ['0.1.85', None, 'current_temperature', None],
-        ['4.21.85', None, 'power', None],
-        ['14.92.85', None, 'target_temperature', None],
-        ['14.93.85', None, 'drying_time', 'number'],  # 烘干时长 min
-        [None, None, 'towel_warmer', 'climate'],
-    ]
-#}, {
-#    # cube with rotation
-#    'lumi.remote.cagl01': ["Aqara", "Cube H1", "MFKZQ11LM"],  # @Kris
-#    'lumi.remote.cagl02': ["Aqara", "Cube H1 Pro", "MFKZQ12LM"],  # @Kris
-#    'params': [
-#        ['0.2.85', None, 'duration', None],
-#        ['0.3.85', None, 'angle', None],
-#        ['13.1.85', None, 'action', 'binary_sensor'],
-#        ['8.0.2001', 'battery', 'battery', 'sensor']
-#    ]
-}]
-
-DEVICES_AIOT = [{
-    # with neutral wire
-    'lumi.switch.n1acn1': ["Aqara", "Single Wall Switch H1 Pro", "QBKG30LM"],  # @
-    'lumi.switch.acn020': ["Aqara", "Single Wall Switch H1L", ""],
-    'lumi.switch.acn029': ["Aqara", "Single Wall Switch H1M", "ZNQBKG24LM"],
-    'lumi.switch.b1nacn01': ["Aqara", "Single Wall Switch T1", "QBKG19LM"],
-    'lumi.plug.sacn02': ["Aqara", "Wall Outlet T1", "QBCZ14LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-#    'lumi.switch.b2laus01': ["Aqara", "Double Wall Switch US", "WS-USC02"],
-    'lumi.switch.n2acn1': ["Aqara", "Double Wall Switch H1 Pro", "QBKG31LM"],  # @miniknife88
-    'lumi.switch.acn019': ["Aqara", "Double Wall Switch H1L", ""],
-    'lumi.switch.acn030': ["Aqara", "Double Wall Switch H1M", "ZNQBKG25LM"],
-    'lumi.switch.b2nacn01': ["Aqara", "Double Wall Switch T1", "QBKG20LM"],
-    'lumi.switch.acn045': ["Aqara", "Double Wall Switch J1", ""],
-    'lumi.switch.acn049': ["Aqara", "Two-way Control module T2", "ZNQBKG39LM"],
-    'params': [
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'], # @darkbao
-    ]
-}, {
-    # with neutral wire, thanks @Mantoui
-    'lumi.switch.n3acn1': ["Aqara", "Triple Wall Switch H1 Pro", "QBKG32LM"],  # @Kris
-    'lumi.switch.acn015': ["Aqara", "Triple Wall Switch D1L", ""],
-    'lumi.switch.acn021': ["Aqara", "Triple Wall Switch H1L", ""],
-    'lumi.switch.acn031': ["Aqara", "Triple Wall Switch H1M", "ZNQBKG26LM"],
-    'lumi.switch.b3n01': ["Aqara", "Triple Wall Switch T1", "QBKG34LM"],
-    'lumi.switch.acn046': ["Aqara", "Triple Wall Switch J1", ""],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # triple channel on/off, no neutral wire
-    'lumi.switch.acn039': ["Aqara", "Triple Wall Switch E1", ""],
-    'lumi.switch.acn043': ["Aqara", "Triple Wall Switch J1", ""],
-    'params': [
-        ['4.1.85', 'neutral_0', 'channel 1', 'switch'],
-        ['4.2.85', 'neutral_1', 'channel 2', 'switch'],
-        ['4.3.85', 'neutral_2', 'channel 3', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.acn048': ["Aqara", "Single Wall Switch Z1", "ZNQBKG38LM"], # @justbin95
-    'lumi.switch.acn056': ["Aqara", "Canon Smart Wall Switch Z1 Pro (Single-button Version)", "ZNQBKG42LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.agl004': ["Aqara", "Single Wall Switch H2 US", "WS-K02E"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.4.85', 'channel_0_lock', 'channel 1 Lock', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-#    'lumi.switch.acn047': ["Aqara", "Double Wall Switch Z1", "ZNQBKG37LM"], # @justbin95
-    'lumi.switch.acn047': ["Aqara", "Two-way Control module T2", "LLKZMK12LM"],
-    'lumi.switch.acn057': ["Aqara", "Canon Smart Wall Switch Z1 Pro (Double-button Version)", "ZNQBKG43LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.agl005': ["Aqara", "Double Wall Switch H2 US", "WS-K03E"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.4.85', 'channel_0_lock', 'channel 1 Lock', 'switch'],
-        ['4.5.85', 'channel_1_lock', 'channel 2 Lock', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        ['13.23.85', None, 'button_3', None],
-        ['13.24.85', None, 'button_4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.acn054': ["Aqara", "Triple Wall Switch Z1", "ZNQBKG40LM"], # @justbin95
-    'lumi.switch.acn058': ["Aqara", "Canon Smart Wall Switch Z1 Pro (Triple-button Version)", "ZNQBKG44LM"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        ['13.23.85', None, 'button_3', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.acn059': ["Aqara", "Canon Smart Wall Switch Z1 Pro (Four-button Version)", "ZNQBKG45LM"],
-    'lumi.switch.agl006': ["Aqara", "Smart Wall Switch H2 (Four-button Version)", ""],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.1.85', None, 'button', None],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        ['13.23.85', None, 'button_3', None],
-        ['13.24.85', None, 'button_4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.acn055': ["Aqara", "Four Wall Switch Z1", "ZNQBKG41LM"], # @justbin95
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        ['13.23.85', None, 'button_3', None],
-        ['13.24.85', None, 'button_4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-	# with neutral wire
-    'lumi.switch.acn051': ["Aqara", "Fanxing Smart Switch V1 (Four-button Version)", "CJKG15LM"], # @justbin95
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.21.85', None, 'button_1', None],
-        ['13.22.85', None, 'button_2', None],
-        ['13.23.85', None, 'button_3', None],
-        ['13.24.85', None, 'button_4', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['3.51.85', None, 'motion', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.n4acn4': ["Aqara", "Scene Panel", "ZNCJMB14LM"],  # @miniknife88
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['1.1.85', None, 'brightness', None],
-        ['1.2.85', None, 'standby_brightness', None],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['4.9.85', None, 'auto_brightness', None],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.4.85', None, 'scenes', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        ['14.6.85', None, 'language', None],
-        ['14.7.85', None, 'prompt_voice', None],
-        ['14.8.85', None, 'screen_saver_styles', None],
-        ['14.9.85', None, 'theme', None],
-        ['14.10.85', None, 'standby_times', None],
-        ['14.11.85', None, 'font_size', None],
-        ['14.12.85', None, 'homepage', None],
-        ['14.13.85', None, 'screen_saver', None],
-        ['14.21.85', None, 'channel_number', None],
-        ['20.4.85', None, 'sync', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b1lc04': ["Aqara", "Single Wall Switch E1", "QBKG38LM"],
-    'lumi.switch.b1laus01': ["Aqara", "Single Wall Switch US", "WS-USC01"],
-    'lumi.switch.l1aeu1': ["Aqara", "Single Wall Switch EU H1", "WS-EUK01"],
-    # with neutral wire, not support power measurement
-    'lumi.switch.b1nc01': ["Aqara", "Single Wall Switch E1", "QBKG40LM"],
-    'lumi.switch.acn041': ["Aqara", "Single Wall Switch J1", ""],  # No Neutral
-    'lumi.switch.acn044': ["Aqara", "Single Wall Switch J1", ""],  # With Neutral
-    'params': [
-        ['4.1.85', 'channel_0', 'switch', 'switch'],  # or neutral_0?
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b2lc04': ["Aqara", "Double Wall Switch E1", "QBKG39LM"],
-    'lumi.switch.b2laus01': ["Aqara", "Double Wall Switch US", "WS-USC02"],
-    'lumi.switch.l2aeu1': ["Aqara", "Double Wall Switch EU H1", "WS-EUK02"],
-    # with neutral wire, not support power measurement
-    'lumi.switch.b2nc01': ["Aqara", "Double Wall Switch E1", "QBKG41LM"],
-    'lumi.switch.acn042': ["Aqara", "Double Wall Switch J1", ""],  # No Neutral
-    'params': [
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b1naus01': ["Aqara", "Single Wall Switch US", "WS-USC03"],
-    'lumi.switch.n1aeu1': ["Aqara", "Single Wall Switch EU H1", "WS-EUK03"],
-    'params': [
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'neutral_0', 'switch', 'switch'],  # or channel_0?
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b2naus01': ["Aqara", "Double Wall Switch US", "WS-USC04"],
-    'lumi.switch.n2aeu1': ["Aqara", "Double Wall Switch EU H1", "WS-EUK04"],
-    'params': [
-        ['0.11.85', 'load_voltage', 'power', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # no N, https://www.aqara.com/en/single_switch_T1_no-neutral.html
-    'lumi.switch.l0agl1': ["Aqara", "Relay T1", "SSM-U02"],
-    'lumi.switch.l0acn1': ["Aqara", "Relay T1", "DLKZMK12LM"],  # @Kris
-    'params': [
-        ['4.1.85', 'switch', 'switch', 'switch'],
-        ['14.5.85', None, 'channel_loading_type', None]
-    ]
-}, {
-    # with N, https://www.aqara.com/en/single_switch_T1_with-neutral.html
-    'lumi.switch.n0agl1': ["Aqara", "Relay T1", "SSM-U01"],
-    'lumi.switch.n0acn1': ["Aqara", "Relay T1", "DLKZMK11LM"],
-    'lumi.switch.n0acn2': ["Aqara", "Relay T1", "DLKZMK11LM"],
-    'lumi.plug.maeu01': ["Aqara", "Plug", "SP-EUC01"],
-    'params': [
-        ['4.1.85', '4.1.85', 'switch', 'switch'],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['0.13.85', None, 'consumption', 'sensor'],
-        # ['5.7', '5.7', 'voltage', 'sensor'],
-    ]
-}, {    # light with brightness and color temp
-    'lumi.light.acn031': ["Aqara", "Ceiling Lamp T1 ", "HCXDD11LM"],
-    'lumi.light.acn032': ["Aqara", "Ceiling Lamp T1 (40W)", "HCXDD12LM"],
-    'params': [
-        ['1.10.85', None, 'present_mode', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['14.1.85', 'light_level', 'brightness', None],
-        ['14.2.85', 'colour_temperature', 'color_temp', None],
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['1.7.85', 'light_level', 'brightness', None],
-        ['1.9.85', 'colour_temperature', 'color_temp', None],
-        ['4.2.85', 'power_status', 'sub light', 'light'],
-    ]
-}, {
-    # light with brightness and color temp
-    'lumi.light.acn033': ["Aqara", "Ceiling Lamp H1", "HXCDD13LM"],
-    'params': [
-        ['1.10.85', None, 'present_mode', None],
-        ['0.12.85', 'load_power', 'power', 'sensor'],
-        ['1.7.85', 'light_level', 'brightness', None],
-        ['1.9.85', 'colour_temperature', 'color_temp', None],
-        ['4.1.85', 'power_status', 'light', 'light'],
-    ]
-}, {
-    'lumi.motion.agl04': ["Aqara", "Precision Motion Sensor", "RTCGQ13LM"],
-    'params': [
-        ['3.1.85', None, 'motion', None],
-        ['14.1.85', None, 'detect_level', None],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['8.0.2115', None, 'detect_interval', None],
-        [None, None, 'motion', 'binary_sensor'],
-    ]
-}, {
-    # button switch, no retain
-    'lumi.remote.b18ac1': ["Aqara", "Single Wall Button H1", "WXKG14LM"],
-    'lumi.remote.acn003': ["Aqara", "Single Wall Button E1", "WXKG16LM"],
-    'lumi.remote.acn007': ["Aqara", "Button E1", "WXKG20LM"],
-    'params': [
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # multi button switch, no retain
-    'lumi.remote.b286acn03': ["Aqara", "Double Wall Button T1", "WXKG04LM"],   # @darkbao
-    'lumi.remote.b28ac1': ["Aqara", "Double Wall Button H1", "WXKG15LM"],
-    'lumi.remote.acn004': ["Aqara", "Double Wall Button E1", "WXKG17LM"],
-    'lumi.remote.acn009': ["Aqara", "Double Wall Button H1M", "WXKG22LM"],
-    'params': [
-        ['4.13.85', None, 'mode', None],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.5.85', None, 'button_both', None],
-        ['13.7.85', None, 'button_both', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.acn040': ["Aqara", "Triple Wall Switch E1", "ZNQBKG31LM"],
-    'params': [
-        ['4.1.85', 'channel_0', 'channel 1', 'switch'],
-        ['4.2.85', 'channel_1', 'channel 2', 'switch'],
-        ['4.3.85', 'channel_2', 'channel 3', 'switch'],
-        ['13.1.85', None, 'button_1', None],
-        ['13.2.85', None, 'button_2', None],
-        ['13.3.85', None, 'button_3', None],
-        ['13.5.85', None, 'button_both_12', None],
-        ['13.6.85', None, 'button_both_13', None],
-        ['13.7.85', None, 'button_both_23', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # door window sensor
-    'lumi.magnet.agl02': ["Aqara", "Door Sensor T1", "MCCGQ12LM"],  # @Kris
-    'lumi.magnet.acn001': ["Aqara", "Door Sensor E1", "MCCGQ14LM"],
-    'params': [
-        ['3.1.85', 'status', 'contact', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # motion sensor with illuminance
-    'lumi.motion.agl02': ["Aqara", "Motion Sensor T1", "RTCGQ12LM"],  # @miniknife88
-    'lumi.motion.acn001': ["Aqara", "Motion Sensor E1", "RTCGQ15LM"],
-    'params': [
-        ['0.3.85', 'lux', 'illuminance_lux', None],
-        ['0.4.85', 'illumination', 'illuminance', 'sensor'],
-        ['3.1.85', None, 'motion', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['8.0.2115', None, 'detect_interval', None],
-    ]
-}, {
-    # button switch, no retain
-    'lumi.remote.b1acn02': ["Aqara", "Button T1", "WXKG13LM"],  # @Kris
-    'params': [
-        ['13.1.85', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # vibration sensor
-    'lumi.vibration.agl01': ["Aqara", "Vibration Sensor T1", "DJT12LM"],  # @Kris
-    'params': [
-        ['0.1.85', None, 'bed_activity', None],
-        ['0.2.85', None, 'tilt_angle', None],
-        ['0.3.85', None, 'vibrate_intensity', None],
-        ['13.3.85', None, 'triple_click', None],
-        ['13.7.85', None, 'vibration', None],
-        ['14.1.85', None, 'vibration_level', None],
-        ['14.2.85', None, 'vibrate_intensity_level', None],
-        ['14.4.85', None, 'report_interval_level', None],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        [None, None, 'action', 'binary_sensor']
-    ]
-}, {
-    'lumi.airmonitor.acn01': ["Aqara", "Smart TVOC Air Quality Monitor", "VOCKQJK11LM"],
-    'params': [
-        ['0.1.85', 'temperature', 'temperature', 'sensor'],
-        ['0.2.85', 'humidity', 'humidity', 'sensor'],
-        ['0.3.85', 'tvoc', 'tvoc', 'sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['8.0.2041', None, 'identify', None],
-        ['8.0.2175', None, 'level', None],
-        ['13.1.85', 'alarm', 'tvoc_level', 'air_quality'],
-        ['14.1.85', None, 'unit', None],
-    ]
-}, {
-    'lumi.lunar.acn01': ["Aqara", "Smart Sleep Monitor", "ZNSMBL11LM"],
-    'params': [
-        # ['0.8.85', 'heart rate', 'heart_rate', 'sensor'],  # not implement
-        # ['0.9.85', 'breath rate', 'breath_rate', 'sensor'],  # not implement
-        # ['0.10.85', 'body movements', 'body_movements', 'sensor'],  # not implement
-        ['14.35.85', None, 'mode', 'sensor'],
-    ]
-}, {
-    'lumi.curtain.acn002': ["Aqara", "Roller Shade E1", "ZNJLBL01LM"],
-    'lumi.curtain.acn003': ["Aqara", "Curtain Driver E1", "ZNJLBL01LM"],
-    'lumi.curtain.agl001': ["Aqara", "Curtain Driver E1", "ZNJLBL01LM"],
-    'params': [
-        ['0.1.85', None, 'working_time', None],
-        ['1.1.85', 'curtain_level', 'position', None],
-        ['0.55.85', None, 'position', None],
-        ['4.1.85', None, 'motor_stroke', None],
-        ['4.2.85', None, 'polarity', None],
-        ['13.1.85', None, 'charging_status', None],
-        ['14.2.85', None, 'mode', None],
-        ['14.3.85', None, 'speed', None],
-        ['14.4.85', 'run_state', 'run_state', None],
-        ['14.8.85', None, 'motor', 'cover'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-        ['8.0.2041', None, 'model', None],
-        ['13.10.85', None, 'model', None]
-    ]
-}, {
-    # water leak sensor
-    'lumi.flood.acn001': ["Aqara", "Water Leak Sensor E1", "SJCGQ13LM"],
-    'params': [
-        ['3.1.85', 'alarm', 'moisture', 'binary_sensor'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.airrtc.agl001': ["Aqara", "Smart Radiator Thermostat E1", ""],
-    'params': [
-        ['0.1.85', 'temperature', 'temperature', 'sensor'],
-        ['1.8.85', None, 'target_temperature', None],
-        ['14.51.85', None, 'mode', None],
-        ['4.21.85', 'switch', 'switch', 'switch'],
-        ['4.25.85', 'check_switch', 'check_switch', 'switch'],
-        ['4.26.85', 'child_lock_switch', 'child_lock_switch', 'switch'],
-        ['8.0.2001', 'battery', 'battery', 'sensor']
-    ]
-}, {
-    'lumi.airer.acn001': ["Aqara", "Smart Clothes Drying Rack H1", "ZNLYJ13LM"],
-    'params': [
-        ['1.7.85', 'light_level', 'brightness', None],
-        ['1.9.85', 'colour_temperature', 'color_temp', None],
-        ['4.21.85', 'power_status', 'light', 'light'],
-        ['4.22.85', 'disinfect', 'disinfect_switch', 'switch'],
-        ['4.66.85', 'hot_drying', 'hot_drying_switch', 'switch'],
-        ['4.67.85', 'drying', 'drying_switch', 'switch'],
-        ['3.1.85', None, 'occupancy', 'binary_sensor'],
-        ['1.1.85', None, 'position', None],
-        ['14.1.85', None, 'motor', 'cover'],  # 0: stop, 1: up, 2: down
-    ]
-}, {
-    'aqara.feeder.acn001': ["Aqara", "Smart Feeder C1", "ZNCWWSQ01LM"],
-    'params': [
-        ['4.21.85', 'feed', 'feed_switch', 'switch'],
-        ['4.22.85', 'child_lock_switch', 'child_lock_switch', 'switch'],
-        ['4.23.85', 'light', 'light_switch', 'switch'],
-        ['4.24.85', 'auto_feed', 'auto_feed_switch', 'switch'],
-        ['13.104.85', 'portion', 'portion', 'sensor']
-    ]
-}, {
-    'lumi.bhf_light.acn001': ["Aqara", "Smart Yuba T1", "ZNYB01LM"],
-    'params': [
-        ['1.7.85', 'light_level', 'brightness', None],
-        ['1.9.85', 'colour_temperature', 'color_temp', None],
-        ['4.1.85', 'power_status', 'light', 'light'],
-        ['4.21.85', 'power_status', 'power', None],
-        ['0.1.85', None, 'current_temperature', None],
-        ['1.8.85', None, 'target_temperature', None],
-        ['14.35.85', None, 'fan_mode', None],
-        ['14.47.85', None, 'swing_mode', None],
-        ['14.51.85', None, 'mode', None],
-        [None, 'yuba', 'yuba', 'climate'],
-    ]
-}, {
-    'aqara.airrtc.acn02': ["Aqara", "Air Conditioning T1", ""],
-    'params': [
-        ['0.1.85', None, 'current_temperature', None],
-        ['1.1.85', None, 'target_temperature', None],
-        ['3.1.85', None, 'online', None],
-        ['4.1.85', 'power_status', 'power', None],
-        ['13.2.85', None, 'address', None],
-        ['14.1.85', None, 'fan_mode', None],
-#        ['14.39.85', None, 'fan_mode', None],
-        ['14.140.85', None, 'mode', None],
-        [None, 'ac_state', 'climate', 'climate'],
-    ]
-}, {
-    'aqara.toilet.acn002': ["Aqara", "Smart Toilet T1", "ZNTL01LM"],
-    'params': [
-        ['4.1.85', 'ctrl_ch0_status', 'power', 'switch'],
-        ['4.2.85', 'ctrl_ch1_status', 'pee', 'switch'],
-        ['4.7.85', 'switch_nostatus', 'flush', 'switch'],
-        ['4.22.85', 'ctrl_ch22_status', 'automatic flip cover', 'switch'],
-        ['4.23.85', 'ctrl_ch23_status', 'automatic close cover', 'switch'],
-        ['4.39.85', 'set_direction', 'clean direction', 'select'],
-        ['4.50.85', 'set_device_mode5', 'water temperature', 'select'],
-        ['4.51.85', 'set_device_mode6', 'wash level', 'select'],
-        ['4.53.85', 'set_device_mode8', 'warn dry', 'select'],
-    ]
-}, {
-    'aqara.bed.hhcn03': ["Aqara", "Smart Bed W1", "ZNBD01LM"],
-    'params': [
-        ['4.7.85', 'switch_nostatus', 'stop', 'switch'],
-        ['4.20.85', 'set_lock', 'child lock', 'switch'],
-        ['4.23.85', 'set_mode', 'massage', 'switch'],
-        ['4.31.85', 'bool_switch_first', 'back and leg', 'switch'],
-    ]
-}, {
-    'aqara.vent.eicn01': ["Aqara", "Ventilation Mechanical Controllor", ""],
-    'params': [
-        ['4.1.85', 'power_status', 'power', None],
-        ['14.39.85', None, 'fan_mode', None],
-        [None, 'fan', 'fan', 'fan'],
-    ]
-}, {
-    'lumi.valve.agl001': ["Aqara", "Valve Controller T1", "VC-X01D"],
-    'params': [
-        ['4.1.85', 'power_status', 'switch', 'switch'],
-        ['8.0.2001', 'battery', 'battery', 'sensor'],
-    ]
-}]
-
-# params: [lumi res name, xiaomi prop name, hass attr name, hass domain]
-DEVICES_MIOT = [{
-    # with neutral wire
-    'lumi.switch.n1acn1': ["Aqara", "Single Wall Switch H1 Pro", "QBKG30LM"],  # @Kris
-    'mi_spec': [
-        ['2.1', 'channel_0', 'channel 1', 'switch'],
-        ['4.1', None, 'consumption', None],
-        ['4.2', 'load_power', 'power', 'sensor'],
-        ['8.1', None, 'button_1: 1', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire,
-#    'lumi.switch.b2laus01': ["Aqara", "Double Wall Switch US", "WS-USC02"],
-    'lumi.switch.n2acn1': ["Aqara", "Double Wall Switch H1 Pro", "QBKG31LM"],
-    'mi_spec': [
-        ['2.1', 'channel_0', 'channel 1', 'switch'],
-        ['3.1', 'channel_1', 'channel 2', 'switch'],
-        ['4.1', None, 'consumption', None],
-        ['4.2', 'load_power', 'power', 'sensor'],
-        ['8.1', None, 'button_1: 1', None],
-        ['8.2', None, 'button_1: 2', None],
-        ['9.1', None, 'button_2: 1', None],
-        ['9.2', None, 'button_2: 2', None],
-        ['10.1', None, 'button_both: 4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.n3acn1': ["Aqara", "Triple Wall Switch H1 Pro", "QBKG32LM"],  # @Kris
-    'mi_spec': [
-        ['2.1', '2.1', 'channel 1', 'switch'],
-        ['3.1', '3.1', 'channel 2', 'switch'],
-        ['4.1', '4.1', 'channel 3', 'switch'],
-        ['5.1', None, 'consumption', None],
-        ['5.2', 'load_power', 'power', 'sensor'],
-        ['9.1', None, 'button_1: 1', None],
-        ['9.2', None, 'button_both: 4', None],
-        ['10.1', None, 'button_2: 1', None],
-        ['10.2', None, 'button_both: 4', None],
-        ['11.1', None, 'button_3: 4', None],
-        ['11.2', None, 'button_both_23: 4', None],
-        ['12.1', None, 'button_both_12: 4', None],
-        ['13.1', None, 'button_both_13: 4', None],
-        ['14.1', None, 'button_both_23: 4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b1lc04': ["Aqara", "Single Wall Switch E1", "QBKG38LM"],
-    'lumi.switch.b1laus01': ["Aqara", "Single Wall Switch US", "WS-USC01"],
-    'lumi.switch.l1aeu1': ["Aqara", "Single Wall Switch EU H1", "WS-EUK01"],
-    # with neutral wire, not support power measurement
-    'lumi.switch.b1nc01': ["Aqara", "Single Wall Switch E1", "QBKG40LM"],
-    'mi_spec': [
-        ['1.2', None, 'model', None],
-        ['1.4', None, 'back_version', None],
-        ['2.1', '2.1', 'switch', 'switch'],
-        ['6.1', None, 'button: 1', None],
-        ['6.2', None, 'button: 2', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b2lc04': ["Aqara", "Double Wall Switch E1", "QBKG39LM"],
-    'lumi.switch.b2laus01': ["Aqara", "Double Wall Switch US", "WS-USC02"],
-    'lumi.switch.l2aeu1': ["Aqara", "Double Wall Switch EU H1", "WS-EUK02"],
-    # with neutral wire, not support power measurement
-    'lumi.switch.b2nc01': ["Aqara", "Double Wall Switch E1", "QBKG41LM"],
-    'mi_spec': [
-        ['2.1', '2.1', 'channel 1', 'switch'],
-        ['3.1', '3.1', 'channel 2', 'switch'],
-        ['7.1', None, 'button_1: 1', None],
-        ['7.2', None, 'button_1: 2', None],
-        ['8.1', None, 'button_2: 1', None],
-        ['8.2', None, 'button_2: 2', None],
-        ['9.1', None, 'button_both: 4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b1naus01': ["Aqara", "Single Wall Switch US", "WS-USC03"],
-    'lumi.switch.n1aeu1': ["Aqara", "Single Wall Switch EU H1", "WS-EUK03"],
-    'mi_spec': [
-        ['2.1', '2.1', 'switch', 'switch'],
-        ['4.1', None, 'consumption', None],
-        ['4.2', 'load_power', 'power', 'sensor'],
-        ['6.1', None, 'button: 1', None],
-        ['6.2', None, 'button: 2', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.switch.b2naus01': ["Aqara", "Double Wall Switch US", "WS-USC04"],
-    'lumi.switch.n2aeu1': ["Aqara", "Double Wall Switch EU H1", "WS-EUK04"],
-    'mi_spec': [
-        ['2.1', '2.1', 'channel 1', 'switch'],
-        ['3.1', '3.1', 'channel 2', 'switch'],
-        ['4.1', None, 'consumption', None],
-        ['4.2', 'load_power', 'power', 'sensor'],
-        ['7.1', None, 'button_1: 1', None],
-        ['7.2', None, 'button_1: 2', None],
-        ['8.1', None, 'button_2: 1', None],
-        ['8.2', None, 'button_2: 2', None],
-        ['9.1', None, 'button_both: 4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # no N, https://www.aqara.com/en/single_switch_T1_no-neutral.html
-    'lumi.switch.l0agl1': ["Aqara", "Relay T1", "SSM-U02"],
-    'lumi.switch.l0acn1': ["Aqara", "Relay T1", "DLKZMK12LM"],  # @Kris
-    'mi_spec': [
-        ['2.1', '2.1', 'switch', 'switch'],
-    ]
-}, {
-    # with N, https://www.aqara.com/en/single_switch_T1_with-neutral.html
-    'lumi.switch.n0agl1': ["Aqara", "Relay T1", "SSM-U01"],
-    'lumi.switch.n0acn1': ["Aqara", "Relay T1", "DLKZMK11LM"],
-    'lumi.switch.n0acn2': ["Aqara", "Relay T1", "DLKZMK11LM"],
-    'lumi.plug.maeu01': ["Aqara", "Plug", "SP-EUC01"],
-    'mi_spec': [
-        ['2.1', '2.1', 'switch', 'switch'],
-        ['3.1', '3.1', 'consumption', 'sensor'],
-        ['3.2', '3.2', 'power', 'sensor'],
-        # ['5.7', '5.7', 'voltage', 'sensor'],
-    ]
-}, {
-    'lumi.motion.agl04': ["Aqara", "Precision Motion Sensor", "RTCGQ13LM"],
-    'mi_spec': [
-        ['2.1', None, 'motion', None],
-        ['4.1', None, 'motion', None],
-        ['6.1', None, 'elapsed_time', None],
-        [None, None, 'motion', 'binary_sensor'],
-        ['3.1', '3.1', 'battery', 'sensor'],
-    ]
-}, {
-    # button switch, no retain
-    'lumi.remote.b18ac1': ["Aqara", "Single Wall Button H1", "WXKG14LM"],
-    'mi_spec': [
-        ['3.1', None, 'button', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['5.1', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # multi button switch, no retain
-    'lumi.remote.b286acn03': ["Aqara", "Double Wall Button T1", "WXKG04LM"],   # @darkbao
-    'lumi.remote.b28ac1': ["Aqara", "Double Wall Button H1", "WXKG15LM"],
-    'mi_spec': [
-        ['3.1', None, 'button_1: 1', None],
-        ['4.1', None, 'button_2: 1', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['5.1', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.remote.acn003': ["Aqara", "Single Wall Button E1", "WXKG16LM"],
-    'mi_spec': [
-        ['2.1', None, 'button: 1', None],  # single
-        ['2.2', None, 'button: 2', None],  # double
-        ['2.3', None, 'button: 16', None],  # long
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.remote.acn007': ["Aqara", "Button E1", "WXKG20LM"],
-    'mi_spec': [
-        ['2.1', None, 'button: 1', None],  # single
-        ['2.2', None, 'button: 2', None],  # double
-        ['2.3', None, 'button: 16', None],  # long
-        ['3.2', '3.2', 'battery', 'sensor'],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    'lumi.remote.acn004': ["Aqara", "Double Wall Button E1", "WXKG17LM"],
-    'mi_spec': [
-        ['2.1', None, 'button_1: 1', None],  # single
-        ['2.2', None, 'button_1: 2', None],  # double
-        ['2.3', None, 'button_1: 16', None],  # long
-        ['7.1', None, 'button_2: 1', None],  # single
-        ['7.2', None, 'button_2: 2', None],  # double
-        ['7.3', None, 'button_2: 16', None],  # long
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-}, {
-    # with neutral wire
-    'lumi.switch.acn040': ["Aqara", "Triple Wall Switch E1", "ZNQBKG31LM"],
-    'mi_spec': [
-        ['2.1', '2.1', 'channel 1', 'switch'],
-        ['3.1', '3.1', 'channel 2', 'switch'],
-        ['4.1', '4.1', 'channel 3', 'switch'],
-        ['9.1', None, 'button_1: 1', None],
-        ['9.2', None, 'button_both: 4', None],
-        ['10.1', None, 'button_2: 1', None],
-        ['10.2', None, 'button_both: 4', None],
-        ['11.1', None, 'button_3: 4', None],
-        ['11.2', None, 'button_both_23: 4', None],
-        ['12.1', None, 'button_both_12: 4', None],
-        ['13.1', None, 'button_both_13: 4', None],
-        ['14.1', None, 'button_both_23: 4', None],
-        [None, None, 'switch', 'binary_sensor'],
-    ]
-},{
-    # door window sensor
-    'lumi.magnet.agl02': ["Aqara", "Door Sensor T1", "MCCGQ12LM"],  # @Kris
-    'mi_spec': [
-        ['2.1', 'status', 'contact', 'binary_sensor'],
-        ['3.2', '3.2', 'voltage', None],
-        ['5.1', None, 'elapsed_time', None],
-        ['6.1', 'battery', 'battery', 'sensor'],
-    ]
-},{
-    # door window sensor
-    'lumi.magnet.acn001': ["Aqara", "Door Sensor E1", "MCCGQ14LM"],
-    'mi_spec': [
-        ['2.1', 'status', 'contact', 'binary_sensor'],
-        ['3.2', 'voltage', 'battery', 'sensor']
-    ]
-}, {
-    # motion sensor with illuminance
-    'lumi.motion.agl02': ["Aqara", "Motion Sensor T1", "RTCGQ12LM"],  # @miniknife88
-    'mi_spec': [
-        ['1.4', None, 'back_version', None],
-        ['2.1', 'lux', 'illuminance_lux', None],
-        ['3.1', 'illumination', 'illuminance', 'sensor'],
-        ['4.1', None, 'motion', 'binary_sensor'],
-        ['5.1', 'battery', 'battery', 'sensor'],
-        ['6.1', None, 'elapsed_time', None],
-    ]
-}, {
-    # button switch, no retain
-    'lumi.remote.b1acn02': ["Aqara", "Button T1", "WXKG13LM"],  # @Kris
-    'mi_spec': [
-        ['2.1', None, 'load_voltage', None],
-        ['3.1', None, 'button: 1', None],
-        ['3.2', None, 'button: 2', None],
-        ['3.3', None, 'button: 16', None],
-        [None, None, 'switch', 'binary_sensor'],
-        ['5.1', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    # vibration sensor
-    'lumi.vibration.agl01': ["Aqara", "Vibration Sensor T1", "DJT12LM"],  # @Kris
-    'mi_spec': [
-        ['3.2', None, 'load_voltage', None],
-        ['6.2', None, 'vibration', None],
-        ['5.1', 'battery', 'battery', 'sensor'],
-        [None, None, 'action', 'binary_sensor']
-    ]
-# latest firmwares remove the support on TVOC Monitor
-#}, {
-#    'lumi.airmonitor.acn01': ["Aqara", "Smart TVOC Air Quality Monitor", "VOCKQJK11LM"],
-#    'mi_spec': [
-#        ['3.1', '3.1', 'temperature', 'sensor'],
-#        ['3.2', '3.2', 'humidity', 'sensor'],
-#        ['3.3', '3.3', 'tvoc', 'sensor'],
-#        ['4.1', '4.1', 'tvoc_level', 'air_quality'],
-#        ['4.2', '4.2', 'battery', 'sensor'],
-#    ]
-}, {
-    'lumi.curtain.acn002': ["Aqara", "Roller Shade E1", "ZNJLBL01LM"],
-    'lumi.curtain.acn003': ["Aqara", "Roller Shade E1", "ZNJLBL01LM"],
-    'lumi.curtain.agl001': ["Aqara", "Roller Shade E1", "ZNJLBL01LM"],
-    'mi_spec': [
-        ['1.4', '1.4', 'fw_ver', None],
-        ['2.1', '2.1', 'fault', None],
-        ['2.2', '2.2', 'motor', 'cover'],
-        ['2.3', '2.3', 'mode', None],
-        ['2.4', '2.4', 'position', None],
-        ['2.5', '2.5', 'current_position', None],
-        ['2.6', '2.6', 'run_state', None],
-        ['2.7', '2.7', 'polarity', None],
-        ['3.1', '3.1', 'status_low_energy', None],
-        ['3.2', '3.2', 'voltage', None],
-        ['3.3', '3.3', 'charging_status', None],
-        ['3.4', '3.4', 'battery', 'sensor'],
-        ['5.1', '5.1', 'motor_stroke', None],
-        ['5.2', '5.2', 'working_time', None],
-        ['5.5', '5.5', 'speed', None],
-        ['6.1', '6.1', 'unpair', None],
-    ]
-}, {
-    # water leak sensor
-    'lumi.flood.acn001': ["Aqara", "Water Leak Sensor E1", "SJCGQ13LM"],
-    'mi_spec': [
-        ['2.1', 'alarm', 'moisture', 'binary_sensor'],
-        ['6.1', 'battery', 'battery', 'sensor'],
-    ]
-}, {
-    'lumi.airrtc.agl001': ["Aqara", "Smart Radiator Thermostat E1", ""],
-    'mi_spec': [
-        ['2.4', '2.4', 'mode', None],
-        ['2.5', '2.5', 'target_temperature', None],
-        ['2.1', '2.1', 'switch', 'switch'],
-        ['2.7', 'temperature', 'temperature', 'sensor'],
-    ]
-},{
-    # light with brightness and color temp
-    'lumi.light.acn003': ["Aqara", "L1-350 Ceiling Light", "ZNXDD01LM"],
-    'mi_spec': [
-        ['2.1', 'power_status', 'light', 'light'],
-        ['2.2', 'light_level', 'brightness', None],
-        ['2.3', 'colour_temperature', 'color_temp', None],
-    ]
-}]
-
-GLOBAL_PROP = {
-    # lumi miot
-    '5.1': 'en_night_tip_light',
-    '5.2': 'overturn_light',
-    '5.3': 'config_time_period',
-    '6.1': 'poweroff_memory',
-    '7.1': 'temperature_alarm',
-    # lumi miio
-    '0.11.85': 'load_voltage',
-    '0.12.85': 'load_power',
-    '0.13.85': 'consumption',
-    '0.14.85': 'load_current',
-    '4.10.85': 'channel_1_decoupled',
-    '4.11.85': 'channel_2_decoupled',
-    '4.12.85': 'channel_3_decoupled',
-    '8.0.2001': 'battery',  # battery voltage
-    '8.0.2002': 'reset_cnt',
-    '8.0.2003': 'send_all_cnt',
-    '8.0.2004': 'send_fail_cnt',
-    '8.0.2005': 'send_retry_cnt',
-    '8.0.2006': 'chip_temperature',
-    '8.0.2007': 'lqi',
-    '8.0.2008': 'voltage',
-    '8.0.2009': 'pv_state',
-    '8.0.2010': 'cur_state',
-    '8.0.2011': 'pre_state',
-    '8.0.2012': 'power_tx',
-    '8.0.2013': 'CCA',  # clear channel assessment
-    '8.0.2014': 'protect',
-    '8.0.2015': 'power',
-    '8.0.2016': 'list',
-    '8.0.2021': 'report',
-    '8.0.2022': 'fw_ver',
-    '8.0.2023': 'hw_ver',
-    '8.0.2026': 'wifi_rssi',
-    '8.0.2030': 'poweroff_memory',
-    '8.0.2031': 'charge_protect',
-    '8.0.2032': 'en_night_tip_light',
-    '8.0.2033': '8.0.2033',
-    '8.0.2034': 'load_s0',  # ctrl_dualchn
-    '8.0.2035': 'load_s1',  # ctrl_dualchn
-    '8.0.2036': 'parent',
-    '8.0.2037': '8.0.2037',  # remote
-    '8.0.2038': '8.0.2038',  # remote
-    '8.0.2039': '8.0.2039',  # remote
-    '8.0.2040': '8.0.2040',  # remote
-    '8.0.2041': 'model',  # identify
-    '8.0.2042': 'max_power',
-    '8.0.2044': 'plug_detection',
-    '8.0.2080': 'zgb_ver',
-    '8.0.2082': 'removed_did',
-    '8.0.2084': 'added_device',
-    '8.1.2087': '8.1.2087',
-    '8.1.2088': '8.1.2088',
-    '8.0.2090': '8.0.2090',
-    '8.0.2089': 'dfu',
-    '8.0.2091': 'dfu_status',
-    '8.0.2101': 'nl_invert',  # ctrl_86plug
-    '8.0.2102': 'alive',
-    '8.0.2109': 'paring',
-    '8.0.2111': 'pair_command',
-    '8.0.2114': 'led_inverted',
-    '8.0.2151': 'zigbee_pa',
-    '8.0.2156': '8.0.2156',
-    '8.0.2158': 'prevent_delete',
-    '8.0.2162': 'channel_1_loading_type',
-    '8.0.2164': 'channel_1_pulse_interval',
-    '8.0.2171': '8.0.2171',
-    '8.0.2173': '8.0.2173',
-    '8.0.2174': '8.0.2174',
-    '8.0.2175': '8.0.2175',
-    '8.0.2223': 'back_version',
-    '8.0.2215': '8.0.2215',
-    '8.0.2228': '8.0.2228',
-    '8.0.2229': '8.0.2229',
-    '8.0.2230': 'manufacturer_id',
-    '8.0.2231': '8.0.2231',
-    '8.0.9001': 'battery_end_of_life',
-    '8.1.2162': 'channel_2_loading_type',
-    '8.1.2164': 'channel_2_pulse_interval',
-    '8.1.2222': '8.1.2222',
-    '8.2.2162': 'channel_3_loading_type',
-    '8.2.2164': 'channel_3_pulse_interval',
-    '20.4.85': 'control',
-    '200.1.11': '200.1.11',
-    '200.1.12': '200.1.12'
-}
-
-CLUSTERS = {
-    0x0000: 'Basic',
-    0x0001: 'PowerCfg',
-    0x0003: 'Identify',
-    0x0006: 'OnOff',
-    0x0008: 'LevelCtrl',
-    0x000A: 'Time',
-    0x000C: 'AnalogInput',  # cube, gas sensor
-    0x0012: 'Multistate',
-    0x0019: 'OTA',  # illuminance sensor
-    0x0101: 'DoorLock',
-    0x0400: 'Illuminance',  # motion sensor
-    0x0402: 'Temperature',
-    0x0403: 'Pressure',
-    0x0405: 'Humidity',
-    0x0406: 'Occupancy',  # motion sensor
-    0x0500: 'IasZone',  # gas sensor
-    0x0B04: 'ElectrMeasur',
-    0xFCC0: 'Xiaomi'
-}
-
-
 TITLE = "Aqara Gateway Debug"
 NOTIFY_TEXT = '<a href="%s?r=10" target="_blank">Open Log<a>'
 HTML = (f'<!DOCTYPE html><html><head><title>{TITLE}</title>'
@@ -1989,36 +41,163 @@ HTML = (f'<!DOCTYPE html><html><head><title>{TITLE}</title>'
         '<body><pre>%s</pre></body></html>')
 
 
+# core.devices, imported on first use so loading a platform stays cheap
+_CATALOG = None
+
+# zigbee model -> SUPPORT_* flags, filled when the catalog is loaded
+_FEATURES: dict[str, int] = {}
+
+# normalized zigbee model -> device descriptor, one index per cloud flavour
+_DEVICE_INDEX: dict[str, dict[str, dict]] = {}
+
+
+def _normalize_model(zigbee_model: str) -> str:
+    """ strip the `.vN` tail the gateway appends to a model when added """
+    if zigbee_model[-3:-1] == '.v' and zigbee_model[-1:].isdigit():
+        return zigbee_model[:-3]
+    return zigbee_model
+
+
+# id(params table) -> compiled lookup tables, shared by every model using it
+_COMPILED_PARAMS: dict[int, tuple] = {}
+
+
+def _compile_params(params: list) -> tuple:
+    """ compile a catalog params/mi_spec table, cached by table """
+    compiled = _COMPILED_PARAMS.get(id(params))
+    if compiled is None:
+        compiled = _COMPILED_PARAMS[id(params)] = _build_param_tables(params)
+    return compiled
+
+
+def _build_param_tables(params: list) -> tuple:
+    """ compile a params/mi_spec table into read-only lookup tables:
+    lumi id -> hass attr, hass attr -> lumi id, hass attr -> (siid, piid)
+    """
+    prop_attrs = {}
+    attr_props = {}
+    attr_specs = {}
+    for param in params:
+        prop, attr = param[0], param[2]
+        # keep the first match, as the old next() scans did
+        if prop is not None:
+            prop_attrs.setdefault(prop, attr)
+        attr_props.setdefault(attr, prop)
+        if prop is not None and attr not in attr_specs:
+            siid, _, piid = prop.partition('.')
+            if siid.isdigit() and piid.isdigit():
+                attr_specs[attr] = (int(siid), int(piid))
+    return (
+        MappingProxyType(prop_attrs),
+        MappingProxyType(attr_props),
+        MappingProxyType(attr_specs)
+    )
+
+
+def _build_device_index(catalog, cloud: str) -> dict[str, dict]:
+    """ build the model -> descriptor index for one cloud flavour """
+    devices = catalog.DEVICES + (
+        catalog.DEVICES_AIOT if cloud == 'aiot' else catalog.DEVICES_MIOT)
+    index = {}
+    for device in devices:
+        params = device.get('params', '')
+        mi_spec = device.get('mi_spec', '')
+        prop_attrs, attr_props, attr_specs = _compile_params(
+            params or mi_spec)
+        for model, desc in device.items():
+            # the first table that lists a model wins, as with a linear scan
+            if model in ('params', 'mi_spec') or model in index:
+                continue
+            index[model] = {
+                # 'model': model,
+                'device_manufacturer': desc[0],
+                'device_name': desc[0] + ' ' + desc[1],
+                'device_model': model + ' ' + desc[2]
+                if len(desc) > 2 else model,
+                'params': params,
+                'mi_spec': mi_spec,
+                'prop_attrs': prop_attrs,
+                'attr_props': attr_props,
+                'attr_specs': attr_specs
+            }
+    return index
+
+
+def _build_feature_index(catalog) -> dict[str, int]:
+    """ build the model -> SUPPORT_* flags table """
+    features = {}
+    for device in catalog.DEVICES + catalog.DEVICES_AIOT:
+        flags = 0
+        for param in device.get('params', ''):
+            if 'consumption' in param:
+                flags |= SUPPORT_POWER_CONSUMPTION
+            if 'load_voltage' in param:
+                flags |= SUPPORT_LOAD_VOLTAGE
+            if 'load_power' in param:
+                flags |= SUPPORT_LOAD_POWER
+        for model in device:
+            if model not in ('params', 'mi_spec'):
+                features[model] = features.get(model, 0) | flags
+    for model in IN_USE_MODELS:
+        features[model] = features.get(model, 0) | SUPPORT_IN_USE
+    return features
+
+
+class OptionMap(NamedTuple):
+    """ read-only maps of an enumerated property """
+    values: Mapping  # option -> value
+    labels: Mapping  # value -> option, the first option wins
+
+
+def _option_map(values: dict) -> OptionMap:
+    labels = {}
+    for option, value in values.items():
+        labels.setdefault(value, option)
+    return OptionMap(MappingProxyType(dict(values)), MappingProxyType(labels))
+
+
+_OPTION_MAPS = {
+    key: _option_map(values) for key, values in ENUM_OPTIONS.items()
+}
+_DEFAULT_OPTION_MAP = _option_map(DEFAULT_ENUM_OPTIONS)
+
+
 class Utils:
     """ gateway utils """
     @staticmethod
-    def get_device(zigbee_model: str, cloud: str) -> Optional[dict]:
-        """ get device """
-        # the model has an extra tail when added
-        if re.match(r'\.v(\d)', zigbee_model[-3:]):
-            zigbee_model = zigbee_model[:-3]
+    def load_catalog():
+        """ import the device catalog on first use and keep it cached """
+        # the first call reads the module from disk, so from the event
+        # loop it should go through the executor
+        global _CATALOG  # pylint: disable=global-statement
+        if _CATALOG is None:
+            # pylint: disable=import-outside-toplevel
+            from . import devices
+            _FEATURES.update(_build_feature_index(devices))
+            # the cloud of an entry is only known after discovery
+            for cloud in ('aiot', 'miot'):
+                _DEVICE_INDEX[cloud] = _build_device_index(devices, cloud)
+            _CATALOG = devices
+        return _CATALOG
 
-        devices = []
-        devices.extend(DEVICES)
-        if cloud and cloud == "aiot":
-            devices.extend(DEVICES_AIOT)
-        else:
-            devices.extend(DEVICES_MIOT)
+    @staticmethod
+    def get_global_prop() -> dict:
+        """ return the lumi id -> name table shared by all devices """
+        return Utils.load_catalog().GLOBAL_PROP
 
-        for device in devices:
-            if zigbee_model in device:
-                desc = device[zigbee_model]
-                return {
-                    # 'model': zigbee_model,
-                    'device_manufacturer': desc[0],
-                    'device_name': desc[0] + ' ' + desc[1],
-                    'device_model': zigbee_model + ' ' + desc[2]
-                    if len(desc) > 2 else zigbee_model,
-                    'params': device.get('params', ''),
-                    'mi_spec': device.get('mi_spec', '')
-                }
+    @staticmethod
+    def get_device(zigbee_model: str, cloud: str) -> Optional[dict]:
+        """ get device, the returned descriptor is shared and read-only """
+        cloud = 'aiot' if cloud == 'aiot' else 'miot'
+        if not _DEVICE_INDEX:
+            Utils.load_catalog()
+        return _DEVICE_INDEX[cloud].get(_normalize_model(zigbee_model))
 
-        return None
+    @staticmethod
+    def get_param_tables(params: list) -> tuple:
+        """ lookup tables of a params/mi_spec table from user config """
+        # not cached: config tables come and go with the config entry
+        return _build_param_tables(params)
 
     @staticmethod
     def remove_device(hass: HomeAssistant, did: str):
@@ -2034,67 +213,17 @@ class Utils:
             registry.async_remove_device(device.id)
 
     @staticmethod
-    def get_feature_suppported(zigbee_model: str) -> Optional[bool]:
-        """ return the switch switch power consumption"""
-        feature = {
-            'is_metric': False,
-            'support_power_consumption': False,
-            'support_in_use': False,
-            'support_load_voltage': False,
-            'support_load_power': False,
-            }
-
-        devices = []
-        devices.extend(DEVICES)
-        devices.extend(DEVICES_AIOT)
-
-        for device in devices:
-            if zigbee_model in device:
-                params = device.get('params', '')
-                for param in params:
-                    if 'consumption' in param:
-                        feature['support_power_consumption'] = True
-                    if 'load_voltage' in param:
-                        feature['support_load_voltage'] = True
-                    if 'load_power' in param:
-                        feature['support_load_power'] = True
-        if zigbee_model in (
-            'lumi.plug',
-            'lumi.plug.mitw01',
-            'lumi.plug.mmeu01',
-            'lumi.plug.maus01',
-            'lumi.ctrl_86plug',
-            'lumi.ctrl_86plug.aq1'
-        ):
-            feature['support_in_use'] = True
-        return feature
+    def get_feature_suppported(zigbee_model: str) -> int:
+        """ return the feature flags of the model, see SUPPORT_* """
+        Utils.load_catalog()
+        return _FEATURES.get(zigbee_model, 0)
 
     @staticmethod
-    def get_select_options(zigbee_model: str, attr: str) -> Optional[dict]:
-        if zigbee_model in ['lumi.bhf_light.acn001']:
-            if attr == 'fan_mode':
-                return {"Low": 0, "Middle": 1, "High": 2}
-            if attr == 'swing_mode':
-                return {"Enable": 0, "Disable": 1}
-            if attr == 'operating_mode':
-                return {"Warm": 0, "Dry": 3, "Fan": 4, "Exhaust": 5}
-        if zigbee_model in ['lumi.motion.ac01']:
-            if attr == 'monitoring_mode':
-                return {"Undirected": 0, "Left and right": 1}
-            if attr == 'approaching_distance':
-                return {"Near": 0, "Middle": 1, "Far": 2}
-            if attr == 'reverted_mode':
-                return {"Disable": 0, "Enable": 1}
-        if zigbee_model in ['aqara.toilet.acn002']:
-            if attr == 'clean direction':
-                return {"Off": 0, "Auto": 1, "Manual": 1}
-            if attr == 'water temperature':
-                return {"Normal": 0, "31°C": 1, "33°C": 2, "35°C": 3, "37°C": 4, "39°C": 5}
-            if attr == 'wash level':
-                return {"Weak": 0, "Middle Weak": 1, "Middle": 2, "Middle Strong": 3, "Strong": 4}
-            if attr == 'warn dry':
-                return {"Off": 0, "Normal": 1, "Low": 2, "Middle Low": 3, "Middle": 4, "Middle High": 5, "High": 6}
-        return {"Off": 0, "On": 1}
+    def get_option_map(zigbee_model: Optional[str], attr: str) -> OptionMap:
+        """ return the option maps of an enumerated property, on/off if the
+        property is not listed in ENUM_OPTIONS
+        """
+        return _OPTION_MAPS.get((zigbee_model, attr), _DEFAULT_OPTION_MAP)
 
     @staticmethod
     def gateway_illuminance_supported(model: str) -> Optional[bool]:
@@ -2135,8 +264,9 @@ class Utils:
     @staticmethod
     def get_device_name(model: str) -> Optional[str]:
         """ return the device name """
-        if model in DEVICES[0]:
-            return DEVICES[0][model][1].lower()
+        gateways = Utils.load_catalog().DEVICES[0]
+        if model in gateways:
+            return gateways[model][1].lower()
         return ''
 
     @staticmethod
@@ -40,6 +40,7 @@ async def async_setup_entry(
                 async_add_entities([XiaomiGenericCover(gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('cover', setup)
 
 
@@ -69,7 +70,7 @@ class XiaomiGenericCover(GatewayGenericDevice, CoverEntity, RestoreEntity):
             value = data[ATTR_RUN_STATE]
             self._attr_is_opening = value == 1
             self._attr_is_closing = value == 0
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
@@ -42,6 +42,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             GatewayFan(gateway, device, attr, feature)
         ])
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('fan', setup)
 
 
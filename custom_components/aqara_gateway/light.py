@@ -42,6 +42,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             async_add_entities([GatewayLight(gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('light', setup)
 
 
@@ -155,9 +156,9 @@ class GatewayLight(GatewayGenericDevice, LightEntity):
                     if len(rgb) > 3:
                         self._attr_brightness = rgb.pop()
                     self._attr_hs_color = color_util.color_RGB_to_hs(*rgb)
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
-    def turn_on(self, **kwargs):
+    async def async_turn_on(self, **kwargs):
         """Turn the light on."""
         payload = {}
 
@@ -198,11 +199,11 @@ class GatewayLight(GatewayGenericDevice, LightEntity):
         try:
             if self.gateway.send(self.device, payload):
                 self._state = True
-                self.schedule_update_ha_state()
+                self.async_write_ha_state()
         except:
             _LOGGER.warn(f"send payload {payload} to gateway failed")
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs):
         """Turn the light off."""
         payload = {}
         if self.device['type'] == 'gateway':
@@ -210,4 +211,4 @@ class GatewayLight(GatewayGenericDevice, LightEntity):
         payload[self._attr] = 0
         if self.gateway.send(self.device, payload):
             self._state = False
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
@@ -16,6 +16,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         async_add_entities([GatewayNumber(gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup("number", setup)
 
 
@@ -39,6 +40,8 @@ ENTITY_DESCRIPTIONS: dict[str, NumberEntityDescription] = {
 
 
 class GatewayNumber(GatewayGenericDevice, RestoreNumber):
+    _update_attrs = ()
+
     def __init__(self, gateway: Gateway, device: dict, attr: str):
         super().__init__(gateway, device, attr)
         self._attr = attr
@@ -18,6 +18,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         async_add_entities([GatewayRemote(hass, gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('remote', setup)
 
 
@@ -84,7 +85,7 @@ class GatewayRemote(GatewayGenericDevice, ToggleEntity):
             persistent_notification.async_create(self.hass, text,
                                                  "Aqara Gateway")
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs):
         """Turn the remote on."""
@@ -18,6 +18,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             GatewaySelect(gateway, device, attr, feature)
         ])
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('select', setup)
 
 
@@ -30,6 +31,8 @@ async def async_unload_entry(hass, entry):
 class GatewaySelect(GatewayGenericDevice, SelectEntity, RestoreEntity):
     """Representation of a Xiaomi/Aqara Select."""
     # pylint: disable=unused-argument, too-many-instance-attributes
+    _update_attrs = ()
+
     def __init__(
         self,
         gateway,
@@ -41,9 +44,9 @@ class GatewaySelect(GatewayGenericDevice, SelectEntity, RestoreEntity):
         self._model = device['model']
         self.feature = feature
         self._attr_current_option = None
-        self._attr_options = []
         self._attr_state = None
-        self._map = {}
+        self._map = Utils.get_option_map(device['model'], attr)
+        self._attr_options = list(self._map.values)
         super().__init__(gateway, device, attr)
 
     @callback
@@ -53,17 +56,13 @@ class GatewaySelect(GatewayGenericDevice, SelectEntity, RestoreEntity):
     async def async_added_to_hass(self) -> None:
         """Restore last state."""
         await super().async_added_to_hass()
-        self._map = Utils.get_select_options(self.device["model"], self._attr)
-        self._attr_options = list(self._map.keys())
 
     def update(self, data: dict = None):
         """update switch."""
-        for key, value in data.items():
-            if key == self._attr:
-                self._attr_current_option = list(
-                    self._map.keys())[list(self._map.values()).index(data[self._attr])]
+        if self._attr in data:
+            self._attr_current_option = self._map.labels.get(data[self._attr])
         self.async_write_ha_state()
 
     async def async_select_option(self, option: str):
         """ set select option"""
-        self.gateway.send(self.device, {self._attr: self._map[option]})
+        self.gateway.send(self.device, {self._attr: self._map.values[option]})
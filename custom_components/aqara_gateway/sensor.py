@@ -88,6 +88,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
             async_add_entities([GatewaySensor(gateway, device, attr)])
 
     aqara_gateway: Gateway = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('sensor', setup)
 
 
@@ -232,6 +233,8 @@ DESCRIPTIONS = {
 class GatewaySensor(GatewayGenericDevice, RestoreSensor):
     """ Xiaomi/Aqara Sensors """
 
+    _update_attrs = (LOAD_POWER,)
+
     def __init__(self, gateway: Gateway, device: dict, attr: str):
         """Initialize the Xiaomi/Aqara Sensors."""
         super().__init__(gateway, device, attr)
@@ -257,6 +260,8 @@ class GatewaySensor(GatewayGenericDevice, RestoreSensor):
 class GatewayGasSensor(GatewaySensor):
     """ Xiaomi/Aqara Gas sensor """
 
+    _update_attrs = ('gas',)
+
     def update(self, data: dict) -> None:
         """update sensor."""
         if 'gas' in data:
@@ -267,6 +272,10 @@ class GatewayGasSensor(GatewaySensor):
 class GatewayLockSensor(GatewaySensor):
     """Representation of a Aqara Lock."""
 
+    _update_attrs = (
+        BATTERY, BACK_VERSION, LI_BATTERY, LI_BATTERY_TEMP, LQI, VOLTAGE,
+        LATCH_STATUS, *LOCK_NOTIFICATION)
+
     def __init__(self, gateway: Gateway, device: dict, attr: str):
         """Initialize the Aqara lock device."""
         super().__init__(gateway, device, attr)
@@ -334,6 +343,9 @@ class GatewayLockSensor(GatewaySensor):
 class GatewayKeyIDSensor(GatewaySensor):
     """Representation of a Aqara Lock Key ID."""
 
+    _event_entity = True
+    _update_attrs = None
+
     def update(self, data: dict) -> None:
         """ update lock state """
         # handle available change
@@ -346,6 +358,9 @@ class GatewayKeyIDSensor(GatewaySensor):
 class GatewayLockEventSensor(GatewaySensor):
     """Representation of a Aqara Lock Event."""
 
+    _event_entity = True
+    _update_attrs = tuple(LOCK_NOTIFICATION)
+
     def update(self, data: dict) -> None:
         """ update lock state """
         # handle available change
@@ -361,6 +376,9 @@ class GatewayLockEventSensor(GatewaySensor):
 class GatewayMoveSensor(GatewaySensor):
     """Representation of a Aqara Moving Sensor."""
 
+    _event_entity = True
+    _update_attrs = None
+
     def update(self, data: dict) -> None:
         """ update move state """
         # handle available change
@@ -370,19 +388,23 @@ class GatewayMoveSensor(GatewaySensor):
 
         if self._attr in data:
             self._attr_native_value = data[self._attr]
-            self.async_write_ha_state()
 
             # repeat event from Aqara integration
             self.hass.bus.async_fire('xiaomi_aqara.click', {
                 'entity_id': self.entity_id, 'click_type': self._state
             })
 
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class GatewayOccupancyRegionSensor(GatewaySensor):
     """Representation of a Aqara Occupancy Region Sensor."""
 
+    _update_attrs = (
+        APPROACHING_DISTANCE, DETECTING_REGION, EXITS_ENTRANCES_REGION,
+        INTERFERENCE_REGION, MONITORING_MODE, REVERTED_MODE, CHIP_TEMPERATURE,
+        LQI)
+
     def __init__(self, gateway: Gateway, device: dict, attr: str) -> None:
         """Initialize the Aqara lock device."""
         super().__init__(gateway, device, attr)
@@ -21,6 +21,7 @@ async def async_setup_entry(
     def setup(gateway: Gateway, device: dict, attr: str):
         async_add_entities([GatewaySwitch(gateway, device, attr)])
     aqara_gateway: Gateway = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities = aqara_gateway.batch_entities(async_add_entities)
     aqara_gateway.add_setup('switch', setup)
 
 
@@ -28,6 +29,7 @@ class GatewaySwitch(GatewayGenericDevice, SwitchEntity, RestoreEntity):
     """Representation of a Xiaomi/Aqara Plug."""
 
     _attr_icon: str | None = "mdi:power-socket"
+    _update_attrs = ()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -4,6 +4,7 @@ from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 
 from .core.const import DOMAIN
+from .core.gateway import Gateway
 
 
 @callback
@@ -29,4 +30,10 @@ async def system_health_info(hass):
     for i in mqtt:
         data["mqtt_connected"] += "{}\n".format(i)
 
+    data["counters"] = ""
+    for gateway in hass.data[DOMAIN].values():
+        if isinstance(gateway, Gateway):
+            data["counters"] += "{}: {}\n".format(gateway.host, ", ".join(
+                f"{k}={v}" for k, v in sorted(gateway.counters.items())))
+
     return data
\ No newline at end of file